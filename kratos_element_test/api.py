@@ -0,0 +1,109 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+"""
+Headless entry point to the element tests, e.g. for scripts, worker pools and
+notebooks. It never imports tkinter or matplotlib, and Kratos is only loaded
+by the first finite element or material point run.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+from kratos_element_test.model.material_input_data_models import (  # noqa: F401
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    Parameter,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (  # noqa: F401
+    CRS,
+    DIRECT_SHEAR,
+    FINITE_ELEMENT,
+    MATERIAL_POINT,
+    TRIAXIAL,
+    CRSSimulationInputs,
+    StrainIncrement,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.progress import SimulationProgress
+from kratos_element_test.model.pipeline.simulation_factory import create_simulation
+from kratos_element_test.model.pipeline.simulation_run import (  # noqa: F401
+    CancellationToken,
+    SimulationCancelled,
+)
+from kratos_element_test.model.run_archive import RunArchive  # noqa: F401
+from kratos_element_test.model.simulation_results import SimulationResults
+
+
+def _quiet_log(msg: str, level: str = "info") -> None:
+    pass
+
+
+def run_test(
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+    execution_mode: str = FINITE_ELEMENT,
+    logger: Optional[Callable[[str, str], None]] = None,
+    progress_callback: Optional[Callable[[SimulationProgress], None]] = None,
+    timeout_in_seconds: Optional[float] = None,
+) -> SimulationResults:
+    """
+    Runs one element test in the current process and returns its results.
+    The messages of the run are passed to `logger`, and are not shown when
+    no logger is given. A run that takes longer than `timeout_in_seconds`
+    raises SimulationCancelled. Invalid test inputs raise a ValueError.
+    """
+    if isinstance(test_inputs, CRSSimulationInputs):
+        test_inputs.update_totals()
+    test_inputs.validate()
+
+    sim = create_simulation(
+        test_inputs=test_inputs,
+        material_inputs=material_inputs,
+        logger=logger or _quiet_log,
+        execution_mode=execution_mode,
+        progress_callback=progress_callback,
+        cancellation=(
+            CancellationToken(timeout_in_seconds) if timeout_in_seconds else None
+        ),
+    )
+    sim.run()
+    return sim.post_process_results()
+
+
+def export_excel(
+    sources: Iterable | Path | str,
+    output: Path,
+    one_workbook_per_run: bool = False,
+    workers: int = 1,
+    progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+) -> List[Path]:
+    """
+    Exports many runs to Excel without any dialogs and returns the paths of
+    the workbooks. The sources are result files, batch or sweep output
+    directories and runs found in a RunArchive. All runs are written to the
+    workbook `output`, or with `one_workbook_per_run` each to its own
+    workbook in the directory `output`, by `workers` processes at a time.
+    A single result file or output directory may be given as `sources` as
+    well. `progress_callback` is called with the number of exported runs and
+    the total number of runs.
+    """
+    # Imported here, so openpyxl is only loaded by the first export
+    from kratos_element_test.model.io.bulk_excel_export import (
+        collect_runs,
+        count_runs,
+        write_workbook,
+        write_workbooks,
+    )
+
+    sources = [sources] if isinstance(sources, (str, Path)) else list(sources)
+    total = count_runs(sources)
+    runs = collect_runs(sources)
+    if one_workbook_per_run:
+        return write_workbooks(runs, output, workers, progress_callback, total)
+    write_workbook(runs, output, progress_callback, total)
+    return [Path(output)]
@@ -3,7 +3,7 @@
 # Contact kratos@deltares.nl
 
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional, Sequence
 
 from kratos_element_test.controller.material_input_controller import (
     MaterialInputController,
@@ -13,12 +13,14 @@ from kratos_element_test.controller.soil_test_input_controller import (
     SoilTestInputController,
 )
 from kratos_element_test.model.main_model import MainModel
-from kratos_element_test.view.result_exporter import (
-    export_excel_by_test_type,
-)
-from kratos_element_test.view.ui_constants import (
-    TEST_NAME_TO_TYPE,
+from kratos_element_test.model.models import TEST_NAME_TO_TYPE
+from kratos_element_test.model.pipeline.simulation_run import SimulationRun
+from kratos_element_test.model.pipeline.triaxial_series_runner import (
+    TriaxialSeriesResult,
 )
+from kratos_element_test.model.pipeline.warm_worker import WarmWorker
+from kratos_element_test.model.result_cache import ResultCache
+from kratos_element_test.model.run_archive import RunArchive
 
 
 class ElementTestController:
@@ -27,7 +29,13 @@ class ElementTestController:
         logger: Callable[[str, str], None],
     ):
         self._logger = logger
-        self._main_model = MainModel(logger)
+        # The worker imports Kratos in the background while the user fills in the inputs
+        self._main_model = MainModel(
+            logger,
+            worker=WarmWorker(logger=logger),
+            result_cache=ResultCache(logger=logger),
+            run_archive=RunArchive(logger=logger),
+        )
 
         self._soil_test_input_controller = SoilTestInputController(
             self._main_model.get_soil_test_input_manager()
@@ -38,14 +46,46 @@ class ElementTestController:
         self._material_input_controller = MaterialInputController(
             self._main_model.get_material_input_manager()
         )
+        self._current_run: Optional[SimulationRun] = None
+
+    def start(
+        self,
+        progress_callback: Optional[Callable] = None,
+        on_finished: Optional[Callable[[SimulationRun], None]] = None,
+    ) -> SimulationRun:
+        """
+        Starts the current test in the background. `on_finished` is called
+        with the run handle when it has completed, failed or was cancelled.
+        """
+        self._current_run = self._main_model.start_simulation(
+            progress_callback, on_finished
+        )
+        return self._current_run
+
+    def cancel(self) -> None:
+        if self._current_run is not None and not self._current_run.done:
+            self._current_run.cancel()
 
-    def run(self) -> bool:
+    def get_timeout_in_seconds(self) -> Optional[float]:
+        return self._main_model.get_timeout_in_seconds()
+
+    def set_timeout_in_seconds(self, timeout_in_seconds: Optional[float]) -> None:
+        self._main_model.set_timeout_in_seconds(timeout_in_seconds)
+
+    def run_triaxial_series(
+        self, cell_pressures: Sequence[float]
+    ) -> Optional[TriaxialSeriesResult]:
         try:
-            self._main_model.run_simulation()
+            series = self._main_model.run_triaxial_series(cell_pressures)
         except Exception as e:
-            self._logger(f"Simulation failed: {e}", "error")
-            return False
-        return True
+            self._logger(f"Triaxial series failed: {e}", "error")
+            return None
+        if not any(results is not None for results in series.results):
+            return None
+        return series
+
+    def shutdown(self) -> None:
+        self._main_model.shutdown()
 
     def get_current_test_type(self) -> str:
         return self._main_model.get_current_test_type()
@@ -55,8 +95,15 @@ class ElementTestController:
         test_type = TEST_NAME_TO_TYPE.get(self._result_controller.get_current_test())
         if not results:
             raise ValueError("No results available for export")
+
+        # Imported here, so openpyxl is only loaded by the first export
+        from kratos_element_test.view.result_exporter import export_excel_by_test_type
+
         export_excel_by_test_type(results, test_type)
 
+    def save_latest_results(self, path: Path) -> Path:
+        return self._main_model.save_latest_results(path)
+
     def import_lab_results(self, py_file: Path) -> None:
         self._main_model.import_lab_results(py_file)
         self._logger(f"Imported lab results from {py_file}", "info")
@@ -1,13 +1,14 @@
 from typing import Dict, List, Optional
 
 from kratos_element_test.model.result_manager import ResultManager
+from kratos_element_test.model.simulation_results import SimulationResults
 
 
 class ResultController:
     def __init__(self, result_manager: ResultManager):
         self._result_manager = result_manager
 
-    def get_latest_results(self) -> Optional[Dict[str, List[float]]]:
+    def get_latest_results(self) -> Optional[SimulationResults]:
         return self._result_manager.get_results_of_active_test_type()
 
     def get_current_test(self) -> str:
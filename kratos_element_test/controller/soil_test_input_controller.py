@@ -1,12 +1,12 @@
 from kratos_element_test.model.models import (
     TriaxialAndShearSimulationInputs,
     CRSSimulationInputs,
-)
-from kratos_element_test.model.soil_test_input_manager import SoilTestInputManager
-from kratos_element_test.view.ui_constants import (
     TRIAXIAL,
     DIRECT_SHEAR,
     CRS,
+)
+from kratos_element_test.model.soil_test_input_manager import SoilTestInputManager
+from kratos_element_test.view.ui_constants import (
     INIT_PRESSURE_LABEL,
     MAX_STRAIN_LABEL,
     NUM_STEPS_LABEL,
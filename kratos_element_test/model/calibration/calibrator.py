@@ -0,0 +1,332 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import copy
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from kratos_element_test.model.calibration.misfit import (
+    CalibrationTarget,
+    weighted_misfit,
+)
+from kratos_element_test.model.calibration.optimizers import (
+    DIFFERENTIAL_EVOLUTION,
+    NELDER_MEAD,
+    OPTIMIZERS,
+    differential_evolution,
+    nelder_mead,
+)
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    FINITE_ELEMENT,
+    TriaxialAndShearSimulationInputs,
+    validate_execution_mode,
+)
+from kratos_element_test.model.pipeline.simulation_pool import SimulationPool
+
+
+class CalibrationFailed(Exception):
+    """
+    Raised when none of the candidates of a calibration could be simulated.
+    """
+
+
+@dataclass
+class CalibrationParameter:
+    """
+    A material parameter (a key of `user_defined_parameters`) that is fitted
+    between `lower` and `upper`, on a logarithmic scale with `log_scale`.
+    """
+
+    name: str
+    lower: float
+    upper: float
+    log_scale: bool = False
+
+    def validate(self) -> None:
+        if not self.lower < self.upper:
+            raise ValueError(f"Parameter '{self.name}' needs 'lower' below 'upper'.")
+        if self.log_scale and self.lower <= 0.0:
+            raise ValueError(
+                f"Parameter '{self.name}' needs a positive 'lower' on a log scale."
+            )
+
+    def to_value(self, unit_value: float) -> float:
+        if self.log_scale:
+            return math.exp(
+                math.log(self.lower)
+                + unit_value * (math.log(self.upper) - math.log(self.lower))
+            )
+        return self.lower + unit_value * (self.upper - self.lower)
+
+    def to_unit(self, value: float) -> float:
+        if self.log_scale:
+            unit_value = (math.log(value) - math.log(self.lower)) / (
+                math.log(self.upper) - math.log(self.lower)
+            )
+        else:
+            unit_value = (value - self.lower) / (self.upper - self.lower)
+        return min(max(unit_value, 0.0), 1.0)
+
+
+@dataclass
+class CalibrationResult:
+    """
+    The best parameter set and its misfit. `history` has the best misfit and
+    parameters after every batch of evaluations.
+    """
+
+    parameters: Dict[str, float]
+    misfit: float
+    evaluations: int
+    converged: bool
+    message: str
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    )
+    history: List[Dict] = field(default_factory=list)
+
+
+def build_calibration_targets(
+    experimental_by_test: Dict[str, Dict[str, List[float]]],
+    test_inputs_by_type: Dict[
+        str, TriaxialAndShearSimulationInputs | CRSSimulationInputs
+    ],
+    weights: Optional[Dict[str, Dict[str, float]]] = None,
+) -> List[CalibrationTarget]:
+    """
+    Returns a target for every test type of the lab results (as imported from
+    a lab results file), with the test inputs of that type.
+    """
+    weights = weights or {}
+    targets = []
+    for test_type, experimental_results in experimental_by_test.items():
+        if test_type not in test_inputs_by_type:
+            raise ValueError(f"No test inputs for the {test_type} lab results.")
+        targets.append(
+            CalibrationTarget(
+                test_inputs=test_inputs_by_type[test_type],
+                experimental_results=experimental_results,
+                weights=weights.get(test_type, {}),
+            )
+        )
+    return targets
+
+
+def evaluate_candidate(
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+    targets: List[CalibrationTarget],
+    execution_mode: str = FINITE_ELEMENT,
+    force_finite_element: bool = False,
+) -> Tuple[float, Optional[str]]:
+    """
+    Simulates every target with the material inputs of a candidate and returns
+    the total weighted misfit and None, or infinity and the reason when a
+    simulation fails. Meant to be executed in a worker process of a
+    SimulationPool.
+    """
+    # Imported here, so Kratos is only loaded after the worker initializer ran
+    from kratos_element_test.model.pipeline.simulation_factory import (
+        create_simulation,
+    )
+
+    total = 0.0
+    for target in targets:
+        try:
+            sim = create_simulation(
+                test_inputs=target.test_inputs,
+                material_inputs=material_inputs,
+                logger=lambda msg, level: None,
+                execution_mode=execution_mode,
+                force_finite_element=force_finite_element,
+            )
+            sim.run()
+            total += weighted_misfit(target, sim.post_process_results())
+        except Exception as e:
+            return math.inf, f"{target.test_inputs.test_type} test failed: {e}"
+    return total, None
+
+
+class Calibrator:
+    """
+    Fits material parameters such that the simulated element tests match the
+    lab results of the targets under a weighted misfit.
+
+    The optimizers are derivative free and work on the unit hypercube of the
+    parameter bounds. They hand over batches of independent candidates, which
+    are evaluated concurrently in a SimulationPool when `workers` > 1.
+    """
+
+    def __init__(
+        self,
+        material_inputs: (
+            LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+        ),
+        parameters: List[CalibrationParameter],
+        targets: List[CalibrationTarget],
+        logger: Optional[Callable[[str, str], None]] = None,
+        workers: int = 1,
+        execution_mode: str = FINITE_ELEMENT,
+        force_finite_element: bool = False,
+    ):
+        validate_execution_mode(execution_mode)
+        if not parameters:
+            raise ValueError("A calibration needs at least one parameter.")
+        if not targets:
+            raise ValueError("A calibration needs lab results to compare with.")
+        for parameter in parameters:
+            parameter.validate()
+            if parameter.name not in material_inputs.user_defined_parameters:
+                raise KeyError(
+                    f"This material parameter ({parameter.name}) is not available "
+                    "for the material."
+                )
+        for target in targets:
+            target.validate()
+
+        self.material_inputs = material_inputs
+        self.parameters = parameters
+        self.targets = targets
+        self._log = logger or _fallback_log
+        self.workers = max(1, workers)
+        self.execution_mode = execution_mode
+        self.force_finite_element = force_finite_element
+        self._pool: Optional[SimulationPool] = None
+        self._first_failure: Optional[str] = None
+
+    def run(
+        self,
+        method: str = DIFFERENTIAL_EVOLUTION,
+        max_evaluations: int = 200,
+        tolerance: float = 1e-6,
+        seed: Optional[int] = None,
+    ) -> CalibrationResult:
+        if method not in OPTIMIZERS:
+            raise ValueError(
+                f"Unsupported optimizer: {method}. Expected one of {', '.join(OPTIMIZERS)}."
+            )
+
+        initial = np.array(
+            [
+                parameter.to_unit(
+                    float(
+                        self.material_inputs.user_defined_parameters[
+                            parameter.name
+                        ].value
+                    )
+                )
+                for parameter in self.parameters
+            ]
+        )
+        self._log(
+            f"Calibrating {', '.join(p.name for p in self.parameters)} with "
+            f"{method} (at most {max_evaluations} evaluations)...",
+            "info",
+        )
+        self._first_failure = None
+        if self.workers > 1:
+            self._pool = SimulationPool(max_workers=self.workers)
+        try:
+            if method == NELDER_MEAD:
+                optimum = nelder_mead(
+                    self._evaluate,
+                    len(self.parameters),
+                    max_evaluations,
+                    initial=initial,
+                    tolerance=tolerance,
+                )
+            else:
+                optimum = differential_evolution(
+                    self._evaluate,
+                    len(self.parameters),
+                    max_evaluations,
+                    tolerance=tolerance,
+                    initial=initial,
+                    seed=seed,
+                )
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_pending=True)
+                self._pool = None
+
+        if optimum.x is None:
+            raise CalibrationFailed(
+                f"None of the {optimum.evaluations} candidates could be simulated. "
+                f"First failure: {self._first_failure}"
+            )
+        result = CalibrationResult(
+            parameters=self._parameter_values(optimum.x),
+            misfit=optimum.misfit,
+            evaluations=optimum.evaluations,
+            converged=optimum.converged,
+            message=optimum.message,
+            material_inputs=self.material_inputs_for(optimum.x),
+            history=[
+                {
+                    "evaluations": evaluations,
+                    "misfit": misfit,
+                    "parameters": self._parameter_values(x),
+                }
+                for evaluations, misfit, x in optimum.history
+            ],
+        )
+        self._log(
+            f"Calibration finished after {result.evaluations} evaluations with "
+            f"misfit {result.misfit:.6g}: {optimum.message}",
+            "info",
+        )
+        return result
+
+    def material_inputs_for(
+        self, unit_values: np.ndarray
+    ) -> LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs:
+        material_inputs = copy.deepcopy(self.material_inputs)
+        for name, value in self._parameter_values(unit_values).items():
+            material_inputs.user_defined_parameters[name].value = value
+        return material_inputs
+
+    def _parameter_values(self, unit_values: np.ndarray) -> Dict[str, float]:
+        return {
+            parameter.name: parameter.to_value(float(unit_value))
+            for parameter, unit_value in zip(self.parameters, unit_values)
+        }
+
+    def _evaluate(self, candidates: np.ndarray) -> np.ndarray:
+        arguments = [
+            (
+                self.material_inputs_for(candidate),
+                self.targets,
+                self.execution_mode,
+                self.force_finite_element,
+            )
+            for candidate in candidates
+        ]
+        if self._pool is None:
+            outcomes = [evaluate_candidate(*args) for args in arguments]
+        else:
+            futures = [
+                self._pool.submit(evaluate_candidate, *args) for args in arguments
+            ]
+            outcomes = [future.result() for future in futures]
+
+        for candidate, (_, failure) in zip(candidates, outcomes):
+            if failure is not None:
+                self._log(
+                    f"Candidate {self._parameter_values(candidate)} failed: {failure}",
+                    "warn",
+                )
+                if self._first_failure is None:
+                    self._first_failure = failure
+        return np.array([misfit for misfit, _ in outcomes])
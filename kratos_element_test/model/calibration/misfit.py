@@ -0,0 +1,143 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping
+
+import numpy as np
+
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+
+# The lab results are compared with the simulated results at the same value of
+# the quantity that drives the test
+DRIVING_CHANNEL_BY_TEST = {
+    "triaxial": "yy_strain",
+    "direct_shear": "shear_strain_xy",
+    "crs": "time_steps",
+}
+
+
+def _absolute(name: str) -> Callable[[Mapping], np.ndarray]:
+    return lambda results: np.abs(np.asarray(results[name], dtype=float))
+
+
+def _channel(name: str) -> Callable[[Mapping], np.ndarray]:
+    return lambda results: np.asarray(results[name], dtype=float)
+
+
+# How the quantities of the lab results files (see the lab result overlays)
+# follow from the simulated results. Shear stresses and strains are compared by
+# magnitude, like they are plotted.
+SIMULATED_CHANNELS: Dict[str, Callable[[Mapping], np.ndarray]] = {
+    "yy_strain": _channel("yy_strain"),
+    "vol_strain": _channel("vol_strain"),
+    "sigma1_sigma3_diff": lambda results: np.abs(
+        np.asarray(results["sigma1"], dtype=float)
+        - np.asarray(results["sigma3"], dtype=float)
+    ),
+    "sigma_1": _channel("sigma1"),
+    "sigma_3": _channel("sigma3"),
+    "sigma_xx": _channel("sigma_xx"),
+    "sigma_yy": _channel("sigma_yy"),
+    "p'": _channel("mean_stress"),
+    "q": _channel("von_mises"),
+    "shear_strain_xy": _absolute("shear_strain_xy"),
+    "shear_stress_xy": _absolute("shear_xy"),
+    "time_steps": _channel("time_steps"),
+}
+ABSOLUTE_LAB_CHANNELS = ("shear_strain_xy", "shear_stress_xy")
+
+
+@dataclass
+class CalibrationTarget:
+    """
+    The lab results of one element test, and the inputs of the test that
+    reproduces it. `weights` scales the contribution of each lab quantity to
+    the misfit; quantities without a weight count once, and a weight of zero
+    leaves a quantity out.
+    """
+
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs
+    experimental_results: Dict[str, List[float]]
+    weights: Dict[str, float] = field(default_factory=dict)
+    weight: float = 1.0
+
+    @property
+    def test_type(self) -> str:
+        return self.test_inputs.test_type.lower()
+
+    @property
+    def driving_channel(self) -> str:
+        return DRIVING_CHANNEL_BY_TEST[self.test_type]
+
+    def compared_channels(self) -> List[str]:
+        return [
+            name
+            for name in self.experimental_results
+            if name != self.driving_channel
+            and name in SIMULATED_CHANNELS
+            and self.weights.get(name, 1.0) > 0.0
+        ]
+
+    def validate(self) -> None:
+        if self.test_type not in DRIVING_CHANNEL_BY_TEST:
+            raise ValueError(f"Unsupported test type: {self.test_type}")
+        if self.driving_channel not in self.experimental_results:
+            raise ValueError(
+                f"The {self.test_type} lab results need '{self.driving_channel}' "
+                "to be compared with the simulation."
+            )
+        if not self.compared_channels():
+            raise ValueError(
+                f"The {self.test_type} lab results have nothing to compare with "
+                f"the simulation. Known quantities: {', '.join(SIMULATED_CHANNELS)}."
+            )
+
+
+def target_misfit(target: CalibrationTarget, results: Mapping) -> Dict[str, float]:
+    """
+    Returns the misfit of every compared lab quantity: the mean squared
+    difference between the lab values and the simulated values at the same
+    value of the driving quantity, relative to the largest lab value. Lab
+    points outside the simulated range (such as the unloaded state at the
+    start of a test) are left out. Without any overlap, the misfit is one.
+    """
+    lab_driver = _lab_values(target, target.driving_channel)
+    simulated_driver = SIMULATED_CHANNELS[target.driving_channel](results)
+    order = np.argsort(simulated_driver, kind="stable")
+    simulated_driver = simulated_driver[order]
+
+    misfits = {}
+    for name in target.compared_channels():
+        lab_values = _lab_values(target, name)
+        n = min(len(lab_driver), len(lab_values))
+        driver, lab_values = lab_driver[:n], lab_values[:n]
+        scale = max(float(np.max(np.abs(lab_values))), np.finfo(float).tiny)
+
+        simulated = SIMULATED_CHANNELS[name](results)[order]
+        in_range = (driver >= simulated_driver[0]) & (driver <= simulated_driver[-1])
+        if not np.any(in_range):
+            misfits[name] = 1.0
+            continue
+        differences = (
+            np.interp(driver[in_range], simulated_driver, simulated)
+            - lab_values[in_range]
+        ) / scale
+        misfits[name] = float(np.mean(differences**2))
+    return misfits
+
+
+def weighted_misfit(target: CalibrationTarget, results: Mapping) -> float:
+    return target.weight * sum(
+        target.weights.get(name, 1.0) * misfit
+        for name, misfit in target_misfit(target, results).items()
+    )
+
+
+def _lab_values(target: CalibrationTarget, name: str) -> np.ndarray:
+    values = np.asarray(target.experimental_results[name], dtype=float)
+    return np.abs(values) if name in ABSOLUTE_LAB_CHANNELS else values
@@ -0,0 +1,211 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from kratos_element_test.model.design_of_experiments import latin_hypercube
+
+DIFFERENTIAL_EVOLUTION = "differential_evolution"
+NELDER_MEAD = "nelder_mead"
+OPTIMIZERS = (DIFFERENTIAL_EVOLUTION, NELDER_MEAD)
+
+# Evaluates a batch of candidates, one per row, and returns their misfits. The
+# candidates of a batch are independent, so they can be evaluated concurrently.
+BatchObjective = Callable[[np.ndarray], np.ndarray]
+
+
+@dataclass
+class OptimizationResult:
+    """
+    The best candidate found, in the unit hypercube, and the best misfit after
+    every batch of evaluations. `x` is None when no candidate had a finite
+    misfit.
+    """
+
+    x: Optional[np.ndarray]
+    misfit: float
+    evaluations: int
+    converged: bool
+    message: str
+    history: List[Tuple[int, float, np.ndarray]] = field(default_factory=list)
+
+
+class _BudgetedObjective:
+    """
+    Counts evaluations, keeps track of the best candidate and refuses to
+    evaluate beyond `max_evaluations`.
+    """
+
+    def __init__(self, objective: BatchObjective, max_evaluations: int):
+        self._objective = objective
+        self.max_evaluations = max_evaluations
+        self.evaluations = 0
+        self.best_x: Optional[np.ndarray] = None
+        self.best_misfit = np.inf
+        self.history: List[Tuple[int, float, np.ndarray]] = []
+
+    @property
+    def remaining(self) -> int:
+        return self.max_evaluations - self.evaluations
+
+    def __call__(self, candidates: np.ndarray) -> np.ndarray:
+        candidates = np.clip(np.atleast_2d(candidates), 0.0, 1.0)
+        if len(candidates) > self.remaining:
+            raise ValueError("The evaluation budget is exhausted.")
+
+        misfits = np.asarray(self._objective(candidates), dtype=float)
+        misfits = np.where(np.isfinite(misfits), misfits, np.inf)
+        self.evaluations += len(candidates)
+        best = int(np.argmin(misfits))
+        if misfits[best] < self.best_misfit:
+            self.best_misfit = float(misfits[best])
+            self.best_x = candidates[best].copy()
+        if self.best_x is not None:
+            self.history.append(
+                (self.evaluations, self.best_misfit, self.best_x.copy())
+            )
+        return misfits
+
+    def result(self, converged: bool, message: str) -> OptimizationResult:
+        return OptimizationResult(
+            x=self.best_x,
+            misfit=self.best_misfit,
+            evaluations=self.evaluations,
+            converged=converged,
+            message=message,
+            history=self.history,
+        )
+
+
+def differential_evolution(
+    objective: BatchObjective,
+    number_of_dimensions: int,
+    max_evaluations: int,
+    population_size: Optional[int] = None,
+    mutation: float = 0.7,
+    crossover: float = 0.9,
+    tolerance: float = 1e-6,
+    initial: Optional[np.ndarray] = None,
+    seed: Optional[int] = None,
+) -> OptimizationResult:
+    """
+    Minimizes the objective on the unit hypercube with differential evolution
+    (DE/rand/1/bin). The population is initialised with a Latin hypercube
+    sample that includes `initial`, and every generation is evaluated as one
+    batch. Stops when the misfits of the population agree within `tolerance`
+    or when the budget does not allow another generation.
+    """
+    rng = np.random.default_rng(seed)
+    population_size = population_size or max(8, 5 * number_of_dimensions)
+    budget = _BudgetedObjective(objective, max_evaluations)
+    if max_evaluations < population_size:
+        population_size = max(1, max_evaluations)
+
+    population = latin_hypercube(population_size, number_of_dimensions, seed=seed)
+    if initial is not None:
+        population[0] = initial
+    misfits = budget(population)
+
+    while True:
+        if np.isfinite(misfits).all() and np.ptp(misfits) <= tolerance * (
+            1.0 + abs(budget.best_misfit)
+        ):
+            return budget.result(True, "The misfits of the population agree.")
+        if budget.remaining < population_size or population_size < 4:
+            return budget.result(False, "The evaluation budget is exhausted.")
+
+        trials = np.empty_like(population)
+        for i in range(population_size):
+            others = rng.choice(
+                [j for j in range(population_size) if j != i], 3, replace=False
+            )
+            a, b, c = population[others]
+            mutant = a + mutation * (b - c)
+            # Out of bounds values are bounced back between the target and the bound
+            mutant = np.where(mutant < 0.0, rng.random() * population[i], mutant)
+            mutant = np.where(
+                mutant > 1.0, 1.0 - rng.random() * (1.0 - population[i]), mutant
+            )
+            crossed = rng.random(number_of_dimensions) < crossover
+            crossed[rng.integers(number_of_dimensions)] = True
+            trials[i] = np.where(crossed, mutant, population[i])
+
+        trial_misfits = budget(trials)
+        improved = trial_misfits <= misfits
+        population[improved] = trials[improved]
+        misfits[improved] = trial_misfits[improved]
+
+
+def nelder_mead(
+    objective: BatchObjective,
+    number_of_dimensions: int,
+    max_evaluations: int,
+    initial: Optional[np.ndarray] = None,
+    initial_step: float = 0.2,
+    tolerance: float = 1e-6,
+) -> OptimizationResult:
+    """
+    Minimizes the objective on the unit hypercube with the Nelder-Mead simplex
+    method. Every iteration evaluates the reflection, expansion and both
+    contractions speculatively as one batch, so an iteration takes the time of
+    a single evaluation when they run concurrently. Stops when the simplex has
+    shrunk to `tolerance` or when the budget does not allow another iteration.
+    """
+    budget = _BudgetedObjective(objective, max_evaluations)
+    start = np.full(number_of_dimensions, 0.5) if initial is None else initial
+    simplex = np.tile(np.clip(start, 0.0, 1.0), (number_of_dimensions + 1, 1))
+    for i in range(number_of_dimensions):
+        # Step away from the nearest bound, so the simplex does not collapse
+        step = initial_step if simplex[0, i] <= 0.5 else -initial_step
+        simplex[i + 1, i] += step
+    if budget.remaining < len(simplex):
+        raise ValueError(
+            f"Nelder-Mead needs at least {len(simplex)} evaluations to start."
+        )
+    misfits = budget(simplex)
+
+    while True:
+        order = np.argsort(misfits)
+        simplex, misfits = simplex[order], misfits[order]
+        if np.max(np.abs(simplex[1:] - simplex[0])) <= tolerance:
+            return budget.result(True, "The simplex has converged.")
+        if budget.remaining < 4:
+            return budget.result(False, "The evaluation budget is exhausted.")
+
+        centroid = simplex[:-1].mean(axis=0)
+        worst = simplex[-1]
+        candidates = np.clip(
+            [
+                centroid + (centroid - worst),
+                centroid + 2.0 * (centroid - worst),
+                centroid + 0.5 * (centroid - worst),
+                centroid - 0.5 * (centroid - worst),
+            ],
+            0.0,
+            1.0,
+        )
+        reflected, expanded, outside, inside = budget(candidates)
+
+        if reflected < misfits[0]:
+            choice = 1 if expanded < reflected else 0
+        elif reflected < misfits[-2]:
+            choice = 0
+        elif reflected < misfits[-1]:
+            choice = 2 if outside <= reflected else None
+        else:
+            choice = 3 if inside < misfits[-1] else None
+
+        if choice is not None:
+            simplex[-1] = candidates[choice]
+            misfits[-1] = (reflected, expanded, outside, inside)[choice]
+            continue
+
+        # Shrink towards the best vertex
+        if budget.remaining < number_of_dimensions:
+            return budget.result(False, "The evaluation budget is exhausted.")
+        simplex[1:] = simplex[0] + 0.5 * (simplex[1:] - simplex[0])
+        misfits[1:] = budget(simplex[1:])
@@ -0,0 +1,358 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import copy
+import itertools
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from kratos_element_test.model.job_spec import (
+    JobRun,
+    build_material_inputs,
+    build_test_inputs,
+)
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+FULL_FACTORIAL = "full_factorial"
+LATIN_HYPERCUBE = "latin_hypercube"
+SOBOL = "sobol"
+DESIGN_METHODS = (FULL_FACTORIAL, LATIN_HYPERCUBE, SOBOL)
+
+# Primitive polynomials and initial direction numbers of the Sobol sequence for
+# dimensions 2 and up, from Joe and Kuo (new-joe-kuo-6.21201): the degree s, the
+# coefficients a and the initial direction numbers m_1 .. m_s
+SOBOL_DIRECTION_NUMBERS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+SOBOL_MAX_DIMENSIONS = len(SOBOL_DIRECTION_NUMBERS) + 1
+SOBOL_BITS = 52
+
+
+@dataclass
+class Factor:
+    """
+    A varied input of an experiment design.
+
+    `name` is the path of the input in a job spec run, e.g.
+    ``material.YOUNG_MODULUS``, ``test.initial_effective_cell_pressure`` or
+    ``test.strain_increments.0.strain_increment``. A factor either has
+    explicit `levels` (any JSON value, such as a list of strain increments),
+    or a range from `lower` to `upper` that is sampled linearly or, with
+    `log_scale`, logarithmically. Values of `integer` factors are rounded.
+    """
+
+    name: str
+    levels: Optional[List[Any]] = None
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+    log_scale: bool = False
+    integer: bool = False
+
+    def validate(self) -> None:
+        if not self.name.startswith(("test.", "material.")):
+            raise ValueError(
+                f"Factor '{self.name}' must start with 'test.' or 'material.' "
+                "followed by the name of an input."
+            )
+        if self.levels is not None:
+            if len(self.levels) == 0:
+                raise ValueError(f"Factor '{self.name}' has no levels.")
+            return
+        if self.lower is None or self.upper is None:
+            raise ValueError(
+                f"Factor '{self.name}' needs either 'levels' or 'lower' and 'upper'."
+            )
+        if self.upper < self.lower:
+            raise ValueError(f"Factor '{self.name}' has 'upper' below 'lower'.")
+        if self.log_scale and self.lower <= 0.0:
+            raise ValueError(
+                f"Factor '{self.name}' needs a positive 'lower' on a log scale."
+            )
+
+    def value_at(self, unit_value: float) -> Any:
+        """
+        Maps a value in [0, 1) of the unit hypercube to a value of the factor.
+        """
+        if self.levels is not None:
+            index = min(int(unit_value * len(self.levels)), len(self.levels) - 1)
+            return copy.deepcopy(self.levels[index])
+        if self.log_scale:
+            value = float(
+                np.exp(
+                    np.log(self.lower)
+                    + unit_value * (np.log(self.upper) - np.log(self.lower))
+                )
+            )
+        else:
+            value = self.lower + unit_value * (self.upper - self.lower)
+        return int(round(value)) if self.integer else float(value)
+
+    def factorial_levels(self, number_of_levels: int) -> List[Any]:
+        if self.levels is not None:
+            return copy.deepcopy(self.levels)
+        if number_of_levels == 1:
+            return [self.value_at(0.5)]
+        return [
+            self.value_at(i / (number_of_levels - 1)) for i in range(number_of_levels)
+        ]
+
+
+@dataclass
+class SweepSpec:
+    base: Dict
+    factors: List[Factor]
+    method: str = LATIN_HYPERCUBE
+    samples: int = 16
+    levels: int = 3
+    seed: Optional[int] = None
+    output_directory: Path | None = None
+    points: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def full_factorial(factors: List[Factor], number_of_levels: int = 3) -> List[Dict]:
+    """
+    Returns every combination of the factor levels. Factors without explicit
+    levels get `number_of_levels` equally spaced levels, including the bounds.
+    """
+    level_lists = [factor.factorial_levels(number_of_levels) for factor in factors]
+    return [
+        {factor.name: copy.deepcopy(value) for factor, value in zip(factors, values)}
+        for values in itertools.product(*level_lists)
+    ]
+
+
+def latin_hypercube(
+    number_of_samples: int, number_of_dimensions: int, seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Returns a (number_of_samples, number_of_dimensions) Latin hypercube sample in
+    [0, 1): every dimension has exactly one sample in each of the
+    `number_of_samples` equal intervals.
+    """
+    rng = np.random.default_rng(seed)
+    samples = np.empty((number_of_samples, number_of_dimensions))
+    for dimension in range(number_of_dimensions):
+        strata = rng.permutation(number_of_samples)
+        samples[:, dimension] = (
+            strata + rng.random(number_of_samples)
+        ) / number_of_samples
+    return samples
+
+
+def sobol_sequence(number_of_samples: int, number_of_dimensions: int) -> np.ndarray:
+    """
+    Returns the first `number_of_samples` points of the (unscrambled) Sobol
+    sequence in [0, 1), starting at the origin. Powers of two give the best
+    balanced designs.
+    """
+    if not 1 <= number_of_dimensions <= SOBOL_MAX_DIMENSIONS:
+        raise ValueError(
+            f"The Sobol sequence supports 1 to {SOBOL_MAX_DIMENSIONS} dimensions, "
+            f"but {number_of_dimensions} were requested."
+        )
+    if number_of_samples > 2**SOBOL_BITS:
+        raise ValueError("Too many samples for the Sobol sequence.")
+
+    directions = np.empty((number_of_dimensions, SOBOL_BITS), dtype=np.uint64)
+    # The first dimension is the van der Corput sequence in base 2
+    directions[0] = [1 << (SOBOL_BITS - 1 - bit) for bit in range(SOBOL_BITS)]
+    for dimension in range(1, number_of_dimensions):
+        degree, coefficients, initial = SOBOL_DIRECTION_NUMBERS[dimension - 1]
+        m = list(initial)
+        for i in range(degree, SOBOL_BITS):
+            value = m[i - degree] ^ (m[i - degree] << degree)
+            for k in range(1, degree):
+                if (coefficients >> (degree - 1 - k)) & 1:
+                    value ^= m[i - k] << k
+            m.append(value)
+        directions[dimension] = [
+            m[bit] << (SOBOL_BITS - 1 - bit) for bit in range(SOBOL_BITS)
+        ]
+
+    # Gray code construction: point i differs from point i - 1 in the direction
+    # number of the lowest zero bit of i - 1
+    points = np.zeros((number_of_samples, number_of_dimensions), dtype=np.uint64)
+    state = np.zeros(number_of_dimensions, dtype=np.uint64)
+    for i in range(1, number_of_samples):
+        lowest_zero_bit = (~(i - 1) & i).bit_length() - 1
+        state ^= directions[:, lowest_zero_bit]
+        points[i] = state
+    return points.astype(np.float64) / float(2**SOBOL_BITS)
+
+
+def generate_design(
+    factors: List[Factor],
+    method: str = LATIN_HYPERCUBE,
+    samples: int = 16,
+    levels: int = 3,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Returns the design points as dicts of factor name to value. `samples` is
+    used by the Latin hypercube and Sobol designs, `levels` by the full
+    factorial design.
+    """
+    if not factors:
+        raise ValueError("A design needs at least one factor.")
+    for factor in factors:
+        factor.validate()
+    names = [factor.name for factor in factors]
+    if len(set(names)) != len(names):
+        raise ValueError("Every factor of a design must have a unique name.")
+
+    if method == FULL_FACTORIAL:
+        return full_factorial(factors, levels)
+    if method == LATIN_HYPERCUBE:
+        unit_samples = latin_hypercube(samples, len(factors), seed)
+    elif method == SOBOL:
+        unit_samples = sobol_sequence(samples, len(factors))
+    else:
+        raise ValueError(
+            f"Unsupported design method: {method}. "
+            f"Expected one of {', '.join(DESIGN_METHODS)}."
+        )
+    return [
+        {
+            factor.name: factor.value_at(unit_value)
+            for factor, unit_value in zip(factors, point)
+        }
+        for point in unit_samples
+    ]
+
+
+def apply_design_point(base: Dict, point: Dict[str, Any]) -> Dict:
+    """
+    Returns a copy of the job spec run `base` with the factor values of a
+    design point filled in.
+    """
+    run = copy.deepcopy(base)
+    for name, value in point.items():
+        keys = name.split(".")
+        if keys[0] not in ("test", "material") or len(keys) < 2:
+            raise KeyError(
+                f"Factor '{name}' must start with 'test.' or 'material.' "
+                "followed by the name of an input."
+            )
+        if keys[0] == "material" and keys[1] != "parameters":
+            keys.insert(1, "parameters")
+        _set_value(run, keys, copy.deepcopy(value))
+    return run
+
+
+def build_design_run(base: Dict, point: Dict[str, Any], name: str) -> JobRun:
+    """
+    Returns the run of a design point. Raises a ValueError when the factor
+    values give invalid inputs.
+    """
+    try:
+        entry = apply_design_point(base, point)
+        return JobRun(
+            name=name,
+            test_inputs=build_test_inputs(entry.get("test", {})),
+            material_inputs=build_material_inputs(entry.get("material", {})),
+        )
+    except (IndexError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid design point '{name}' ({point}): {e}") from e
+
+
+def design_point_name(index: int) -> str:
+    return f"point_{index + 1:04d}"
+
+
+def load_sweep_spec(spec_path: Path) -> SweepSpec:
+    """
+    Reads a sweep specification from a JSON or TOML file. It holds a ``base``
+    run in job spec form (``test`` and ``material`` tables), a ``factors``
+    list with the fields of `Factor`, a ``design`` table with the ``method``
+    (one of ``DESIGN_METHODS``), ``samples``, ``levels`` and ``seed``, and an
+    optional ``output_directory``.
+    """
+    spec_path = Path(spec_path)
+    if spec_path.suffix.lower() == ".toml":
+        if tomllib is None:
+            raise RuntimeError(
+                "Reading TOML sweep specs requires Python 3.11 or newer."
+            )
+        with open(spec_path, "rb") as f:
+            raw_spec = tomllib.load(f)
+    else:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            raw_spec = json.load(f)
+
+    spec = parse_sweep_spec(raw_spec)
+    if spec.output_directory is not None:
+        spec.output_directory = spec_path.parent / spec.output_directory
+    return spec
+
+
+def parse_sweep_spec(raw_spec: Dict) -> SweepSpec:
+    if not isinstance(raw_spec, dict) or "base" not in raw_spec:
+        raise ValueError("A sweep spec needs a 'base' run.")
+    try:
+        factors = [Factor(**raw_factor) for raw_factor in raw_spec.get("factors", [])]
+    except TypeError as e:
+        raise ValueError(f"Invalid factor in sweep spec: {e}") from e
+
+    design = raw_spec.get("design", {})
+    output_directory = raw_spec.get("output_directory")
+    spec = SweepSpec(
+        base=raw_spec["base"],
+        factors=factors,
+        method=design.get("method", LATIN_HYPERCUBE),
+        samples=int(design.get("samples", 16)),
+        levels=int(design.get("levels", 3)),
+        seed=design.get("seed"),
+        output_directory=Path(output_directory) if output_directory else None,
+    )
+    spec.points = generate_design(
+        spec.factors, spec.method, spec.samples, spec.levels, spec.seed
+    )
+    return spec
+
+
+def _set_value(entry: Any, keys: List[str], value: Any) -> None:
+    for depth, key in enumerate(keys[:-1]):
+        next_key = keys[depth + 1]
+        if isinstance(entry, list):
+            entry = entry[int(key)]
+            continue
+        if key not in entry:
+            entry[key] = [] if next_key.isdigit() else {}
+        entry = entry[key]
+
+    last_key = keys[-1]
+    if isinstance(entry, list):
+        entry[int(last_key)] = value
+    elif isinstance(entry.get(last_key), dict) and "value" in entry[last_key]:
+        # UDSM parameters may be given with their unit
+        entry[last_key]["value"] = value
+    else:
+        entry[last_key] = value
@@ -0,0 +1,392 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from openpyxl import Workbook
+
+from kratos_element_test.model.io.columnar_result_store import ColumnarResultStore
+from kratos_element_test.model.io.excel_export import (
+    PLOT_MAPPING,
+    cell_values,
+    sheet_columns,
+    write_excel,
+)
+from kratos_element_test.model.io.result_file import read_results, safe_file_name
+from kratos_element_test.model.pipeline.batch_runner import MANIFEST_FILE_NAME
+from kratos_element_test.model.pipeline.simulation_pool import SimulationPool
+from kratos_element_test.model.pipeline.sweep_runner import (
+    RUNS_IN_FLIGHT_PER_WORKER,
+    SWEEP_FILE_NAME,
+)
+from kratos_element_test.model.run_archive import INPUT_COLUMNS, ArchivedRun
+from kratos_element_test.model.simulation_results import SimulationResults
+
+RUNS_SHEET_NAME = "Runs"
+
+# Scalar results with their own column on the runs sheet
+SCALAR_COLUMNS = ("cohesion", "phi")
+
+# Channels of which the value at the end of the run has its own column on the
+# runs sheet
+END_VALUE_COLUMNS = ("sigma1", "sigma3")
+
+# Rows per sheet of Excel, including the header row
+MAXIMUM_SHEET_ROWS = 1_048_576
+
+
+@dataclass
+class ExportRun:
+    """
+    The results of one run to export, with its metadata, such as its test
+    and material inputs.
+    """
+
+    name: str
+    test_type: str
+    results: SimulationResults
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def load_runs(source: Path) -> Iterator[ExportRun]:
+    """
+    Yields the completed runs of a batch output directory (with a manifest),
+    of a sweep output directory (with a columnar result store) or of a single
+    result file of a batch run (JSON, NPZ or Parquet). The runs are read one
+    at a time, when they are exported.
+    """
+    source = Path(source)
+    if (source / MANIFEST_FILE_NAME).is_file():
+        yield from _batch_runs(source)
+    elif (source / SWEEP_FILE_NAME).is_file():
+        yield from _sweep_runs(source)
+    elif source.is_file():
+        yield _read_run(source)
+    else:
+        raise ValueError(
+            f"{source} is neither a result file nor a batch or sweep output directory."
+        )
+
+
+def archived_runs(runs: Iterable[ArchivedRun]) -> Iterator[ExportRun]:
+    """
+    Yields the runs found in a RunArchive. Their results are read from the
+    archive one run at a time and are not kept by the archived runs, so they
+    are released once the run is written.
+    """
+    for run in runs:
+        yield ExportRun(
+            name=f"run_{run.id}",
+            test_type=run.test_type,
+            results=run.load_results(),
+            metadata={
+                "archive_id": run.id,
+                "created_at": run.created_at,
+                "material_type": run.material_type,
+                "solution_method": run.solution_method,
+                "test_inputs": run.test_inputs,
+                "parameters": run.parameters,
+            },
+        )
+
+
+def collect_runs(
+    sources: Iterable[Path | str | ArchivedRun | ExportRun],
+) -> Iterator[ExportRun]:
+    """
+    Yields the runs of all sources: result files and batch or sweep output
+    directories (see load_runs), runs found in a RunArchive and ExportRuns.
+    """
+    for source in sources:
+        if isinstance(source, ExportRun):
+            yield source
+        elif isinstance(source, ArchivedRun):
+            yield from archived_runs([source])
+        else:
+            yield from load_runs(source)
+
+
+def _read_run(path: Path) -> ExportRun:
+    if path.suffix != ".json":
+        results, metadata = read_results(path)
+        return ExportRun(
+            name=metadata.get("name", path.stem),
+            test_type=metadata["test_type"],
+            results=results,
+            metadata=metadata,
+        )
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return ExportRun(
+        name=data["name"],
+        test_type=data["test_inputs"]["test_type"],
+        results=SimulationResults.from_dict(data["results"]),
+        metadata={
+            "test_inputs": data["test_inputs"],
+            "material_inputs": data["material_inputs"],
+        },
+    )
+
+
+def _completed_batch_entries(directory: Path) -> List[Dict]:
+    with open(directory / MANIFEST_FILE_NAME, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return [
+        entry
+        for entry in manifest["runs"]
+        if entry["status"] == "completed" and entry["result_file"]
+    ]
+
+
+def _completed_sweep_entries(store: ColumnarResultStore) -> List[Dict]:
+    return [
+        entry
+        for entry in store.runs()
+        if entry.get("status") == "completed" and "channels" in entry
+    ]
+
+
+def _batch_runs(directory: Path) -> Iterator[ExportRun]:
+    for entry in _completed_batch_entries(directory):
+        yield _read_run(directory / entry["result_file"])
+
+
+def _sweep_runs(directory: Path) -> Iterator[ExportRun]:
+    with open(directory / SWEEP_FILE_NAME, "r", encoding="utf-8") as f:
+        sweep = json.load(f)
+    test_type = sweep["base"]["test"]["test_type"]
+    store = ColumnarResultStore(directory)
+    for entry in _completed_sweep_entries(store):
+        yield ExportRun(
+            name=entry["name"],
+            test_type=test_type,
+            results=store.results_of_entry(entry),
+            metadata={"factors": entry.get("factors", {})},
+        )
+
+
+def count_runs(sources: Iterable[Path | str | ArchivedRun | ExportRun]) -> int:
+    """
+    Returns the number of runs that collect_runs yields for the sources,
+    without reading their results: the completed runs in the manifest of a
+    batch or in the runs of a sweep, and one run for every other source.
+    """
+    number_of_runs = 0
+    for source in sources:
+        if isinstance(source, (ArchivedRun, ExportRun)):
+            number_of_runs += 1
+        elif (Path(source) / MANIFEST_FILE_NAME).is_file():
+            number_of_runs += len(_completed_batch_entries(Path(source)))
+        elif (Path(source) / SWEEP_FILE_NAME).is_file():
+            number_of_runs += len(
+                _completed_sweep_entries(ColumnarResultStore(Path(source)))
+            )
+        else:
+            number_of_runs += 1
+    return number_of_runs
+
+
+def _end_value(results: SimulationResults, name: str) -> Optional[float]:
+    values = results.get(name)
+    if values is None or len(values) == 0 or not np.isfinite(values[-1]):
+        return None
+    return float(values[-1])
+
+
+def _total(runs: Iterable) -> Optional[int]:
+    return len(runs) if hasattr(runs, "__len__") else None
+
+
+class _DataSheets:
+    """
+    The sheets with the plot data of all runs in a write-only workbook: one
+    per plot of each test type, which is continued on a new sheet when it is
+    full.
+    """
+
+    def __init__(self, workbook: Workbook):
+        self._workbook = workbook
+        self._sheets: Dict[tuple, Any] = {}
+        self._rows: Dict[tuple, int] = {}
+        self._continuations: Dict[tuple, int] = {}
+
+    def append(
+        self,
+        test_type: str,
+        idx: int,
+        labels: List[str],
+        run_number: int,
+        columns,
+    ) -> None:
+        key = (test_type, idx)
+        rows = list(zip(*map(cell_values, columns)))
+        if key not in self._sheets or self._rows[key] + len(rows) > MAXIMUM_SHEET_ROWS:
+            self._add_sheet(key, labels)
+        sheet = self._sheets[key]
+        for x, y in rows:
+            sheet.append([run_number, x, y])
+        self._rows[key] += len(rows)
+
+    def _add_sheet(self, key: tuple, labels: List[str]) -> None:
+        test_type, idx = key
+        continuation = self._continuations.get(key, 0) + 1
+        title = f"{test_type} plot {idx}"
+        if continuation > 1:
+            title += f" ({continuation})"
+        sheet = self._workbook.create_sheet(title[:31])
+        sheet.append(["run", *labels])
+        self._sheets[key] = sheet
+        self._rows[key] = 1
+        self._continuations[key] = continuation
+
+
+def _append_run(
+    runs_sheet, data_sheets: _DataSheets, run_number: int, run: ExportRun
+) -> None:
+    if run.test_type not in PLOT_MAPPING:
+        raise ValueError(f"Unknown test type of '{run.name}': {run.test_type}")
+    test_inputs = run.metadata.get("test_inputs") or {}
+    runs_sheet.append(
+        [
+            run_number,
+            run.name,
+            run.test_type,
+            *[run.results.get(name) for name in SCALAR_COLUMNS],
+            *[_end_value(run.results, name) for name in END_VALUE_COLUMNS],
+            *[test_inputs.get(name) for name in INPUT_COLUMNS],
+            json.dumps(run.metadata, default=str),
+        ]
+    )
+    for idx, (y_key, x_key, y_label, x_label) in enumerate(
+        PLOT_MAPPING[run.test_type], start=1
+    ):
+        if y_key == "mohr_circle":
+            continue
+        columns = sheet_columns(run.results, y_key, x_key)
+        if columns is not None:
+            data_sheets.append(
+                run.test_type, idx, [x_label, y_label], run_number, columns
+            )
+
+
+def write_workbook(
+    runs: Iterable[ExportRun],
+    excel_path: Path,
+    progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    total: Optional[int] = None,
+) -> int:
+    """
+    Writes all runs to one Excel workbook and returns the number of runs. The
+    "Runs" sheet lists every run with its number, name, test type, main
+    inputs, the stresses at its end and its metadata. The plot data of the
+    runs follows on one sheet per plot of each test type, with a row per
+    point, headed by the number of the run. The Mohr circles are left out, as
+    they follow from the stresses at the end of the runs. The rows are
+    streamed to the file by a write-only workbook, so the runs do not need to
+    fit in memory. `progress_callback` is called with the number of runs
+    written and the total number of runs: `total`, or the length of `runs`
+    when it has one.
+    """
+    excel_path = Path(excel_path)
+    excel_path.parent.mkdir(parents=True, exist_ok=True)
+    if total is None:
+        total = _total(runs)
+
+    workbook = Workbook(write_only=True)
+    runs_sheet = workbook.create_sheet(RUNS_SHEET_NAME)
+    runs_sheet.append(
+        [
+            "run",
+            "name",
+            "test_type",
+            *SCALAR_COLUMNS,
+            *[f"{name}_at_end" for name in END_VALUE_COLUMNS],
+            *INPUT_COLUMNS,
+            "metadata",
+        ]
+    )
+    data_sheets = _DataSheets(workbook)
+
+    run_number = 0
+    try:
+        for run_number, run in enumerate(runs, start=1):
+            _append_run(runs_sheet, data_sheets, run_number, run)
+            if progress_callback is not None:
+                progress_callback(run_number, total)
+    except Exception:
+        # Closes the streams of the sheets, as the workbook is not saved
+        for sheet in workbook.worksheets:
+            sheet.close()
+        raise
+
+    workbook.save(excel_path)
+    return run_number
+
+
+def write_workbooks(
+    runs: Iterable[ExportRun],
+    output_directory: Path,
+    workers: int = 1,
+    progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    total: Optional[int] = None,
+) -> List[Path]:
+    """
+    Writes every run to its own Excel workbook, laid out like the export of
+    the user interface, and returns the paths of the workbooks. Runs without
+    any plot data are skipped. With more than one worker, the workbooks are
+    written concurrently in a SimulationPool, as writing them is bound by the
+    CPU. `progress_callback` is called with the number of runs done and the
+    total number of runs: `total`, or the length of `runs` when it has one.
+    """
+    output_directory = Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+    if total is None:
+        total = _total(runs)
+    jobs = (
+        (index, run, output_directory / f"{index:04d}_{safe_file_name(run.name)}.xlsx")
+        for index, run in enumerate(runs, start=1)
+    )
+
+    written: Dict[int, Path] = {}
+    done = 0
+    if workers <= 1:
+        for index, run, excel_path in jobs:
+            if write_excel(run.results, run.test_type, excel_path):
+                written[index] = excel_path
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done, total)
+        return list(written.values())
+
+    # Runs are read when they are submitted, so only the runs in flight are
+    # held in memory
+    in_flight = {}
+    with SimulationPool(max_workers=workers) as pool:
+        while True:
+            while len(in_flight) < workers * RUNS_IN_FLIGHT_PER_WORKER:
+                index, run, excel_path = next(jobs, (None, None, None))
+                if index is None:
+                    break
+                future = pool.submit(
+                    write_excel, run.results, run.test_type, excel_path
+                )
+                in_flight[future] = (index, excel_path)
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, excel_path = in_flight.pop(future)
+                if future.result():
+                    written[index] = excel_path
+                done += 1
+                if progress_callback is not None:
+                    progress_callback(done, total)
+    return [written[index] for index in sorted(written)]
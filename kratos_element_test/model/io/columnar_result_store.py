@@ -0,0 +1,131 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from kratos_element_test.model.simulation_results import SimulationResults
+
+RUNS_FILE_NAME = "runs.jsonl"
+CHANNEL_SUFFIX = ".f64"
+CHANNEL_DTYPE = np.dtype("<f8")
+
+
+class ColumnarResultStore:
+    """
+    Append-only store of the results of many runs, with one file per result
+    channel.
+
+    Every channel file holds the values of all runs back to back as
+    little-endian float64, so a channel can be read for all runs at once.
+    ``runs.jsonl`` holds one line per run with its index, status, metadata
+    (such as the values of the design factors), the scalar results and, for
+    every channel, the offset and length of the run in the channel file.
+    Runs are appended as they complete, so no more than one run is held in
+    memory. An existing store is appended to.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._channel_lengths: Dict[str, int] = {
+            path.stem: path.stat().st_size // CHANNEL_DTYPE.itemsize
+            for path in self.directory.glob(f"*{CHANNEL_SUFFIX}")
+        }
+
+    @property
+    def runs_path(self) -> Path:
+        return self.directory / RUNS_FILE_NAME
+
+    def append(
+        self,
+        run_index: int,
+        results: Optional[SimulationResults] = None,
+        **metadata: Any,
+    ) -> Dict:
+        """
+        Writes the channels of `results` (if any) and a line with the run
+        index, the `metadata` and the scalar results. Returns that line.
+        """
+        entry: Dict[str, Any] = {"run": run_index, **metadata}
+        if results is not None:
+            entry["scalars"] = {
+                name: results[name]
+                for name in results
+                if name not in results.channel_names
+            }
+            entry["channels"] = {
+                name: self._append_channel(name, results[name])
+                for name in results.channel_names
+            }
+
+        with open(self.runs_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+        return entry
+
+    def runs(self) -> List[Dict]:
+        if not self.runs_path.exists():
+            return []
+        with open(self.runs_path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @property
+    def channel_names(self) -> tuple:
+        return tuple(sorted(self._channel_lengths))
+
+    def channel(self, name: str) -> np.ndarray:
+        """
+        Returns the values of a channel of all runs, in the order the runs
+        were stored. The channel file is memory-mapped, not read.
+        """
+        path = self._channel_path(name)
+        if not path.exists():
+            raise KeyError(f"The store has no channel '{name}'.")
+        if path.stat().st_size == 0:
+            return np.empty(0, dtype=CHANNEL_DTYPE)
+        return np.memmap(path, dtype=CHANNEL_DTYPE, mode="r")
+
+    def results_of_run(self, run_index: int) -> SimulationResults:
+        entries = [entry for entry in self.runs() if entry["run"] == run_index]
+        if not entries or "channels" not in entries[-1]:
+            raise KeyError(f"The store has no results of run {run_index}.")
+        return self.results_of_entry(entries[-1])
+
+    def results_of_entry(self, entry: Dict) -> SimulationResults:
+        """
+        Returns the results of a run line of `runs`, with the channels as
+        slices of the memory-mapped channel files.
+        """
+        data: Dict[str, Any] = dict(entry.get("scalars", {}))
+        for name, (offset, length) in entry["channels"].items():
+            data[name] = self.channel(name)[offset : offset + length]
+        return SimulationResults(data, copy=False)
+
+    def to_frame(self):
+        """
+        Returns the run lines as a pandas DataFrame, with one column per
+        metadata entry and scalar result.
+        """
+        import pandas as pd
+
+        return pd.json_normalize(
+            [
+                {key: value for key, value in entry.items() if key != "channels"}
+                for entry in self.runs()
+            ]
+        )
+
+    def _append_channel(self, name: str, values: np.ndarray) -> List[int]:
+        values = np.ascontiguousarray(np.ravel(values), dtype=CHANNEL_DTYPE)
+        offset = self._channel_lengths.get(name, 0)
+        with open(self._channel_path(name), "ab") as f:
+            values.tofile(f)
+        self._channel_lengths[name] = offset + len(values)
+        return [offset, len(values)]
+
+    def _channel_path(self, name: str) -> Path:
+        return self.directory / f"{name}{CHANNEL_SUFFIX}"
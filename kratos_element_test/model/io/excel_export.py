@@ -0,0 +1,155 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from openpyxl import Workbook
+
+from kratos_element_test.model.io.result_file import read_results
+
+# The sheets of the Excel export of each test type, one per plot:
+# (y channel, x channel, y label, x label)
+PLOT_MAPPING = {
+    "triaxial": [
+        ("delta_sigma", "yy_strain", "Δσ = |σ1-σ3| (kPa)", "Vertical Strain εyy"),
+        ("vol_strain", "yy_strain", "Volumetric Strain εv", "Vertical Strain εyy"),
+        ("sigma1", "sigma3", "σ1 (kPa)", "σ3 (kPa)"),
+        ("von_mises", "mean_stress", "q (kPa)", "p′ (kPa)"),
+        ("mohr_circle", None, "τ (kPa)", "σ′ (kPa)"),
+    ],
+    "direct_shear": [
+        ("shear_xy_abs", "gamma_xy_abs", "Shear Stress τxy (kPa)", "Shear Strain γxy"),
+        ("sigma1", "sigma3", "σ1 (kPa)", "σ3 (kPa)"),
+        ("von_mises", "mean_stress", "q (kPa)", "p′ (kPa)"),
+        ("mohr_circle", None, "τ (kPa)", "σ′ (kPa)"),
+    ],
+    "crs": [
+        ("sigma_yy", "yy_strain", "σ′yy (kPa)", "Vertical Strain εyy"),
+        ("sigma_yy", "sigma_xx", "σ′yy (kPa)", "σ′xx (kPa)"),
+        ("von_mises", "mean_stress", "q (kPa)", "p′ (kPa)"),
+        ("mohr_circle", None, "τ (kPa)", "σ′ (kPa)"),
+        ("yy_strain", "time_steps", "Vertical Strain εyy", "Time (h)"),
+    ],
+}
+
+
+def _has_values(values) -> bool:
+    return values is not None and np.ndim(values) == 1 and len(values) > 0
+
+
+def sheet_columns(
+    results: Mapping, y_key: str, x_key: Optional[str]
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Returns the x and y values of one plot of PLOT_MAPPING, or None when the
+    results do not hold its channels.
+    """
+    if y_key not in {"delta_sigma", "shear_xy_abs", "mohr_circle"} and x_key not in {
+        "gamma_xy_abs",
+        None,
+    }:
+        if y_key in results and x_key in results:
+            x = results[x_key]
+            y = results[y_key]
+            if _has_values(x) and _has_values(y):
+                n = min(len(x), len(y))
+                return np.asarray(x)[:n], np.asarray(y)[:n]
+        return None
+
+    if y_key == "delta_sigma":
+        s1, s3, yy = (
+            results.get("sigma1"),
+            results.get("sigma3"),
+            results.get("yy_strain"),
+        )
+        if _has_values(s1) and _has_values(s3) and _has_values(yy):
+            ds = np.abs(np.asarray(s1) - np.asarray(s3))
+            n = min(len(ds), len(yy))
+            return np.asarray(yy)[:n], ds[:n]
+        return None
+
+    if x_key == "gamma_xy_abs" and y_key == "shear_xy_abs":
+        exy = results.get("shear_strain_xy")
+        txy = results.get("shear_xy")
+        if _has_values(exy) and _has_values(txy):
+            gamma = 2.0 * np.asarray(exy)
+            tau = np.asarray(txy)
+            return np.abs(gamma), np.abs(tau)
+        return None
+
+    if y_key == "mohr_circle":
+        s1, s3 = results.get("sigma1"), results.get("sigma3")
+        if _has_values(s1) and _has_values(s3):
+            sigma_1 = float(s1[-1])
+            sigma_3 = float(s3[-1])
+            center = 0.5 * (sigma_1 + sigma_3)
+            radius = 0.5 * (sigma_1 - sigma_3)
+            theta = np.linspace(0.0, np.pi, 400)
+            sigma = center + radius * np.cos(theta)
+            tau = -radius * np.sin(theta)
+            return sigma, tau
+        return None
+
+    return None
+
+
+def cell_values(values: np.ndarray) -> list:
+    """
+    Returns the values as a list for the rows of a sheet, with empty cells
+    for NaN and infinite values, which Excel cannot read.
+    """
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values)
+    if finite.all():
+        return values.tolist()
+    return [
+        value if is_finite else None
+        for value, is_finite in zip(values.tolist(), finite)
+    ]
+
+
+def write_excel(results: Mapping, test_type: str, excel_path: Path) -> bool:
+    """
+    Writes the data of every plot of the test type to its own sheet of an
+    Excel workbook. Returns whether any sheet was written. The rows are
+    streamed to the file by a write-only workbook.
+    """
+    if test_type not in PLOT_MAPPING:
+        raise ValueError(f"Unknown test type: {test_type}")
+
+    excel_path = Path(excel_path)
+    excel_path.parent.mkdir(parents=True, exist_ok=True)
+
+    workbook = Workbook(write_only=True)
+    written_any = False
+    for idx, (y_key, x_key, y_label, x_label) in enumerate(
+        PLOT_MAPPING[test_type], start=1
+    ):
+        columns = sheet_columns(results, y_key, x_key)
+        if columns is None:
+            continue
+        sheet = workbook.create_sheet(f"Plot {idx}"[:31])
+        sheet.append([x_label, y_label])
+        for row in zip(*map(cell_values, columns)):
+            sheet.append(row)
+        written_any = True
+    if written_any:
+        workbook.save(excel_path)
+    return written_any
+
+
+def write_excel_from_result_file(
+    result_path: Path, excel_path: Optional[Path] = None
+) -> Path:
+    """
+    Writes the Excel workbook of a result file of write_results, next to it
+    unless an `excel_path` is given. Returns the path of the workbook.
+    """
+    results, metadata = read_results(result_path)
+    excel_path = Path(excel_path or Path(result_path).with_suffix(".xlsx"))
+    write_excel(results, metadata["test_type"], excel_path)
+    return excel_path
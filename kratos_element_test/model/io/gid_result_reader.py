@@ -0,0 +1,185 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ResultRequest:
+    """
+    Selects which values of a result are kept: the values of the first element
+    at `gauss_point_index`. Nodal results use the first node. When
+    `number_of_gauss_points` is given, results on other Gauss point sets are skipped.
+    """
+
+    gauss_point_index: int = 0
+    number_of_gauss_points: Optional[int] = None
+
+
+@dataclass
+class ResultSeries:
+    """
+    The requested values of one result at all times. `values` has one row per time.
+    """
+
+    times: np.ndarray
+    values: np.ndarray
+
+
+@dataclass
+class GiDResultBlock:
+    """
+    A single 'Result' block of a GiD output file. `values` holds the requested
+    row of a wanted result, or None when the block was skipped or is empty.
+    """
+
+    name: str
+    time: float
+    number_of_gauss_points: Optional[int]
+    is_empty: bool
+    values: Optional[List[float]] = None
+
+
+class GrowableRowBuffer:
+    """
+    Row buffer that doubles its preallocated capacity when it is full.
+    """
+
+    def __init__(self, initial_capacity: int = 256):
+        self._data: Optional[np.ndarray] = None
+        self._size = 0
+        self._initial_capacity = initial_capacity
+
+    def append(self, row: List[float]) -> None:
+        if self._data is None:
+            self._data = np.empty((self._initial_capacity, len(row)))
+        elif self._size == len(self._data):
+            self._data = np.resize(
+                self._data, (2 * len(self._data), self._data.shape[1])
+            )
+        self._data[self._size] = row
+        self._size += 1
+
+    def to_array(self, width: int = 0) -> np.ndarray:
+        if self._data is None:
+            return np.empty((0, width))
+        return self._data[: self._size]
+
+
+def _strip_off_quotes(quoted_string: str) -> str:
+    return quoted_string[1:-1] if quoted_string.startswith('"') else quoted_string
+
+
+def iter_gid_result_blocks(
+    gid_output_file_path: Path | str, wanted: Mapping[str, ResultRequest]
+) -> Iterator[GiDResultBlock]:
+    """
+    Scans a GiD ASCII result file once and yields every result block. Only the
+    requested row of the wanted results is converted to floats; the lines of
+    all other blocks are skipped without parsing them.
+    """
+    gauss_point_sizes: Dict[str, int] = {}
+    gauss_points_name = None
+    block = None
+    is_reading_values = False
+    row_to_keep = None
+    line_index = 0
+
+    with open(gid_output_file_path, "r") as result_file:
+        for line in result_file:
+            if is_reading_values:
+                if line.startswith("End Values"):
+                    yield block
+                    block = None
+                    is_reading_values = False
+                    continue
+                if line_index == row_to_keep:
+                    words = line.split()
+                    # The first row of each element or node starts with its id
+                    first_row_of_entity = block.number_of_gauss_points is None or (
+                        line_index % block.number_of_gauss_points == 0
+                    )
+                    block.values = [
+                        float(word)
+                        for word in (words[1:] if first_row_of_entity else words)
+                    ]
+                block.is_empty = False
+                line_index += 1
+                continue
+
+            if line.startswith("Result "):
+                words = line.split()
+                name = _strip_off_quotes(words[1])
+                number_of_gauss_points = None
+                if words[5] == "OnGaussPoints":
+                    number_of_gauss_points = gauss_point_sizes.get(
+                        _strip_off_quotes(words[6])
+                    )
+                block = GiDResultBlock(
+                    name=name,
+                    time=float(words[3]),
+                    number_of_gauss_points=number_of_gauss_points,
+                    is_empty=True,
+                )
+                request = wanted.get(name)
+                row_to_keep = None
+                if request is not None and (
+                    request.number_of_gauss_points is None
+                    or request.number_of_gauss_points == number_of_gauss_points
+                ):
+                    row_to_keep = request.gauss_point_index
+                line_index = 0
+            elif block is not None and line.startswith("Values"):
+                is_reading_values = True
+            elif line.startswith("GaussPoints"):
+                gauss_points_name = _strip_off_quotes(line.split()[1])
+            elif line.startswith("Number Of Gauss Points:") and gauss_points_name:
+                gauss_point_sizes[gauss_points_name] = int(line.split(":")[1])
+            elif line.startswith("End GaussPoints"):
+                gauss_points_name = None
+
+
+def read_gid_results(
+    gid_output_file_path: Path | str, wanted: Mapping[str, ResultRequest]
+) -> Tuple[Dict[str, ResultSeries], np.ndarray]:
+    """
+    Reads the wanted results of a GiD ASCII result file into NumPy arrays.
+
+    Returns the series per wanted result name and the output times. Like
+    GiDOutputFileReader.get_time_steps_from_first_valid_result, the output times
+    are taken from the first result that has values at all of its times.
+    """
+    times = {name: GrowableRowBuffer() for name in wanted}
+    values = {name: GrowableRowBuffer() for name in wanted}
+    header_times: Dict[str, List[float]] = {}
+    has_values_at_all_times: Dict[str, bool] = {}
+
+    for block in iter_gid_result_blocks(gid_output_file_path, wanted):
+        header_times.setdefault(block.name, []).append(block.time)
+        has_values_at_all_times[block.name] = (
+            has_values_at_all_times.get(block.name, True) and not block.is_empty
+        )
+        if block.values is not None:
+            times[block.name].append([block.time])
+            values[block.name].append(block.values)
+
+    series = {
+        name: ResultSeries(
+            times=times[name].to_array(width=1)[:, 0], values=values[name].to_array()
+        )
+        for name in wanted
+    }
+    time_steps = next(
+        (
+            np.asarray(header_times[name], dtype=float)
+            for name in header_times
+            if has_values_at_all_times[name]
+        ),
+        np.empty(0),
+    )
+    return series, time_steps
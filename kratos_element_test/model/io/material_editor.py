@@ -45,12 +45,13 @@ class MaterialEditor:
                 value_str = [str(x).strip() for x in entry]
                 value = [self._convert_type(x) for x in value_str]
             variables[key] = value
-        self.save()
 
     def set_constitutive_law(self, law_name: str):
         self.data["properties"][0]["Material"]["constitutive_law"]["name"] = law_name
-        self.save()
 
-    def save(self):
-        with open(self.json_path, "w") as f:
+    def save(self, path=None):
+        """
+        Writes the edited material to `path`, or back to the file it was read from.
+        """
+        with open(path or self.json_path, "w") as f:
             json.dump(self.data, f, indent=4)
@@ -5,6 +5,8 @@
 import re
 from kratos_element_test.model.core_utils import _fallback_log
 
+PLACEHOLDER_PATTERN = re.compile(r"\$(\w+)\b")
+
 
 class MdpaEditor:
     def __init__(self, mdpa_path, logger=None):
@@ -27,75 +29,75 @@ class MdpaEditor:
                 self.raw_text = f.read()
         except FileNotFoundError:
             raise RuntimeError(f"File not found: {self.mdpa_path}")
+        # Placeholder name -> (replacement, warning when the placeholder is missing)
+        self._substitutions = {}
 
-    def save(self):
-        with open(self.mdpa_path, "w") as f:
+    def save(self, path=None):
+        """
+        Renders the pending substitutions and writes the mdpa to `path`, or back
+        to the file it was read from.
+        """
+        self.render()
+        with open(path or self.mdpa_path, "w") as f:
             f.write(self.raw_text)
 
-    def _replacer_factory(self, variable_value):
+    def render(self):
+        """
+        Replaces all pending placeholders in a single pass over the text.
+        """
+        if not self._substitutions:
+            return
+
+        counts = dict.fromkeys(self._substitutions, 0)
+
         def replacer(match):
-            return f"{variable_value:.4f}"
+            name = match.group(1)
+            if name not in self._substitutions:
+                return match.group(0)
+            counts[name] += 1
+            return self._substitutions[name][0]
+
+        self.raw_text = PLACEHOLDER_PATTERN.sub(replacer, self.raw_text)
+        for name, count in counts.items():
+            if count == 0:
+                self._log(self._substitutions[name][1], "warn")
+        self._substitutions = {}
 
-        return replacer
+    def _substitute(self, placeholder, replacement, warning):
+        self._substitutions[placeholder] = (replacement, warning)
 
     def update_maximum_strain(self, maximum_strain):
-        pattern = r"\$maximum_strain\b"
         prescribed_displacement = -maximum_strain / 100
-
-        replacer = self._replacer_factory(prescribed_displacement)
-        new_text, count = re.subn(pattern, replacer, self.raw_text)
-        if count == 0:
-            self._log("Could not update maximum strain.", "warn")
-        else:
-            self.raw_text = new_text
-            self.save()
+        self._substitute(
+            "maximum_strain",
+            f"{prescribed_displacement:.4f}",
+            "Could not update maximum strain.",
+        )
 
     def update_initial_effective_cell_pressure(self, initial_effective_cell_pressure):
-        pattern = r"\$initial_effective_cell_pressure\b"
-
-        replacer = self._replacer_factory(initial_effective_cell_pressure)
-        new_text, count = re.subn(pattern, replacer, self.raw_text)
-        if count == 0:
-            self._log("Could not update initial effective cell pressure.", "warn")
-        else:
-            self.raw_text = new_text
-            self.save()
+        self._substitute(
+            "initial_effective_cell_pressure",
+            f"{initial_effective_cell_pressure:.4f}",
+            "Could not update initial effective cell pressure.",
+        )
 
     def update_first_timestep(self, first_timestep):
-
-        pattern = r"\$first_timestep\b"
-
-        replacer = self._replacer_factory(first_timestep)
-        new_text, count = re.subn(pattern, replacer, self.raw_text)
-        if count == 0:
-            self._log("Could not apply the first time step.", "warn")
-        else:
-            self.raw_text = new_text
-            self.save()
+        self._substitute(
+            "first_timestep",
+            f"{first_timestep:.4f}",
+            "Could not apply the first time step.",
+        )
 
     def update_end_time(self, end_time):
-        pattern = r"\$end_time\b"
-        replacement = str(end_time)
-
-        new_text, count = re.subn(pattern, replacement, self.raw_text)
-
-        if count == 0:
-            self._log("Could not update the end time.", "warn")
-        else:
-            self.raw_text = new_text
-            self.save()
+        self._substitute("end_time", str(end_time), "Could not update the end time.")
 
     def update_middle_maximum_strain(self, maximum_strain):
-        pattern = r"\$middle_maximum_strain\b"
         prescribed_middle_displacement = (-maximum_strain / 2) / 100
-
-        replacer = self._replacer_factory(prescribed_middle_displacement)
-        new_text, count = re.subn(pattern, replacer, self.raw_text)
-        if count == 0:
-            self._log("Could not update middle maximum strain.", "warn")
-        else:
-            self.raw_text = new_text
-            self.save()
+        self._substitute(
+            "middle_maximum_strain",
+            f"{prescribed_middle_displacement:.4f}",
+            "Could not update middle maximum strain.",
+        )
 
     def insert_displacement_tables(self, durations: list[float], strains: list[float]):
         """
@@ -128,7 +130,6 @@ class MdpaEditor:
 
         table_block = "\n".join(tables) + "\n\n"
         self.raw_text = table_block + self.raw_text
-        self.save()
 
     def update_top_displacement_tables(self, num_tables: int):
         """
@@ -155,4 +156,3 @@ class MdpaEditor:
             )
         else:
             self.raw_text = updated_text
-            self.save()
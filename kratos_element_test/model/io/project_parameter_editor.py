@@ -2,7 +2,6 @@
 # This is a prototype version
 # Contact kratos@deltares.nl
 
-import re
 import json
 from kratos_element_test.model.core_utils import _fallback_log
 
@@ -24,30 +23,38 @@ class ProjectParameterEditor:
         self.json_path = json_path
         self._log = logger or _fallback_log
         with open(self.json_path, "r") as f:
-            self.raw_text = f.read()
+            self.data = self._load_json(f.read())
 
-    def _write_back(self):
-        with open(self.json_path, "w") as f:
-            f.write(self.raw_text)
+    def save(self, path=None):
+        """
+        Writes the edited parameters to `path`, or back to the file they were read from.
+        """
+        with open(path or self.json_path, "w") as f:
+            json.dump(self.data, f, indent=4)
 
-    def _load_json(self):
+    @staticmethod
+    def _load_json(raw_text):
         try:
-            return json.loads(self.raw_text)
+            return json.loads(raw_text)
         except json.JSONDecodeError:
             raise RuntimeError("Invalid JSON structure.")
 
+    @property
+    def has_stages(self) -> bool:
+        return "stages" in self.data
+
+    @property
+    def number_of_stages(self) -> int:
+        return len(self.data.get("stages", {}))
+
     def update_nested_value(self, module_name, key, new_list):
         try:
-            data = json.loads(self.raw_text)
-
-            loads_list = data.get("processes", {}).get("loads_process_list", [])
+            loads_list = self.data.get("processes", {}).get("loads_process_list", [])
             for process in loads_list:
                 if process.get("python_module") == module_name and key in process.get(
                     "Parameters", {}
                 ):
                     process["Parameters"][key] = new_list
-                    self.raw_text = json.dumps(data, indent=4)
-                    self._write_back()
                     return
 
             self._log(f"Could not find '{key}' under '{module_name}'.", "warn")
@@ -58,9 +65,10 @@ class ProjectParameterEditor:
             ) from e
 
     def update_property(self, property_name, new_value):
-        pattern = rf'("{property_name}"\s*:\s*)([0-9eE+\.\-]+)'
-        replacement = rf"\g<1>{new_value}"
-        self.raw_text, count = re.subn(pattern, replacement, self.raw_text)
+        """
+        Sets every numeric value named `property_name`, at any depth, to `new_value`.
+        """
+        count = self._update_numeric_values(self.data, property_name, new_value)
         if count == 0:
             self._log(f"Could not find '{property_name}' to update.", "warn")
         elif count > 1:
@@ -68,7 +76,25 @@ class ProjectParameterEditor:
                 f"Multiple occurrences of '{property_name}' found. Updated all {count}.",
                 "warn",
             )
-        self._write_back()
+
+    @classmethod
+    def _update_numeric_values(cls, node, property_name, new_value) -> int:
+        count = 0
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if (
+                    key == property_name
+                    and isinstance(value, (int, float))
+                    and not isinstance(value, bool)
+                ):
+                    node[key] = new_value
+                    count += 1
+                else:
+                    count += cls._update_numeric_values(value, property_name, new_value)
+        elif isinstance(node, list):
+            for item in node:
+                count += cls._update_numeric_values(item, property_name, new_value)
+        return count
 
     def update_stage_timings(
         self, end_times: list[float], step_counts: list[int], start_time: float = 0.0
@@ -80,7 +106,7 @@ class ProjectParameterEditor:
         start_time: The start time of the first stage (default is 0.0).
         """
         try:
-            data = self._load_json()
+            data = self.data
 
             stage_names = list(data["stages"].keys())
 
@@ -104,9 +130,6 @@ class ProjectParameterEditor:
                 )
                 start_time = end_time
 
-            self.raw_text = json.dumps(data, indent=4)
-            self._write_back()
-
         except Exception as e:
             raise RuntimeError(f"Failed to update staged timings: {e}") from e
 
@@ -115,7 +138,7 @@ class ProjectParameterEditor:
         Appends a new stage by copying the structure of the last existing stage.
         It automatically sets the correct start_time, end_time, and time_step.
         """
-        data = self._load_json()
+        data = self.data
 
         stage_names = list(data["stages"].keys())
 
@@ -145,10 +168,34 @@ class ProjectParameterEditor:
         data["stages"][new_stage_key] = new_stage
         data["orchestrator"]["settings"]["execution_list"].append(new_stage_key)
 
-        self.raw_text = json.dumps(data, indent=4)
-        self._write_back()
         self._log(f"Appended a new stage: {new_stage_key}", "info")
 
+    def add_output_process(
+        self, name: str, settings_factory, keep_gid_output: bool = True
+    ) -> None:
+        """
+        Adds an output process to the analysis, or to every stage of a staged
+        analysis. `settings_factory` receives the model part name of the GiD
+        output and returns the settings of the new process.
+        """
+        data = self.data
+        if "stages" in data:
+            analyses = [stage["stage_settings"] for stage in data["stages"].values()]
+        else:
+            analyses = [data]
+
+        for analysis in analyses:
+            output_processes = analysis.setdefault("output_processes", {})
+            gid_outputs = output_processes.get("gid_output", [])
+            model_part_name = (
+                gid_outputs[0]["Parameters"]["model_part_name"]
+                if gid_outputs
+                else "PorousDomain.porous_computational_model_part"
+            )
+            output_processes[name] = [settings_factory(model_part_name)]
+            if not keep_gid_output:
+                output_processes.pop("gid_output", None)
+
     def update_top_displacement_table_numbers(self):
         """
         Updates the 'table' field in each stage for 'PorousDomain.top_displacement'
@@ -156,7 +203,7 @@ class ProjectParameterEditor:
         Only applies for multi-stage tests.
         """
         try:
-            data = self._load_json()
+            data = self.data
             stage_names = list(data["stages"].keys())
 
             for i, stage_name in enumerate(stage_names):
@@ -175,9 +222,6 @@ class ProjectParameterEditor:
                     ):
                         process["Parameters"]["table"] = table_index_list
 
-            self.raw_text = json.dumps(data, indent=4)
-            self._write_back()
-
         except Exception as e:
             self._log(f"[ERROR] Exception: {e}", "error")
             raise
@@ -0,0 +1,207 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+import re
+import zipfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from kratos_element_test.model.simulation_results import SimulationResults
+
+NPZ_SUFFIX = ".npz"
+PARQUET_SUFFIX = ".parquet"
+RESULT_FILE_SUFFIXES = (NPZ_SUFFIX, PARQUET_SUFFIX)
+
+# The scalar results and the metadata of the run are stored as JSON, in an
+# NPZ entry or in the key-value metadata of the Parquet schema
+METADATA_KEY = "kratos_element_test"
+
+_ZIP_LOCAL_HEADER_SIZE = 30
+_ZIP_NAME_LENGTH_OFFSET = 26
+_ARRAY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+
+def safe_file_name(name: str) -> str:
+    """
+    Returns the name of a run with every character that is not safe in a file
+    name replaced by an underscore.
+    """
+    return re.sub(r"[^\w\-.]+", "_", name).strip("_") or "run"
+
+
+def run_metadata(
+    test_inputs, material_inputs, results: SimulationResults, **metadata: Any
+) -> Dict[str, Any]:
+    """
+    Returns the metadata of a run to store with its results: the test and
+    material inputs, the phase timings and the given `metadata`.
+    """
+    return {
+        "test_type": test_inputs.test_type,
+        "test_inputs": asdict(test_inputs),
+        "material_inputs": asdict(material_inputs),
+        "phase_timings_in_seconds": (
+            results.timings.totals() if results.timings is not None else None
+        ),
+        **metadata,
+    }
+
+
+def write_results(
+    path: Path, results: SimulationResults, compress: bool = False, **metadata: Any
+) -> Path:
+    """
+    Writes all channels of `results` to an NPZ or Parquet file, depending on
+    the suffix of `path`, together with the scalar results and `metadata`
+    (e.g. the test and material inputs and the timings of the run). An
+    uncompressed NPZ file can be read back memory-mapped; `compress` trades
+    that for a smaller file. Parquet files need pyarrow.
+    """
+    path = Path(path)
+    header = {
+        "scalars": {
+            name: results[name] for name in results if name not in results.channel_names
+        },
+        "metadata": metadata,
+    }
+    serialized_header = json.dumps(header, default=str)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix == NPZ_SUFFIX:
+        save = np.savez_compressed if compress else np.savez
+        save(
+            path,
+            **{name: results.channel(name) for name in results.channel_names},
+            **{METADATA_KEY: np.array(serialized_header)},
+        )
+    elif path.suffix == PARQUET_SUFFIX:
+        _write_parquet(path, results, serialized_header, compress)
+    else:
+        raise ValueError(
+            f"Unsupported result file: {path.name}. "
+            f"Expected one of {', '.join(RESULT_FILE_SUFFIXES)}."
+        )
+    return path
+
+
+def read_results(path: Path) -> Tuple[SimulationResults, Dict[str, Any]]:
+    """
+    Reads a file of write_results and returns the results and the metadata.
+    The channels of uncompressed NPZ files are memory-mapped rather than
+    copied, so reading only touches the data that is used. Parquet files are
+    read through a memory map by pyarrow.
+    """
+    path = Path(path)
+    if path.suffix == NPZ_SUFFIX:
+        channels, serialized_header = _read_npz(path)
+    elif path.suffix == PARQUET_SUFFIX:
+        channels, serialized_header = _read_parquet(path)
+    else:
+        raise ValueError(
+            f"Unsupported result file: {path.name}. "
+            f"Expected one of {', '.join(RESULT_FILE_SUFFIXES)}."
+        )
+
+    header = json.loads(serialized_header)
+    results = SimulationResults({**channels, **header["scalars"]}, copy=False)
+    return results, header["metadata"]
+
+
+def _read_npz(path: Path) -> Tuple[Dict[str, np.ndarray], str]:
+    channels = {}
+    serialized_header = None
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            name = info.filename[: -len(".npy")]
+            if name == METADATA_KEY:
+                with archive.open(info) as member:
+                    serialized_header = str(np.lib.format.read_array(member))
+            else:
+                channel = None
+                if info.compress_type == zipfile.ZIP_STORED:
+                    channel = _memory_map_member(f, info)
+                if channel is None:
+                    with archive.open(info) as member:
+                        channel = np.lib.format.read_array(member)
+                channels[name] = channel
+    if serialized_header is None:
+        raise ValueError(f"{path.name} is not a result file.")
+    return channels, serialized_header
+
+
+def _memory_map_member(f, info: zipfile.ZipInfo) -> Optional[np.ndarray]:
+    """
+    Returns the array of an uncompressed NPZ entry memory-mapped, or None
+    when it cannot be mapped.
+    """
+    # The array follows the local file header of the entry, whose name and
+    # extra field lengths can differ from those in the central directory
+    f.seek(info.header_offset + _ZIP_NAME_LENGTH_OFFSET)
+    name_length = int.from_bytes(f.read(2), "little")
+    extra_length = int.from_bytes(f.read(2), "little")
+    f.seek(info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length)
+
+    read_array_header = _ARRAY_HEADER_READERS.get(np.lib.format.read_magic(f))
+    if read_array_header is None:
+        return None
+    shape, fortran_order, dtype = read_array_header(f)
+    if dtype.hasobject or int(np.prod(shape)) == 0:
+        return None
+    return np.memmap(
+        f.name,
+        dtype=dtype,
+        mode="r",
+        offset=f.tell(),
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet result files need pyarrow (pip install pyarrow); "
+            "use an .npz file instead."
+        ) from e
+    return pyarrow
+
+
+def _write_parquet(
+    path: Path, results: SimulationResults, serialized_header: str, compress: bool
+) -> None:
+    pyarrow = _import_pyarrow()
+    lengths = {len(results.channel(name)) for name in results.channel_names}
+    if len(lengths) > 1:
+        raise ValueError(
+            "Parquet result files need channels of equal length; "
+            "use an .npz file instead."
+        )
+    table = pyarrow.table(
+        {name: results.channel(name) for name in results.channel_names}
+    ).replace_schema_metadata({METADATA_KEY: serialized_header})
+    pyarrow.parquet.write_table(table, path, compression="zstd" if compress else "none")
+
+
+def _read_parquet(path: Path) -> Tuple[Dict[str, np.ndarray], str]:
+    pyarrow = _import_pyarrow()
+    table = pyarrow.parquet.read_table(path, memory_map=True)
+    metadata = table.schema.metadata or {}
+    serialized_header = metadata.get(METADATA_KEY.encode("utf-8"))
+    if serialized_header is None:
+        raise ValueError(f"{path.name} is not a result file.")
+    channels = {
+        name: table.column(name).combine_chunks().to_numpy(zero_copy_only=False)
+        for name in table.column_names
+    }
+    return channels, serialized_header.decode("utf-8")
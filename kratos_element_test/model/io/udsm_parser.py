@@ -4,7 +4,6 @@
 
 import re
 import ctypes
-import pefile
 
 
 def clean_c_buffer(char_buffer):
@@ -19,6 +18,9 @@ def clean_c_buffer(char_buffer):
 
 
 def find_symbol_in_dll(dll_path, dll_lib, symbol_name):
+    # Imported here, so pefile is only loaded when a UDSM is loaded
+    import pefile
+
     try:
         pe = pefile.PE(dll_path)
         symbol_name_lower = symbol_name.lower()
@@ -0,0 +1,218 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import copy
+import json
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Dict, List
+
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    MohrCoulombOptions,
+    Parameter,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    StrainIncrement,
+    TriaxialAndShearSimulationInputs,
+)
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+MATERIAL_TYPES = ("linear_elastic", "mohr_coulomb", "udsm")
+
+
+@dataclass
+class JobRun:
+    name: str
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    )
+
+
+@dataclass
+class JobSpec:
+    runs: List[JobRun] = field(default_factory=list)
+    output_directory: Path | None = None
+
+
+def load_job_spec(spec_path: Path) -> JobSpec:
+    """
+    Reads a batch job specification from a JSON or TOML file.
+
+    The file holds an optional ``output_directory``, an optional ``defaults``
+    table with ``test`` and ``material`` entries that are merged into every run,
+    and a ``runs`` list. Each run has a ``name``, a ``test`` table with the
+    fields of the test input dataclasses and a ``material`` table with a
+    ``type`` (one of ``MATERIAL_TYPES``) and its ``parameters``.
+    """
+    spec_path = Path(spec_path)
+    if spec_path.suffix.lower() == ".toml":
+        if tomllib is None:
+            raise RuntimeError("Reading TOML job specs requires Python 3.11 or newer.")
+        with open(spec_path, "rb") as f:
+            raw_spec = tomllib.load(f)
+    else:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            raw_spec = json.load(f)
+
+    job_spec = parse_job_spec(raw_spec, spec_directory=spec_path.parent)
+    if job_spec.output_directory is not None:
+        job_spec.output_directory = spec_path.parent / job_spec.output_directory
+    return job_spec
+
+
+def parse_job_spec(raw_spec: Dict, spec_directory: Path | None = None) -> JobSpec:
+    """
+    Builds the runs of a job spec. Relative paths in the spec (the
+    ``dll_path`` of a UDSM material) are relative to `spec_directory`, or to
+    the current directory when it is not given.
+    """
+    if not isinstance(raw_spec, dict) or not raw_spec.get("runs"):
+        raise ValueError("A job spec needs a non-empty 'runs' list.")
+
+    defaults = raw_spec.get("defaults", {})
+    runs = []
+    for index, raw_run in enumerate(raw_spec["runs"], start=1):
+        name = str(raw_run.get("name", f"run_{index:04d}"))
+        test_entry = _merged(defaults.get("test", {}), raw_run.get("test", {}))
+        material_entry = _merged(
+            defaults.get("material", {}), raw_run.get("material", {})
+        )
+        try:
+            runs.append(
+                JobRun(
+                    name=name,
+                    test_inputs=build_test_inputs(test_entry),
+                    material_inputs=build_material_inputs(
+                        material_entry, spec_directory
+                    ),
+                )
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid job spec entry '{name}': {e}") from e
+
+    output_directory = raw_spec.get("output_directory")
+    return JobSpec(
+        runs=runs,
+        output_directory=Path(output_directory) if output_directory else None,
+    )
+
+
+def build_test_inputs(
+    entry: Dict,
+) -> TriaxialAndShearSimulationInputs | CRSSimulationInputs:
+    entry = dict(entry)
+    test_type = entry.pop("test_type", None)
+    if test_type is None:
+        raise ValueError("Missing 'test_type'.")
+
+    if test_type == "crs":
+        increments = [
+            StrainIncrement(**_known_fields(StrainIncrement, increment))
+            for increment in entry.pop("strain_increments", [])
+        ]
+        test_inputs = CRSSimulationInputs(
+            test_type=test_type, **_known_fields(CRSSimulationInputs, entry)
+        )
+        if increments:
+            test_inputs.strain_increments = increments
+        test_inputs.update_totals()
+    else:
+        test_inputs = TriaxialAndShearSimulationInputs(
+            test_type=test_type,
+            **_known_fields(TriaxialAndShearSimulationInputs, entry),
+        )
+
+    test_inputs.validate()
+    return test_inputs
+
+
+def build_material_inputs(
+    entry: Dict,
+    spec_directory: Path | None = None,
+) -> LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs:
+    material_type = entry.get("type")
+    if material_type not in MATERIAL_TYPES:
+        raise ValueError(
+            f"Material type must be one of {MATERIAL_TYPES}, but got {material_type}."
+        )
+
+    if material_type == "udsm":
+        return _build_udsm_material_inputs(entry, spec_directory)
+
+    material_inputs = (
+        LinearElasticMaterialInputs()
+        if material_type == "linear_elastic"
+        else MohrCoulombMaterialInputs()
+    )
+    for key, value in entry.get("parameters", {}).items():
+        if key not in material_inputs.user_defined_parameters:
+            raise KeyError(
+                f"This material parameter ({key}) is not available for the material type ({material_type})"
+            )
+        material_inputs.user_defined_parameters[key].value = float(value)
+    return material_inputs
+
+
+def _build_udsm_material_inputs(
+    entry: Dict, spec_directory: Path | None
+) -> UDSMMaterialInputs:
+    dll_path = entry.get("dll_path")
+    if not dll_path:
+        raise ValueError("A UDSM material needs a 'dll_path'.")
+    dll_path = Path(dll_path)
+    if spec_directory is not None and not dll_path.is_absolute():
+        dll_path = Path(spec_directory) / dll_path
+
+    material_inputs = UDSMMaterialInputs()
+    material_inputs.model_name = entry.get("model_name", "")
+    material_inputs.material_parameters["UDSM_NAME"] = str(dll_path.resolve())
+    material_inputs.material_parameters["UDSM_NUMBER"] = int(
+        entry.get("udsm_number", 1)
+    )
+
+    user_defined_parameters = {}
+    for name, value in entry.get("parameters", {}).items():
+        if isinstance(value, dict):
+            user_defined_parameters[name] = Parameter(
+                value=float(value["value"]), unit=value.get("unit", "-")
+            )
+        else:
+            user_defined_parameters[name] = Parameter(value=float(value))
+    material_inputs.user_defined_parameters = user_defined_parameters
+
+    options = entry.get("mohr_coulomb_options")
+    if options is not None:
+        material_inputs.mohr_coulomb_options = MohrCoulombOptions(
+            **_known_fields(MohrCoulombOptions, options)
+        )
+    return material_inputs
+
+
+def _merged(defaults: Dict, overrides: Dict) -> Dict:
+    merged = copy.deepcopy(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merged(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def _known_fields(dataclass_type, entry: Dict) -> Dict:
+    names = {f.name for f in fields(dataclass_type)}
+    unknown = set(entry) - names
+    if unknown:
+        raise KeyError(
+            f"Unknown field(s) {sorted(unknown)} for {dataclass_type.__name__}"
+        )
+    return dict(entry)
@@ -1,26 +1,134 @@
+import time
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional, Sequence
 
+from kratos_element_test.model.calibration.calibrator import (
+    CalibrationParameter,
+    CalibrationResult,
+    Calibrator,
+    build_calibration_targets,
+)
+from kratos_element_test.model.calibration.optimizers import DIFFERENTIAL_EVOLUTION
+from kratos_element_test.model.io.result_file import run_metadata, write_results
+from kratos_element_test.model.material_input_data_utils import get_cohesion_and_phi
 from kratos_element_test.model.material_input_manager import MaterialInputManager
-from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+from kratos_element_test.model.models import (
+    ANALYTICAL,
+    FAILED,
+    FINITE_ELEMENT,
+    TYPE_TO_TEST_NAME,
+    validate_execution_mode,
+)
+from kratos_element_test.model.pipeline.progress import (
+    PartialResults,
+    SimulationProgress,
+)
+from kratos_element_test.model.pipeline.simulation_factory import (
+    create_simulation,
+    solution_method,
+)
+from kratos_element_test.model.pipeline.simulation_run import (
+    CancellationToken,
+    SimulationCancelled,
+    SimulationRun,
+)
+from kratos_element_test.model.pipeline.triaxial_series_runner import (
+    TriaxialSeriesResult,
+    TriaxialSeriesRunner,
+)
+from kratos_element_test.model.pipeline.warm_worker import WarmWorker
+from kratos_element_test.model.result_cache import ResultCache
 from kratos_element_test.model.result_manager import ResultManager
+from kratos_element_test.model.run_archive import ArchivedRun, RunArchive
+from kratos_element_test.model.simulation_results import SimulationResults
 from kratos_element_test.model.soil_test_input_manager import SoilTestInputManager
 
 
 class MainModel:
-    def __init__(self, logger: Callable[[str, str], None]):
+    def __init__(
+        self,
+        logger: Callable[[str, str], None],
+        worker: Optional[WarmWorker] = None,
+        result_cache: Optional[ResultCache] = None,
+        execution_mode: str = FINITE_ELEMENT,
+        force_finite_element: bool = False,
+        timeout_in_seconds: Optional[float] = None,
+        run_archive: Optional[RunArchive] = None,
+    ):
+        validate_execution_mode(execution_mode)
         self._logger = logger
+        self._worker = worker
+        self._result_cache = result_cache
+        self._run_archive = run_archive
+        self._execution_mode = execution_mode
+        self._force_finite_element = force_finite_element
+        self._timeout_in_seconds = timeout_in_seconds
         self._material_input_manager = MaterialInputManager()
         self._soil_test_input_manager = SoilTestInputManager()
         self._result_manager = ResultManager(
             self._soil_test_input_manager.get_current_test_type
         )
 
+    def get_execution_mode(self) -> str:
+        return self._execution_mode
+
+    def set_execution_mode(self, execution_mode: str) -> None:
+        validate_execution_mode(execution_mode)
+        self._execution_mode = execution_mode
+
+    def get_force_finite_element(self) -> bool:
+        return self._force_finite_element
+
+    def set_force_finite_element(self, force_finite_element: bool) -> None:
+        self._force_finite_element = force_finite_element
+
+    def get_timeout_in_seconds(self) -> Optional[float]:
+        return self._timeout_in_seconds
+
+    def set_timeout_in_seconds(self, timeout_in_seconds: Optional[float]) -> None:
+        """
+        Sets the wall-clock time after which started runs are stopped, or None
+        to let them run until they finish.
+        """
+        if timeout_in_seconds is not None and timeout_in_seconds <= 0:
+            raise ValueError("The timeout must be positive.")
+        self._timeout_in_seconds = timeout_in_seconds
+
     def get_current_test_type(self) -> str:
         return self._soil_test_input_manager.get_current_test_type()
 
-    def run_simulation(self) -> None:
+    def start_simulation(
+        self,
+        progress_callback: Optional[
+            Callable[[SimulationProgress, SimulationResults], None]
+        ] = None,
+        on_finished: Optional[Callable[[SimulationRun], None]] = None,
+        timeout_in_seconds: Optional[float] = None,
+    ) -> SimulationRun:
+        """
+        Runs the current test on a background thread and returns a handle to
+        cancel the run or wait for it. Without a `timeout_in_seconds`, the
+        timeout of the model applies.
+        """
+        return SimulationRun(
+            lambda cancellation: self.run_simulation(progress_callback, cancellation),
+            timeout_in_seconds=timeout_in_seconds or self._timeout_in_seconds,
+            on_finished=on_finished,
+        ).start()
 
+    def run_simulation(
+        self,
+        progress_callback: Optional[
+            Callable[[SimulationProgress, SimulationResults], None]
+        ] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> None:
+        """
+        Runs the current test. While a finite element run progresses,
+        `progress_callback` gets the progress and the results so far. The run
+        stops with SimulationCancelled when `cancellation` is cancelled or
+        times out; the run state of the test type then tells which.
+        """
         inputs = self._soil_test_input_manager.get_current_test_inputs()
         try:
             inputs.validate()
@@ -28,18 +136,174 @@ class MainModel:
             self._logger("Calculation stopped due to invalid input.", "error")
             raise
 
-        sim = RunSimulation(
-            test_inputs=inputs,
-            material_inputs=self._material_input_manager.get_current_material_inputs(),
+        material_inputs = self._material_input_manager.get_current_material_inputs()
+        method = solution_method(
+            material_inputs, self._execution_mode, self._force_finite_element
+        )
+
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._result_cache.key(inputs, material_inputs, method)
+            results = self._result_cache.get(cache_key)
+            if results is not None:
+                self._logger("Loaded results of an identical earlier run.", "info")
+                self._result_manager.set_results_of_active_test_type(results)
+                return
+
+        start = time.perf_counter()
+        try:
+            results = self._run(
+                inputs, material_inputs, method, progress_callback, cancellation
+            )
+        except SimulationCancelled as e:
+            self._logger(str(e), "warn")
+            self._result_manager.set_run_state_of_active_test_type(e.state)
+            raise
+        except Exception:
+            self._result_manager.set_run_state_of_active_test_type(FAILED)
+            raise
+
+        if cache_key is not None:
+            self._result_cache.put(cache_key, results)
+        if self._run_archive is not None:
+            self._run_archive.add(
+                inputs,
+                material_inputs,
+                results,
+                method,
+                run_time_in_seconds=time.perf_counter() - start,
+            )
+        self._result_manager.set_results_of_active_test_type(results)
+
+    def _run(
+        self, inputs, material_inputs, method, progress_callback, cancellation
+    ) -> SimulationResults:
+        report_progress = None
+        if progress_callback is not None:
+            partial_results = PartialResults(*get_cohesion_and_phi(material_inputs))
+
+            def report_progress(progress: SimulationProgress) -> None:
+                partial_results.add(progress)
+                progress_callback(progress, partial_results.to_results())
+
+        # The analytical solution does not need Kratos, so it is not worth a
+        # round trip to the worker process
+        if self._worker is not None and method != ANALYTICAL:
+            results = self._worker.run(
+                inputs,
+                material_inputs,
+                self._execution_mode,
+                self._force_finite_element,
+                progress_callback=report_progress,
+                cancellation=cancellation,
+            )
+        else:
+            sim = create_simulation(
+                test_inputs=inputs,
+                material_inputs=material_inputs,
+                logger=self._logger,
+                execution_mode=self._execution_mode,
+                force_finite_element=self._force_finite_element,
+                progress_callback=report_progress,
+                cancellation=cancellation,
+            )
+            sim.run()
+            results = sim.post_process_results()
+        return results
+
+    def calibrate(
+        self,
+        parameters: List[CalibrationParameter],
+        method: str = DIFFERENTIAL_EVOLUTION,
+        max_evaluations: int = 200,
+        workers: int = 1,
+        weights: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> CalibrationResult:
+        """
+        Fits the parameters of the current material to all imported lab
+        results, using the current inputs of their test types. The material
+        inputs themselves are not changed.
+        """
+        experimental_by_test = self._result_manager.get_all_experimental_results()
+        if not experimental_by_test:
+            raise ValueError("Import lab results before calibrating.")
+
+        targets = build_calibration_targets(
+            experimental_by_test,
+            self._soil_test_input_manager.input_data,
+            weights,
+        )
+        for target in targets:
+            target.test_inputs.validate()
+        calibrator = Calibrator(
+            self._material_input_manager.get_current_material_inputs(),
+            parameters,
+            targets,
             logger=self._logger,
+            workers=workers,
+            execution_mode=self._execution_mode,
+            force_finite_element=self._force_finite_element,
+        )
+        return calibrator.run(method=method, max_evaluations=max_evaluations)
+
+    def run_triaxial_series(
+        self, cell_pressures: Sequence[float], workers: Optional[int] = None
+    ) -> TriaxialSeriesResult:
+        """
+        Runs the current triaxial test at each of the cell pressures
+        concurrently and fits c' and φ' to the Mohr circles at failure.
+        """
+        return TriaxialSeriesRunner(
+            self._soil_test_input_manager.get_triaxial_inputs(),
+            self._material_input_manager.get_current_material_inputs(),
+            cell_pressures,
+            logger=self._logger,
+            workers=workers,
+            execution_mode=self._execution_mode,
+            force_finite_element=self._force_finite_element,
+        ).run()
+
+    def shutdown(self) -> None:
+        if self._worker is not None:
+            self._worker.shutdown()
+
+    def get_result_cache(self) -> Optional[ResultCache]:
+        return self._result_cache
+
+    def get_run_archive(self) -> Optional[RunArchive]:
+        return self._run_archive
+
+    def show_archived_run(self, run: ArchivedRun) -> None:
+        """
+        Makes the test type of an archived run the current one and shows its
+        results, without running the test again.
+        """
+        self._soil_test_input_manager.set_current_test_type(
+            TYPE_TO_TEST_NAME[run.test_type]
         )
+        self._result_manager.set_results_of_active_test_type(run.results)
 
-        sim.run()
-        self._result_manager.set_results_of_active_test_type(
-            sim.post_process_results(),
+    def save_latest_results(self, path: Path, compress: bool = False) -> Path:
+        """
+        Writes the latest results of the current test to an NPZ or Parquet
+        file, with the current test and material inputs as metadata.
+        """
+        results = self.get_latest_results()
+        if results is None:
+            raise ValueError("No results available for export")
+        return write_results(
+            path,
+            results,
+            compress=compress,
+            **run_metadata(
+                self._soil_test_input_manager.get_current_test_inputs(),
+                self._material_input_manager.get_current_material_inputs(),
+                results,
+                execution_mode=self._execution_mode,
+            ),
         )
 
-    def get_latest_results(self) -> Dict[str, List[float]]:
+    def get_latest_results(self) -> Optional[SimulationResults]:
         return self._result_manager.get_results_of_active_test_type()
 
     def get_result_manager(self) -> ResultManager:
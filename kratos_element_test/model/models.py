@@ -3,7 +3,48 @@
 # Contact kratos@deltares.nl
 
 from dataclasses import dataclass, field
-from kratos_element_test.view.ui_constants import VALID_TEST_TYPES
+from kratos_element_test.model.core_utils import hours_to_seconds
+
+# General test types, by the names shown to the user
+TRIAXIAL = "Triaxial"
+DIRECT_SHEAR = "Direct Simple Shear"
+CRS = "CRS"
+
+TEST_NAME_TO_TYPE = {
+    TRIAXIAL: "triaxial",
+    DIRECT_SHEAR: "direct_shear",
+    CRS: "crs",
+}
+TYPE_TO_TEST_NAME = {v: k for k, v in TEST_NAME_TO_TYPE.items()}
+
+# Valid test types
+VALID_TEST_TYPES: tuple[str, ...] = tuple(TEST_NAME_TO_TYPE.values())
+
+# Valid drainage types
+VALID_DRAINAGE_TYPES: tuple[str, ...] = ("drained", "undrained")
+
+# Run the finite element model of the templates, or drive the constitutive law
+# of a single material point directly
+FINITE_ELEMENT = "finite_element"
+MATERIAL_POINT = "material_point"
+EXECUTION_MODES = (FINITE_ELEMENT, MATERIAL_POINT)
+# Linear elastic tests in finite element mode are solved in closed form instead
+ANALYTICAL = "analytical"
+
+# States of a simulation run
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timed_out"
+
+
+def validate_execution_mode(execution_mode: str) -> None:
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError(
+            f"Unsupported execution mode: {execution_mode}. "
+            f"Expected one of {', '.join(EXECUTION_MODES)}."
+        )
 
 
 @dataclass
@@ -58,6 +99,17 @@ class CRSSimulationInputs:
     duration_in_seconds: float = 0.0
     initial_effective_cell_pressure: float = 0.0
 
+    def update_totals(self) -> None:
+        self.number_of_steps = sum(
+            increment.steps for increment in self.strain_increments
+        )
+        self.duration_in_seconds = hours_to_seconds(
+            sum(increment.duration_in_hours for increment in self.strain_increments)
+        )
+        self.maximum_strain = sum(
+            increment.strain_increment for increment in self.strain_increments
+        )
+
     def validate(self) -> None:
         if self.test_type not in VALID_TEST_TYPES:
             raise ValueError(f"Unsupported test type: {self.test_type}.")
@@ -0,0 +1,115 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    """
+    Wall time of one phase. `start_in_seconds` is relative to the creation of
+    the timer and `depth` is the number of enclosing phases.
+    """
+
+    name: str
+    start_in_seconds: float
+    duration_in_seconds: float
+    depth: int
+
+
+class PhaseTimer:
+    """
+    Records the wall time of (nested) phases of a run:
+
+        with timer.phase("run"):
+            with timer.phase("render_inputs"):
+                ...
+
+    The timings can be summed per phase name, printed as an indented summary
+    or written as a Chrome trace, which can be opened in chrome://tracing or
+    https://ui.perfetto.dev.
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._depth = 0
+        self.timings: List[PhaseTiming] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.timings.append(
+                PhaseTiming(
+                    name=name,
+                    start_in_seconds=start - self._origin,
+                    duration_in_seconds=time.perf_counter() - start,
+                    depth=depth,
+                )
+            )
+
+    def total(self, name: str) -> float:
+        return sum(t.duration_in_seconds for t in self.timings if t.name == name)
+
+    def totals(self) -> Dict[str, float]:
+        """
+        Returns the summed duration per phase name, in the order the phases started.
+        """
+        totals: Dict[str, float] = {}
+        for timing in self._in_start_order():
+            totals[timing.name] = (
+                totals.get(timing.name, 0.0) + timing.duration_in_seconds
+            )
+        return totals
+
+    def to_dict(self) -> Dict[str, List[Dict]]:
+        return {"timings": [asdict(timing) for timing in self._in_start_order()]}
+
+    def summary(self) -> str:
+        return "\n".join(
+            f"{'  ' * timing.depth}{timing.name}: "
+            f"{timing.duration_in_seconds * 1000.0:.1f} ms"
+            for timing in self._in_start_order()
+        )
+
+    def to_chrome_trace(self) -> Dict:
+        """
+        Returns the timings as complete ("X") events of the Chrome trace event format.
+        """
+        process_id = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": timing.name,
+                    "cat": "pipeline",
+                    "ph": "X",
+                    "ts": timing.start_in_seconds * 1e6,
+                    "dur": timing.duration_in_seconds * 1e6,
+                    "pid": process_id,
+                    "tid": 0,
+                }
+                for timing in self._in_start_order()
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, path: Path | str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def _in_start_order(self) -> List[PhaseTiming]:
+        # Phases are recorded when they end, so an enclosing phase comes after
+        # its children
+        return sorted(self.timings, key=lambda t: (t.start_in_seconds, t.depth))
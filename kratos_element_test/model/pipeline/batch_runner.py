@@ -0,0 +1,222 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+import time
+from concurrent.futures import as_completed
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.io.result_file import (
+    run_metadata,
+    safe_file_name,
+    write_results,
+)
+from kratos_element_test.model.job_spec import JobRun, JobSpec
+from kratos_element_test.model.models import FINITE_ELEMENT, validate_execution_mode
+from kratos_element_test.model.pipeline.simulation_factory import (
+    create_simulation,
+    solution_method,
+)
+from kratos_element_test.model.pipeline.simulation_pool import SimulationPool
+from kratos_element_test.model.simulation_results import SimulationResults
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+# Results are written as JSON, or as columnar NPZ or Parquet files that can be
+# read back memory-mapped
+RESULT_FORMATS = ("json", "npz", "parquet")
+
+
+class BatchRunner:
+    def __init__(
+        self,
+        job_spec: JobSpec,
+        output_directory: Path,
+        logger: Optional[Callable[[str, str], None]] = None,
+        workers: int = 1,
+        execution_mode: str = FINITE_ELEMENT,
+        force_finite_element: bool = False,
+        result_format: str = "json",
+    ):
+        validate_execution_mode(execution_mode)
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(
+                f"Unsupported result format: {result_format}. "
+                f"Expected one of {', '.join(RESULT_FORMATS)}."
+            )
+        self.job_spec = job_spec
+        self.output_directory = Path(output_directory)
+        self._log = logger or _fallback_log
+        self.workers = max(1, workers)
+        self.execution_mode = execution_mode
+        self.force_finite_element = force_finite_element
+        self.result_format = result_format
+
+    def run(self) -> Dict:
+        """
+        Runs every job of the spec, writes one results file per run and a
+        manifest summarising all runs. Failing runs are recorded in the
+        manifest and do not stop the batch. With more than one worker, the
+        runs are executed concurrently in a SimulationPool.
+        """
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+        started_at = _timestamp()
+
+        if self.workers > 1:
+            entries = self._run_in_pool()
+        else:
+            entries = self._run_sequentially()
+
+        manifest = {
+            "started_at": started_at,
+            "finished_at": _timestamp(),
+            "execution_mode": self.execution_mode,
+            "force_finite_element": self.force_finite_element,
+            "number_of_runs": len(entries),
+            "number_of_failures": sum(e["status"] != "completed" for e in entries),
+            "runs": entries,
+        }
+        with open(self.output_directory / MANIFEST_FILE_NAME, "w") as f:
+            json.dump(manifest, f, indent=4)
+        return manifest
+
+    def _run_sequentially(self) -> List[Dict]:
+        entries = []
+        for index, job_run in enumerate(self.job_spec.runs, start=1):
+            self._log(
+                f"[{index}/{len(self.job_spec.runs)}] Running '{job_run.name}'...",
+                "info",
+            )
+            try:
+                outcome = run_timed_simulation(
+                    job_run.test_inputs,
+                    job_run.material_inputs,
+                    self._log,
+                    self.execution_mode,
+                    self.force_finite_element,
+                )
+            except Exception as e:
+                outcome = e
+            entries.append(self._record(index, job_run, outcome))
+        return entries
+
+    def _run_in_pool(self) -> List[Dict]:
+        entries = [None] * len(self.job_spec.runs)
+        with SimulationPool(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(
+                    run_timed_simulation,
+                    job_run.test_inputs,
+                    job_run.material_inputs,
+                    None,
+                    self.execution_mode,
+                    self.force_finite_element,
+                ): index
+                for index, job_run in enumerate(self.job_spec.runs, start=1)
+            }
+            for finished, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                job_run = self.job_spec.runs[index - 1]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = e
+                entries[index - 1] = self._record(index, job_run, outcome)
+                self._log(
+                    f"[{finished}/{len(entries)}] Finished '{job_run.name}'.", "info"
+                )
+        return entries
+
+    def _record(
+        self,
+        index: int,
+        job_run: JobRun,
+        outcome: Tuple[SimulationResults, float] | Exception,
+    ) -> Dict:
+        entry = {
+            "name": job_run.name,
+            "test_type": job_run.test_inputs.test_type,
+            "solution_method": solution_method(
+                job_run.material_inputs,
+                self.execution_mode,
+                self.force_finite_element,
+            ),
+            "status": "completed",
+            "result_file": None,
+            "error": None,
+            "wall_time_in_seconds": None,
+            "phase_timings_in_seconds": None,
+        }
+        if isinstance(outcome, Exception):
+            self._log(f"Run '{job_run.name}' failed: {outcome}", "error")
+            entry["status"] = "failed"
+            entry["error"] = str(outcome)
+            return entry
+
+        results, wall_time = outcome
+        entry["wall_time_in_seconds"] = wall_time
+        if results.timings is not None:
+            entry["phase_timings_in_seconds"] = results.timings.totals()
+        try:
+            entry["result_file"] = self._write_results(index, job_run, results).name
+        except Exception as e:
+            self._log(f"Writing results of '{job_run.name}' failed: {e}", "error")
+            entry["status"] = "failed"
+            entry["error"] = str(e)
+        return entry
+
+    def _write_results(
+        self, index: int, job_run: JobRun, results: SimulationResults
+    ) -> Path:
+        result_file = (
+            self.output_directory
+            / f"{index:04d}_{safe_file_name(job_run.name)}.{self.result_format}"
+        )
+        if self.result_format != "json":
+            return write_results(
+                result_file,
+                results,
+                name=job_run.name,
+                **run_metadata(job_run.test_inputs, job_run.material_inputs, results),
+            )
+
+        with open(result_file, "w") as f:
+            json.dump(
+                {
+                    "name": job_run.name,
+                    "test_inputs": asdict(job_run.test_inputs),
+                    "material_inputs": asdict(job_run.material_inputs),
+                    "results": results.to_dict(),
+                },
+                f,
+            )
+        return result_file
+
+
+def run_timed_simulation(
+    test_inputs,
+    material_inputs,
+    logger=None,
+    execution_mode=FINITE_ELEMENT,
+    force_finite_element=False,
+) -> Tuple[SimulationResults, float]:
+    start = time.perf_counter()
+    sim = create_simulation(
+        test_inputs=test_inputs,
+        material_inputs=material_inputs,
+        logger=logger,
+        execution_mode=execution_mode,
+        force_finite_element=force_finite_element,
+    )
+    sim.run()
+    results = sim.post_process_results()
+    return results, time.perf_counter() - start
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
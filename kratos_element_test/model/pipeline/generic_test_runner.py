@@ -10,23 +10,26 @@ from KratosMultiphysics.GeoMechanicsApplication.geomechanics_analysis import (
     GeoMechanicsAnalysis,
 )
 from KratosMultiphysics.project import Project
-from kratos_element_test.view.ui_logger import log_message as fallback_log
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.phase_timer import PhaseTimer
 import KratosMultiphysics.GeoMechanicsApplication.context_managers as context_managers
 
 
 class GenericTestRunner:
-    def __init__(self, output_file_paths, work_dir, logger=None):
+    def __init__(self, output_file_paths, work_dir, logger=None, timer=None):
         self.output_file_paths = output_file_paths
         self.work_dir = work_dir
-        self._log = logger or fallback_log
+        self._log = logger or _fallback_log
+        self._timer = timer or PhaseTimer()
 
     def run(self):
-        use_orchestrator = self._has_orchestrator()
-        if use_orchestrator:
-            self._run_orchestrator()
-        else:
-            parameters = self._load_stage_parameters()
-            self._execute_analysis_stages(parameters)
+        with self._timer.phase("kratos"):
+            use_orchestrator = self._has_orchestrator()
+            if use_orchestrator:
+                self._run_orchestrator()
+            else:
+                parameters = self._load_stage_parameters()
+                self._execute_analysis_stages(parameters)
 
     def _load_kratos_parameters_from_file(self, json_path: str) -> Kratos.Parameters:
         with open(json_path, "r") as f:
@@ -48,12 +51,14 @@ class GenericTestRunner:
 
     def _execute_analysis_stages(self, parameters):
         model = Kratos.Model()
-        stages = [GeoMechanicsAnalysis(model, p) for p in parameters]
+        with self._timer.phase("construct_stages"):
+            stages = [GeoMechanicsAnalysis(model, p) for p in parameters]
         original_cwd = os.getcwd()
         try:
             os.chdir(self.work_dir)
-            for stage in stages:
-                stage.Run()
+            for i, stage in enumerate(stages, start=1):
+                with self._timer.phase(f"run_stage_{i}"):
+                    stage.Run()
         finally:
             os.chdir(original_cwd)
 
@@ -88,4 +93,27 @@ class GenericTestRunner:
         orchestrator_class = getattr(orchestrator_module, reg_entry["ClassName"])
 
         with context_managers.set_cwd_to(self.work_dir):
-            orchestrator_class(project).Run()
+            self._timed_orchestrator_class(orchestrator_class)(project).Run()
+
+    def _timed_orchestrator_class(self, orchestrator_class):
+        """
+        Returns a subclass of the orchestrator that times the construction and
+        the run of every stage separately.
+        """
+        timer = self._timer
+
+        class TimedOrchestrator(orchestrator_class):
+            def CreateStage(self, stage_name):
+                with timer.phase(f"construct_{stage_name}"):
+                    stage = super().CreateStage(stage_name)
+
+                run_stage = stage.Run
+
+                def timed_run():
+                    with timer.phase(f"run_{stage_name}"):
+                        run_stage()
+
+                stage.Run = timed_run
+                return stage
+
+        return TimedOrchestrator
@@ -0,0 +1,125 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.io.gid_result_reader import ResultSeries
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.phase_timer import PhaseTimer
+from kratos_element_test.model.pipeline.load_path import (
+    STRAIN_SIZE,
+    XX,
+    XY,
+    YY,
+    ZZ,
+    initial_stress,
+    load_stages,
+    stage_results,
+)
+from kratos_element_test.model.pipeline.result_collector import ResultCollector
+from kratos_element_test.model.simulation_results import SimulationResults
+
+
+def elastic_stiffness(young_modulus: float, poisson_ratio: float) -> np.ndarray:
+    """
+    Returns the 4x4 isotropic elastic stiffness matrix of the plane strain and
+    axisymmetric laws, for strains in Voigt order xx, yy, zz and engineering xy.
+    """
+    lame = (
+        young_modulus
+        * poisson_ratio
+        / ((1.0 + poisson_ratio) * (1.0 - 2.0 * poisson_ratio))
+    )
+    shear_modulus = young_modulus / (2.0 * (1.0 + poisson_ratio))
+    stiffness = np.zeros((STRAIN_SIZE, STRAIN_SIZE))
+    stiffness[:XY, :XY] = lame
+    stiffness[[XX, YY, ZZ], [XX, YY, ZZ]] += 2.0 * shear_modulus
+    stiffness[XY, XY] = shear_modulus
+    return stiffness
+
+
+class LinearElasticSimulation:
+    """
+    Computes an element test with linear elastic material in closed form.
+
+    The element tests are homogeneous, so for linear elasticity the response
+    follows directly from the prescribed strain:
+
+    - triaxial: the lateral stress stays at the cell pressure, so the lateral
+      strains are -nu times the axial strain and the axial stress changes by E
+      times the axial strain;
+    - direct shear: the shear stress is G times the shear strain and the normal
+      stresses stay at the cell pressure;
+    - CRS: the lateral strains are zero (oedometric loading).
+
+    It has the same interface and result channels as RunSimulation, at a
+    fraction of the cost.
+    """
+
+    def __init__(
+        self,
+        *,
+        test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+        material_inputs: LinearElasticMaterialInputs,
+        logger: Optional[Callable[[str, str], None]] = None,
+        timer: Optional[PhaseTimer] = None,
+    ):
+        self.test_inputs = test_inputs
+        self.test_type = test_inputs.test_type.lower()
+        self.material_inputs = material_inputs
+        self.log = logger or _fallback_log
+        self.timer = timer or PhaseTimer()
+        self._stages: List[Tuple[Dict[str, ResultSeries], np.ndarray]] = []
+
+    def run(self) -> None:
+        self.log(
+            f"Starting {self.test_type} analytical linear elastic solution...", "info"
+        )
+
+        with self.timer.phase("run"):
+            with self.timer.phase("solve_analytically"):
+                self._stages = self._solve()
+
+        self.log("Finished analysis", "info")
+
+    def post_process_results(self) -> SimulationResults:
+        self.log("Collecting results...", "info")
+        with self.timer.phase("post_process_results"):
+            collector = ResultCollector([], logger=self.log, timer=self.timer)
+            results = collector.collect_results_of_stages(self._stages)
+        self.log("Rendering complete.", "info")
+        return results
+
+    def _solve(self) -> List[Tuple[Dict[str, ResultSeries], np.ndarray]]:
+        kratos_inputs = self.material_inputs.get_kratos_inputs()
+        young_modulus = kratos_inputs["YOUNG_MODULUS"]
+        poisson_ratio = kratos_inputs["POISSON_RATIO"]
+        stiffness = elastic_stiffness(young_modulus, poisson_ratio)
+        stress_at_start_of_stage = initial_stress(self.test_inputs)
+
+        stages = []
+        for load_stage in load_stages(self.test_inputs):
+            # Strains relative to the start of the stage, as reported by the
+            # finite element model
+            strains = np.zeros((len(load_stage.times), STRAIN_SIZE))
+            if self.test_type == "direct_shear":
+                strains[:, XY] = load_stage.strains
+            else:
+                strains[:, YY] = load_stage.strains
+            if self.test_type == "triaxial":
+                strains[:, XX] = strains[:, ZZ] = -poisson_ratio * load_stage.strains
+
+            stresses = stress_at_start_of_stage + strains @ stiffness.T
+            stages.append(stage_results(load_stage.times, stresses, strains))
+            stress_at_start_of_stage = stresses[-1]
+        return stages
@@ -0,0 +1,137 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from kratos_element_test.model.core_utils import hours_to_seconds
+from kratos_element_test.model.io.gid_result_reader import ResultSeries
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.result_collector import (
+    MEAN_EFFECTIVE_STRESS,
+    STRAIN_TENSOR,
+    STRESS_TENSOR,
+    VON_MISES_STRESS,
+)
+
+# Voigt components of the plane strain and axisymmetric laws: xx, yy, zz, xy
+XX, YY, ZZ, XY = range(4)
+STRAIN_SIZE = 4
+
+TEST_TYPES = ("triaxial", "direct_shear", "crs")
+
+
+@dataclass
+class LoadStage:
+    """
+    The output times (in seconds) of one stage and the prescribed strain
+    component at those times, relative to the start of the stage: the axial
+    strain of triaxial and CRS tests, the shear strain of direct shear tests.
+    """
+
+    times: np.ndarray
+    strains: np.ndarray
+
+
+def _round_like_template(value: float, digits: int) -> float:
+    # The table values of the mdpa templates are written with a fixed number of digits
+    return float(f"{value:.{digits}f}")
+
+
+def load_stages(
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+) -> List[LoadStage]:
+    """
+    Returns the prescribed strain at the output times of every stage, as
+    prescribed by the displacement tables of the finite element templates.
+    """
+    test_type = test_inputs.test_type.lower()
+    if test_type not in TEST_TYPES:
+        raise ValueError(f"Unsupported test type: {test_inputs.test_type}")
+
+    if test_type == "crs":
+        stages = []
+        start_time = 0.0
+        for increment in test_inputs.strain_increments:
+            duration = hours_to_seconds(increment.duration_in_hours)
+            end_time = start_time + duration
+            times = start_time + duration * (
+                np.arange(1, increment.steps + 1) / increment.steps
+            )
+            strains = np.interp(
+                times,
+                [
+                    _round_like_template(start_time, 1),
+                    _round_like_template(end_time, 1),
+                ],
+                [0.0, _round_like_template(increment.strain_increment / 100, 6)],
+            )
+            stages.append(LoadStage(times=times, strains=strains))
+            start_time = end_time
+        return stages
+
+    number_of_steps = test_inputs.number_of_steps
+    end_time = test_inputs.duration_in_seconds
+    times = end_time * np.arange(1, number_of_steps + 1) / number_of_steps
+    # No strain during the first time step, then linearly increasing to the
+    # maximum strain
+    first_timestep = _round_like_template(end_time / number_of_steps, 4)
+    maximum_strain = _round_like_template(-test_inputs.maximum_strain / 100, 4)
+    strains = np.interp(
+        times, [0.0, first_timestep, end_time], [0.0, 0.0, maximum_strain]
+    )
+    return [LoadStage(times=times, strains=strains)]
+
+
+def initial_stress(
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+) -> np.ndarray:
+    if test_inputs.test_type.lower() == "crs":
+        # The CRS template starts from a stress free state
+        return np.zeros(STRAIN_SIZE)
+    pressure = test_inputs.initial_effective_cell_pressure
+    return np.array([-pressure, -pressure, -pressure, 0.0])
+
+
+def stage_results(
+    times: np.ndarray, stresses: np.ndarray, strains: np.ndarray
+) -> Tuple[Dict[str, ResultSeries], np.ndarray]:
+    """
+    Returns the results of a stage in the form that is captured from the finite
+    element model, from the (N, 4) stress and strain vectors at N output times.
+    Like the strain tensor of Kratos, the xy component of the strain tensor is
+    half the engineering shear strain.
+    """
+    sigma_xx, sigma_yy, sigma_zz, sigma_xy = stresses.T
+    mean_stress = (sigma_xx + sigma_yy + sigma_zz) / 3.0
+    von_mises = np.sqrt(
+        0.5
+        * (
+            (sigma_xx - sigma_yy) ** 2
+            + (sigma_yy - sigma_zz) ** 2
+            + (sigma_zz - sigma_xx) ** 2
+        )
+        + 3.0 * sigma_xy**2
+    )
+
+    stress_tensors = np.zeros((len(times), 6))
+    stress_tensors[:, :4] = stresses
+    strain_tensors = np.zeros((len(times), 6))
+    strain_tensors[:, :3] = strains[:, :3]
+    strain_tensors[:, 3] = strains[:, XY] / 2.0
+
+    series = {
+        STRESS_TENSOR: ResultSeries(times=times, values=stress_tensors),
+        STRAIN_TENSOR: ResultSeries(times=times, values=strain_tensors),
+        MEAN_EFFECTIVE_STRESS: ResultSeries(
+            times=times, values=mean_stress[:, np.newaxis]
+        ),
+        VON_MISES_STRESS: ResultSeries(times=times, values=von_mises[:, np.newaxis]),
+    }
+    return series, times
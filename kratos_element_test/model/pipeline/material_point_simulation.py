@@ -0,0 +1,283 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import KratosMultiphysics as Kratos
+import KratosMultiphysics.GeoMechanicsApplication  # noqa: F401
+import numpy as np
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.io.gid_result_reader import ResultSeries
+from kratos_element_test.model.io.material_editor import MaterialEditor
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.material_input_data_utils import get_cohesion_and_phi
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.phase_timer import PhaseTimer
+from kratos_element_test.model.pipeline.load_path import (
+    STRAIN_SIZE,
+    XX,
+    XY,
+    YY,
+    ZZ,
+    initial_stress,
+    load_stages,
+    stage_results,
+)
+from kratos_element_test.model.pipeline.result_collector import ResultCollector
+from kratos_element_test.model.pipeline.simulation_run import CancellationToken
+from kratos_element_test.model.simulation_results import SimulationResults
+
+MAX_ITERATIONS = 50
+RELATIVE_TOLERANCE = 1.0e-10
+
+
+class MaterialPoint:
+    """
+    A single integration point that calls a Kratos constitutive law directly.
+
+    The law is created from the material parameters in the same way as for the
+    finite element model, so all laws that can be used there (including UDSMs)
+    can be used here as well.
+    """
+
+    def __init__(self, material_parameters: Dict):
+        self.model = Kratos.Model()
+        properties_entry = material_parameters["properties"][0]
+        model_part = self.model.CreateModelPart("PorousDomain")
+        for name in properties_entry["model_part_name"].split(".")[1:]:
+            model_part = model_part.CreateSubModelPart(name)
+        Kratos.ReadMaterialsUtility(self.model).ReadMaterials(
+            Kratos.Parameters(json.dumps(material_parameters))
+        )
+
+        root_model_part = self.model["PorousDomain"]
+        self.properties = root_model_part.GetProperties(
+            properties_entry["properties_id"]
+        )
+        self.law = self.properties[Kratos.CONSTITUTIVE_LAW].Clone()
+        self.process_info = root_model_part.ProcessInfo
+
+        nodes = [
+            root_model_part.CreateNewNode(1, 0.0, 0.0, 0.0),
+            root_model_part.CreateNewNode(2, 1.0, 0.0, 0.0),
+            root_model_part.CreateNewNode(3, 0.0, 1.0, 0.0),
+        ]
+        self.geometry = Kratos.Triangle2D3(*nodes)
+        self.shape_function_values = Kratos.Vector([1.0 / 3.0] * 3)
+
+        # The law parameters keep references to these, so they must stay alive
+        self._strain = Kratos.Vector(STRAIN_SIZE, 0.0)
+        self._stress = Kratos.Vector(STRAIN_SIZE, 0.0)
+        self._tangent = Kratos.Matrix(STRAIN_SIZE, STRAIN_SIZE, 0.0)
+        self._options = Kratos.Flags()
+        self._options.Set(Kratos.ConstitutiveLaw.COMPUTE_STRESS, True)
+        self._options.Set(Kratos.ConstitutiveLaw.COMPUTE_CONSTITUTIVE_TENSOR, True)
+
+        self.parameters = Kratos.ConstitutiveLawParameters()
+        self.parameters.SetOptions(self._options)
+        self.parameters.SetMaterialProperties(self.properties)
+        self.parameters.SetElementGeometry(self.geometry)
+        self.parameters.SetProcessInfo(self.process_info)
+        self.parameters.SetShapeFunctionsValues(self.shape_function_values)
+        self.parameters.SetStrainVector(self._strain)
+        self.parameters.SetStressVector(self._stress)
+        self.parameters.SetConstitutiveMatrix(self._tangent)
+
+        self.law.Check(self.properties, self.geometry, self.process_info)
+        self.law.InitializeMaterial(
+            self.properties, self.geometry, self.shape_function_values
+        )
+        self.stress = np.zeros(STRAIN_SIZE)
+
+    def initialize(self, initial_stress: np.ndarray) -> None:
+        """
+        Sets the initial stress, like the initial uniform stress field of the
+        finite element model.
+        """
+        self.stress = np.asarray(initial_stress, dtype=float)
+        self._set_state(np.zeros(STRAIN_SIZE), self.stress)
+        self.law.InitializeMaterialResponseCauchy(self.parameters)
+
+    def begin_step(self, time: float, delta_time: float) -> None:
+        self.process_info[Kratos.TIME] = time
+        self.process_info[Kratos.DELTA_TIME] = delta_time
+        self.process_info[Kratos.STEP] = self.process_info[Kratos.STEP] + 1
+
+    def calculate(self, strain: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the stress and the tangent at the total `strain`, starting from
+        the state of the last finalized step.
+        """
+        self._set_state(strain, self.stress)
+        self.law.InitializeMaterialResponseCauchy(self.parameters)
+        self.law.CalculateMaterialResponseCauchy(self.parameters)
+        return (
+            np.array(self.parameters.GetStressVector()),
+            np.array(self.parameters.GetConstitutiveMatrix()),
+        )
+
+    def finalize(self, strain: np.ndarray) -> np.ndarray:
+        """
+        Accepts the response at the total `strain` as the new state.
+        """
+        stress, _ = self.calculate(strain)
+        self.law.FinalizeMaterialResponseCauchy(self.parameters)
+        self.stress = stress
+        return stress
+
+    def _set_state(self, strain: np.ndarray, stress: np.ndarray) -> None:
+        for i in range(STRAIN_SIZE):
+            self._strain[i] = strain[i]
+            self._stress[i] = stress[i]
+
+
+class MaterialPointSimulation:
+    """
+    Runs an element test on a single material point instead of the finite
+    element mesh of the templates.
+
+    The test is homogeneous, so the constitutive law is driven directly with
+    the strain path of the finite element model:
+
+    - triaxial: the axial strain is prescribed, and the lateral strains are
+      solved for such that the lateral stress stays at the cell pressure;
+    - direct shear: the shear strain is prescribed and the normal strains are zero;
+    - CRS: the axial strain is prescribed per stage and the lateral strains are zero.
+
+    The results are collected with the same ResultCollector as the finite
+    element results, so they have the same channels. The run stops with
+    SimulationCancelled at the first step after `cancellation` is cancelled
+    or times out.
+    """
+
+    def __init__(
+        self,
+        *,
+        test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+        material_inputs: (
+            LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+        ),
+        logger: Optional[Callable[[str, str], None]] = None,
+        timer: Optional[PhaseTimer] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ):
+        self.test_inputs = test_inputs
+        self.test_type = test_inputs.test_type.lower()
+        self.material_inputs = material_inputs
+        self.log = logger or _fallback_log
+        self.timer = timer or PhaseTimer()
+        self.cancellation = cancellation
+        self._stages: List[Tuple[Dict[str, ResultSeries], np.ndarray]] = []
+
+    def run(self) -> None:
+        self.log(f"Starting {self.test_type} material point simulation...", "info")
+
+        with self.timer.phase("run"):
+            with self.timer.phase("create_material_point"):
+                material_point = MaterialPoint(self._material_parameters())
+            with self.timer.phase("drive_material_point"):
+                self._stages = self._drive(material_point)
+
+        self.log("Finished analysis", "info")
+
+    def post_process_results(self) -> SimulationResults:
+        self.log("Collecting results...", "info")
+        with self.timer.phase("post_process_results"):
+            cohesion, phi = get_cohesion_and_phi(self.material_inputs)
+            collector = ResultCollector(
+                [], cohesion, phi, logger=self.log, timer=self.timer
+            )
+            results = collector.collect_results_of_stages(self._stages)
+        self.log("Rendering complete.", "info")
+        return results
+
+    def _material_parameters(self) -> Dict:
+        template_dir = (
+            Path(__file__).resolve().parents[1]
+            / "simulation_assets"
+            / "templates"
+            / f"test_{self.test_type}"
+        )
+        editor = MaterialEditor(str(template_dir / "MaterialParameters.json"))
+        editor.update_material_properties(self.material_inputs.get_kratos_inputs())
+        editor.set_constitutive_law(self.material_inputs.kratos_law_name)
+        return editor.data
+
+    def _drive(
+        self, material_point: MaterialPoint
+    ) -> List[Tuple[Dict[str, ResultSeries], np.ndarray]]:
+        material_point.initialize(initial_stress(self.test_inputs))
+
+        total_strain = np.zeros(STRAIN_SIZE)
+        previous_time = 0.0
+        stages = []
+        for load_stage in load_stages(self.test_inputs):
+            strain_at_start_of_stage = total_strain.copy()
+            stresses = np.zeros((len(load_stage.times), STRAIN_SIZE))
+            strains = np.zeros((len(load_stage.times), STRAIN_SIZE))
+
+            for i, (time, strain) in enumerate(
+                zip(load_stage.times, load_stage.strains)
+            ):
+                if self.cancellation is not None:
+                    self.cancellation.raise_if_stopped()
+                material_point.begin_step(time, time - previous_time)
+                total_strain = self._solve_step(
+                    material_point, strain_at_start_of_stage, strain, total_strain
+                )
+                stresses[i] = material_point.finalize(total_strain)
+                previous_time = time
+
+                # Like the finite element model, strains are reported per stage
+                strains[i] = total_strain - strain_at_start_of_stage
+
+            stages.append(stage_results(load_stage.times, stresses, strains))
+        return stages
+
+    def _solve_step(
+        self,
+        material_point: MaterialPoint,
+        strain_at_start_of_stage: np.ndarray,
+        prescribed_strain: float,
+        previous_strain: np.ndarray,
+    ) -> np.ndarray:
+        strain = strain_at_start_of_stage.copy()
+        if self.test_type == "direct_shear":
+            strain[XY] += prescribed_strain
+            return strain
+
+        strain[YY] += prescribed_strain
+        if self.test_type == "crs":
+            return strain
+
+        # Triaxial: find the equal radial and circumferential strain at which
+        # the radial stress equals the cell pressure
+        strain[XX] = strain[ZZ] = previous_strain[XX]
+        target_stress = -self.test_inputs.initial_effective_cell_pressure
+        tolerance = RELATIVE_TOLERANCE * max(1.0, abs(target_stress))
+        for _ in range(MAX_ITERATIONS):
+            stress, tangent = material_point.calculate(strain)
+            residual = stress[XX] - target_stress
+            if abs(residual) <= tolerance:
+                return strain
+            stiffness = tangent[XX, XX] + tangent[XX, ZZ]
+            if stiffness == 0.0:
+                break
+            strain[XX] -= residual / stiffness
+            strain[ZZ] = strain[XX]
+
+        raise RuntimeError(
+            "The material point did not reach the cell pressure within "
+            f"{MAX_ITERATIONS} iterations."
+        )
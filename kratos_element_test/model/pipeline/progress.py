@@ -0,0 +1,163 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import time
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from kratos_element_test.model.io.gid_result_reader import (
+    GrowableRowBuffer,
+    ResultSeries,
+)
+from kratos_element_test.model.pipeline.result_collector import (
+    WANTED_RESULTS,
+    ResultCollector,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
+
+
+@dataclass
+class SimulationProgress:
+    """
+    The state of a running analysis after an output step. `stage` counts from
+    one; `step` counts the steps of the current stage. `time_steps` and
+    `series` hold the results captured since the previous report, so that a
+    PartialResults can append them.
+    """
+
+    stage: int
+    number_of_stages: int
+    step: int
+    time: float
+    end_time: Optional[float]
+    nonlinear_iterations: int
+    time_steps: np.ndarray = field(default_factory=lambda: np.empty(0))
+    series: Dict[str, ResultSeries] = field(default_factory=dict)
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if not self.end_time:
+            return None
+        return min(max(self.time / self.end_time, 0.0), 1.0)
+
+    def describe(self) -> str:
+        text = (
+            f"Stage {self.stage}/{self.number_of_stages}, step {self.step}, "
+            f"t = {self.time:g} s"
+        )
+        if self.fraction is not None:
+            text += f" ({100.0 * self.fraction:.0f}%)"
+        return f"{text}, {self.nonlinear_iterations} iteration(s)"
+
+    def merged_with(self, later: "SimulationProgress") -> "SimulationProgress":
+        """
+        Returns the state of `later` with the captured results of both
+        reports, which must be of the same stage.
+        """
+        series = dict(self.series)
+        for name, later_series in later.series.items():
+            earlier_series = series.get(name)
+            if earlier_series is None:
+                series[name] = later_series
+                continue
+            series[name] = ResultSeries(
+                times=np.concatenate([earlier_series.times, later_series.times]),
+                values=_concatenate_rows(earlier_series.values, later_series.values),
+            )
+        return replace(
+            later,
+            time_steps=np.concatenate([self.time_steps, later.time_steps]),
+            series=series,
+        )
+
+
+def _concatenate_rows(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    if len(first) == 0:
+        return second
+    if len(second) == 0:
+        return first
+    return np.concatenate([first, second])
+
+
+class ProgressThrottle:
+    """
+    Passes the progress of a run on to `callback` at most once every
+    `min_interval_in_seconds`. The results of the steps in between are merged
+    into the next report, so none are lost. A report of a new stage first
+    flushes the pending report of the previous stage.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[SimulationProgress], None],
+        min_interval_in_seconds: float = 0.25,
+    ):
+        self._callback = callback
+        self._min_interval = min_interval_in_seconds
+        self._pending: Optional[SimulationProgress] = None
+        self._last_report = None
+
+    def add(self, progress: SimulationProgress) -> None:
+        if self._pending is not None and self._pending.stage != progress.stage:
+            self.flush()
+        self._pending = (
+            progress if self._pending is None else self._pending.merged_with(progress)
+        )
+        now = time.perf_counter()
+        if self._last_report is None or now - self._last_report >= self._min_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending is None:
+            return
+        pending, self._pending = self._pending, None
+        self._last_report = time.perf_counter()
+        self._callback(pending)
+
+
+class _StageBuffers:
+    def __init__(self, stage: int):
+        self.stage = stage
+        self.time_steps = GrowableRowBuffer()
+        self.times = {name: GrowableRowBuffer() for name in WANTED_RESULTS}
+        self.values = {name: GrowableRowBuffer() for name in WANTED_RESULTS}
+
+    def to_stage(self):
+        series = {
+            name: ResultSeries(
+                times=self.times[name].to_array(width=1)[:, 0],
+                values=self.values[name].to_array(),
+            )
+            for name in WANTED_RESULTS
+        }
+        return series, self.time_steps.to_array(width=1)[:, 0]
+
+
+class PartialResults:
+    """
+    Accumulates the results of the progress reports of a run, so that the
+    results up to the latest report can be shown while the run continues.
+    """
+
+    def __init__(self, cohesion=None, phi=None):
+        self._collector = ResultCollector([], cohesion, phi)
+        self._stages: List[_StageBuffers] = []
+
+    def add(self, progress: SimulationProgress) -> None:
+        if not self._stages or self._stages[-1].stage != progress.stage:
+            self._stages.append(_StageBuffers(progress.stage))
+        stage = self._stages[-1]
+        for time_step in progress.time_steps:
+            stage.time_steps.append([time_step])
+        for name, series in progress.series.items():
+            for time_step, row in zip(series.times, series.values):
+                stage.times[name].append([time_step])
+                stage.values[name].append(row)
+
+    def to_results(self) -> SimulationResults:
+        return self._collector.collect_results_of_stages(
+            [stage.to_stage() for stage in self._stages]
+        )
@@ -0,0 +1,194 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import threading
+from typing import Callable, Dict, List, Tuple
+
+import KratosMultiphysics as Kratos
+import numpy as np
+
+from kratos_element_test.model.io.gid_result_reader import (
+    GrowableRowBuffer,
+    ResultRequest,
+    ResultSeries,
+)
+from kratos_element_test.model.pipeline.progress import SimulationProgress
+from kratos_element_test.model.pipeline.result_collector import WANTED_RESULTS
+
+PYTHON_MODULE = "kratos_element_test.model.pipeline.result_capture_process"
+
+# Captured stages per capture id. Every stage of an analysis adds one entry,
+# in the same form as the results that are read from a GiD output file.
+_captured_stages: Dict[str, List[Tuple[Dict[str, ResultSeries], np.ndarray]]] = {}
+_lock = threading.Lock()
+
+# Listeners per capture id, which get the progress after every output step
+_progress_listeners: Dict[str, Callable[[SimulationProgress], None]] = {}
+
+
+def add_progress_listener(
+    capture_id: str, listener: Callable[[SimulationProgress], None]
+) -> None:
+    with _lock:
+        _progress_listeners[capture_id] = listener
+
+
+def remove_progress_listener(capture_id: str) -> None:
+    with _lock:
+        _progress_listeners.pop(capture_id, None)
+
+
+def pop_captured_stages(
+    capture_id: str,
+) -> List[Tuple[Dict[str, ResultSeries], np.ndarray]]:
+    with _lock:
+        return _captured_stages.pop(capture_id, [])
+
+
+def capture_process_settings(
+    model_part_name: str, capture_id: str, gauss_point_results: List[str]
+) -> Dict:
+    """
+    Returns the entry of a ResultCaptureProcess for the 'output_processes'
+    of the project parameters.
+    """
+    return {
+        "python_module": PYTHON_MODULE,
+        "process_name": "ResultCaptureProcess",
+        "Parameters": {
+            "model_part_name": model_part_name,
+            "capture_id": capture_id,
+            "gauss_point_results": gauss_point_results,
+        },
+    }
+
+
+def Factory(settings, model):
+    if not isinstance(settings, Kratos.Parameters):
+        raise Exception(
+            "expected input shall be a Parameters object, encapsulating a json string"
+        )
+    return ResultCaptureProcess(model, settings["Parameters"])
+
+
+def _to_row(value) -> List[float]:
+    if isinstance(value, (int, float)):
+        return [float(value)]
+    if isinstance(value, Kratos.Matrix):
+        # Same component order as the GiD output: xx, yy, zz, xy, yz, xz
+        tensor = np.zeros((3, 3))
+        tensor[: value.Size1(), : value.Size2()] = np.array(value)
+        return [
+            tensor[0, 0],
+            tensor[1, 1],
+            tensor[2, 2],
+            tensor[0, 1],
+            tensor[1, 2],
+            tensor[0, 2],
+        ]
+    return [float(component) for component in value]
+
+
+class ResultCaptureProcess(Kratos.OutputProcess):
+    """
+    Output process that keeps the Gauss point results of the first element in
+    memory at every step, instead of writing them to a GiD file. When the stage
+    finishes, the results are stored under the 'capture_id', where they can be
+    collected with pop_captured_stages. A progress listener of the 'capture_id'
+    gets the results of every step while the stage runs.
+    """
+
+    def __init__(self, model, params):
+        super().__init__()
+
+        default_settings = Kratos.Parameters("""{
+            "model_part_name"     : "",
+            "capture_id"          : "",
+            "gauss_point_results" : []
+        }""")
+        params.ValidateAndAssignDefaults(default_settings)
+
+        self.model = model
+        self.model_part_name = params["model_part_name"].GetString()
+        self.capture_id = params["capture_id"].GetString()
+        self.requests = {
+            name: WANTED_RESULTS.get(name, ResultRequest())
+            for name in params["gauss_point_results"].GetStringArray()
+        }
+        self.model_part = None
+        self._variables = {}
+        self._stage = 1
+        self._step = 0
+        self._time_steps = GrowableRowBuffer()
+        self._times = {name: GrowableRowBuffer() for name in self.requests}
+        self._values = {name: GrowableRowBuffer() for name in self.requests}
+
+    def ExecuteInitialize(self):
+        self.model_part = self.model[self.model_part_name]
+        # Looked up once, instead of at every output step
+        self._variables = {
+            name: Kratos.KratosGlobals.GetVariable(name) for name in self.requests
+        }
+        with _lock:
+            self._stage = len(_captured_stages.get(self.capture_id, [])) + 1
+
+    def IsOutputStep(self):
+        return True
+
+    def PrintOutput(self):
+        process_info = self.model_part.ProcessInfo
+        time = process_info[Kratos.TIME]
+        self._step += 1
+        self._time_steps.append([time])
+
+        rows = {}
+        if self.model_part.NumberOfElements() > 0:
+            element = next(iter(self.model_part.Elements))
+            for name, request in self.requests.items():
+                values = element.CalculateOnIntegrationPoints(
+                    self._variables[name], process_info
+                )
+                if (
+                    request.number_of_gauss_points is not None
+                    and len(values) != request.number_of_gauss_points
+                ):
+                    continue
+                rows[name] = _to_row(values[request.gauss_point_index])
+                self._times[name].append([time])
+                self._values[name].append(rows[name])
+
+        with _lock:
+            listener = _progress_listeners.get(self.capture_id)
+        if listener is not None:
+            listener(self._progress(time, rows))
+
+    def _progress(self, time: float, rows: Dict[str, List[float]]):
+        process_info = self.model_part.ProcessInfo
+        return SimulationProgress(
+            stage=self._stage,
+            number_of_stages=self._stage,
+            step=self._step,
+            time=time,
+            end_time=None,
+            nonlinear_iterations=process_info[Kratos.NL_ITERATION_NUMBER],
+            time_steps=np.array([time]),
+            series={
+                name: ResultSeries(times=np.array([time]), values=np.array([row]))
+                for name, row in rows.items()
+            },
+        )
+
+    def ExecuteFinalize(self):
+        series = {
+            name: ResultSeries(
+                times=self._times[name].to_array(width=1)[:, 0],
+                values=self._values[name].to_array(),
+            )
+            for name in self.requests
+        }
+        time_steps = self._time_steps.to_array(width=1)[:, 0]
+        with _lock:
+            _captured_stages.setdefault(self.capture_id, []).append(
+                (series, time_steps)
+            )
@@ -2,230 +2,183 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 
 import numpy as np
-from KratosMultiphysics.GeoMechanicsApplication.gid_output_file_reader import (
-    GiDOutputFileReader,
+
+from kratos_element_test.model.core_utils import _fallback_log, seconds_to_hours
+from kratos_element_test.model.io.gid_result_reader import (
+    ResultRequest,
+    ResultSeries,
+    read_gid_results,
 )
+from kratos_element_test.model.phase_timer import PhaseTimer
+from kratos_element_test.model.simulation_results import SimulationResults
+
+STRESS_TENSOR = "CAUCHY_STRESS_TENSOR"
+STRAIN_TENSOR = "ENGINEERING_STRAIN_TENSOR"
+MEAN_EFFECTIVE_STRESS = "MEAN_EFFECTIVE_STRESS"
+VON_MISES_STRESS = "VON_MISES_STRESS"
 
-from kratos_element_test.model.core_utils import seconds_to_hours
-from kratos_element_test.view.ui_logger import log_message as fallback_log
+# Tensors are taken at the first Gauss point of the first element, the scalar
+# stresses at the second Gauss point of elements with three Gauss points
+WANTED_RESULTS = {
+    STRESS_TENSOR: ResultRequest(gauss_point_index=0),
+    STRAIN_TENSOR: ResultRequest(gauss_point_index=0),
+    MEAN_EFFECTIVE_STRESS: ResultRequest(gauss_point_index=1, number_of_gauss_points=3),
+    VON_MISES_STRESS: ResultRequest(gauss_point_index=1, number_of_gauss_points=3),
+}
 
 
 class ResultCollector:
-    def __init__(self, output_file_paths, cohesion=None, phi=None, logger=None):
+    def __init__(
+        self, output_file_paths, cohesion=None, phi=None, logger=None, timer=None
+    ):
         self.output_file_paths = output_file_paths
-        self._log = logger or fallback_log
+        self._log = logger or _fallback_log
+        self._timer = timer or PhaseTimer()
         self.cohesion = cohesion
         self.phi = phi
 
-    def collect_results(self):
-        all_tensors = {}
-        yy_strain_stages = []
-        all_shear_stress_xy = []
-        all_vol_strain = []
-        all_shear_strain_xy = []
-        all_von_mises = []
-        all_mean_stress = []
-        all_sigma_xx = []
-        all_sigma_yy = []
-        all_time_steps = []
-
-        for result_path in self.output_file_paths:
-            s, ms, vm, d, e, t = self._read_results(result_path)
-
-            tensors = self._extract_stress_tensors(s)
-            shear_stress_xy = self._extract_shear_stress_xy(s)
-            yy_strain, vol_strain, shear_strain_xy = self._compute_strains(e)
-            von_mises_values = self._compute_scalar_stresses(vm)
-            mean_stress_values = self._compute_scalar_stresses(ms)
-            sigma_xx, sigma_yy = self._extract_sigma_xx_yy(s)
-            time_steps = t
-
-            for time, tensor_list in tensors.items():
-                all_tensors.setdefault(time, []).extend(tensor_list)
-
-            all_shear_stress_xy.extend(shear_stress_xy)
-            yy_strain_stages.append(yy_strain)
-            all_vol_strain.extend(vol_strain)
-            all_shear_strain_xy.extend(shear_strain_xy)
-            all_von_mises.extend(von_mises_values)
-            all_mean_stress.extend(mean_stress_values)
-            all_sigma_xx.extend(sigma_xx)
-            all_sigma_yy.extend(sigma_yy)
-            all_time_steps.extend([seconds_to_hours(t) for t in time_steps])
-
-        all_yy_strain = self._apply_cumulative_strain_offset(yy_strain_stages)
-
-        sigma_1, sigma_3 = self._calculate_principal_stresses(all_tensors)
-
-        return {
-            "yy_strain": all_yy_strain,
-            "vol_strain": all_vol_strain,
-            "sigma1": sigma_1,
-            "sigma3": sigma_3,
-            "shear_xy": all_shear_stress_xy,
-            "shear_strain_xy": all_shear_strain_xy,
-            "mean_stress": all_mean_stress,
-            "von_mises": all_von_mises,
-            "cohesion": self.cohesion,
-            "phi": self.phi,
-            "sigma_xx": all_sigma_xx,
-            "sigma_yy": all_sigma_yy,
-            "time_steps": all_time_steps,
-        }
-
-    def _read_output(self, result_path: Path) -> dict:
-        return GiDOutputFileReader().read_output_from(result_path)
-
-    def _read_results(self, result_path: Path):
-        result_path = Path(result_path)
-        stress, mean_stress, von_mises, displacement, strain, time_steps = (
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
+    def collect_results(self) -> SimulationResults:
+        with self._timer.phase("read_results"):
+            stages = [
+                self._read_results(result_path)
+                for result_path in self.output_file_paths
+            ]
+        return self.collect_results_of_stages(stages)
+
+    def collect_results_of_stages(
+        self, stages: List[Tuple[Dict[str, ResultSeries], np.ndarray]]
+    ) -> SimulationResults:
+        """
+        Combines the results of consecutive stages. Every stage consists of the
+        series of the wanted results and the output times, as read from a GiD
+        output file or captured in memory by the ResultCaptureProcess.
+        """
+        with self._timer.phase("categorize_results"):
+            all_tensor_times = []
+            all_tensors = []
+            yy_strain_stages = []
+            all_shear_stress_xy = []
+            all_vol_strain = []
+            all_shear_strain_xy = []
+            all_von_mises = []
+            all_mean_stress = []
+            all_sigma_xx = []
+            all_sigma_yy = []
+            all_time_steps = []
+
+            for series, time_steps in stages:
+                stress = series[STRESS_TENSOR].values
+                strain = series[STRAIN_TENSOR].values
+
+                all_tensor_times.append(series[STRESS_TENSOR].times)
+                all_tensors.append(self._to_stress_tensors(stress))
+                all_shear_stress_xy.append(self._column(stress, 3))
+                all_sigma_xx.append(self._column(stress, 0))
+                all_sigma_yy.append(self._column(stress, 1))
+
+                yy_strain_stages.append(self._column(strain, 1))
+                all_vol_strain.append(
+                    self._column(strain, 0)
+                    + self._column(strain, 1)
+                    + self._column(strain, 2)
+                )
+                all_shear_strain_xy.append(self._column(strain, 3))
+
+                all_von_mises.append(self._column(series[VON_MISES_STRESS].values, 0))
+                all_mean_stress.append(
+                    self._column(series[MEAN_EFFECTIVE_STRESS].values, 0)
+                )
+                all_time_steps.append(seconds_to_hours(time_steps))
+
+            all_yy_strain = self._apply_cumulative_strain_offset(yy_strain_stages)
+
+        with self._timer.phase("principal_stresses"):
+            sigma_1, sigma_3 = self._calculate_principal_stresses(
+                self._concatenate(all_tensor_times),
+                (np.concatenate(all_tensors) if all_tensors else np.empty((0, 3, 3))),
+            )
+
+        return SimulationResults(
+            {
+                "yy_strain": all_yy_strain,
+                "vol_strain": self._concatenate(all_vol_strain),
+                "sigma1": sigma_1,
+                "sigma3": sigma_3,
+                "shear_xy": self._concatenate(all_shear_stress_xy),
+                "shear_strain_xy": self._concatenate(all_shear_strain_xy),
+                "mean_stress": self._concatenate(all_mean_stress),
+                "von_mises": self._concatenate(all_von_mises),
+                "cohesion": self.cohesion,
+                "phi": self.phi,
+                "sigma_xx": self._concatenate(all_sigma_xx),
+                "sigma_yy": self._concatenate(all_sigma_yy),
+                "time_steps": self._concatenate(all_time_steps),
+            },
+            timings=self._timer,
         )
 
+    def _read_results(
+        self, result_path: Path
+    ) -> Tuple[Dict[str, ResultSeries], np.ndarray]:
+        result_path = Path(result_path)
         if not result_path.exists():
             self._log(f"Missing result file: {result_path}", "warn")
-            return stress, mean_stress, von_mises, displacement, strain, time_steps
-
-        output = self._read_output(result_path)
-
-        for result_name, items in output.get("results", {}).items():
-            for item in items:
-                self._categorize_result(
-                    result_name,
-                    item,
-                    stress,
-                    mean_stress,
-                    von_mises,
-                    displacement,
-                    strain,
-                )
+            empty_series = ResultSeries(times=np.empty(0), values=np.empty((0, 0)))
+            return {name: empty_series for name in WANTED_RESULTS}, np.empty(0)
 
-        time_steps = GiDOutputFileReader.get_time_steps_from_first_valid_result(output)
+        return read_gid_results(result_path, WANTED_RESULTS)
 
-        return stress, mean_stress, von_mises, displacement, strain, time_steps
+    @staticmethod
+    def _column(values: np.ndarray, index: int) -> np.ndarray:
+        if len(values) == 0:
+            return np.empty(0)
+        return values[:, index]
 
-    def _categorize_result(
-        self, result_name, item, stress, mean_stress, von_mises, displacement, strain
-    ):
-        values = item["values"]
-        if result_name == "CAUCHY_STRESS_TENSOR":
-            stress.append(item)
-        elif result_name == "MEAN_EFFECTIVE_STRESS" and self._is_tri3_element_gp(
-            values
-        ):
-            mean_stress.append(item)
-        elif result_name == "VON_MISES_STRESS" and self._is_tri3_element_gp(values):
-            von_mises.append(item)
-        elif result_name == "DISPLACEMENT":
-            displacement.append(item)
-        elif result_name == "ENGINEERING_STRAIN_TENSOR":
-            strain.append(item)
-
-    def _is_tri3_element_gp(self, values: list) -> bool:
-        return isinstance(values, list) and all(
-            "value" in v and isinstance(v["value"], list) and len(v["value"]) == 3
-            for v in values
-        )
+    @staticmethod
+    def _concatenate(arrays: List[np.ndarray]) -> np.ndarray:
+        return np.concatenate(arrays) if arrays else np.empty(0)
 
-    def _first_value_or_none(self, result: dict) -> list | None:
-        if result.get("values"):
-            return result["values"][0]["value"][0]
-        return None
-
-    def _extract_stress_tensors(self, stress_results: list[dict]) -> dict:
-        reshaped = {}
-        for result in stress_results:
-            time_step = result["time"]
-            values = result["values"]
-            if not values:
-                continue
-            sublist = self._first_value_or_none(result)
-            if sublist is None:
-                continue
-            tensor = np.array(
-                [
-                    [sublist[0], sublist[3], sublist[5]],
-                    [sublist[3], sublist[1], sublist[4]],
-                    [sublist[5], sublist[4], sublist[2]],
-                ]
-            )
-            if time_step not in reshaped:
-                reshaped[time_step] = []
-            reshaped[time_step].append(tensor)
-        return reshaped
-
-    def _extract_shear_stress_xy(self, stress_results: list[dict]) -> list[float]:
-        shear_stress_xy = []
-        for result in stress_results:
-            values = result["values"]
-            if not values:
-                continue
-            stress_components = self._first_value_or_none(result)
-            if stress_components is None:
-                continue
-            shear_xy = stress_components[3]
-            shear_stress_xy.append(shear_xy)
-        return shear_stress_xy
-
-    def _compute_strains(
-        self, strain_results: list[dict]
-    ) -> tuple[list[float], list[float], list[float]]:
-        yy, vol, shear_xy = [], [], []
-        for result in strain_results:
-            values = result["values"]
-            if not values:
-                continue
-            first_value = self._first_value_or_none(result)
-            if first_value is None:
-                continue
-            eps_xx, eps_yy, eps_zz, eps_xy = first_value[:4]
-            vol.append(eps_xx + eps_yy + eps_zz)
-            yy.append(eps_yy)
-            shear_xy.append(eps_xy)
-        return yy, vol, shear_xy
-
-    def _compute_scalar_stresses(self, results):
-        return [r["values"][0]["value"][1] for r in results if r["values"]]
-
-    def _extract_sigma_xx_yy(
-        self, stress_results: list[dict]
-    ) -> tuple[list[float], list[float]]:
-        sigma_xx, sigma_yy = [], []
-        for result in stress_results:
-            stress_vec = self._first_value_or_none(result)
-            if stress_vec is not None:
-                sigma_xx.append(stress_vec[0])
-                sigma_yy.append(stress_vec[1])
-
-        return sigma_xx, sigma_yy
+    @staticmethod
+    def _to_stress_tensors(stress_components: np.ndarray) -> np.ndarray:
+        """
+        Returns the (N, 3, 3) stress tensors of N rows of stress components.
+        """
+        if len(stress_components) == 0:
+            return np.empty((0, 3, 3))
 
+        # Voigt order of Kratos: xx, yy, zz, xy, yz, xz
+        voigt_to_tensor = np.array([[0, 3, 5], [3, 1, 4], [5, 4, 2]])
+        return stress_components[:, voigt_to_tensor]
+
+    @staticmethod
     def _apply_cumulative_strain_offset(
-        self, strain_stages: list[list[float]]
-    ) -> list[float]:
+        strain_stages: List[np.ndarray],
+    ) -> np.ndarray:
         cumulative = 0.0
         combined = []
 
         for stage in strain_stages:
-            adjusted = [val + cumulative for val in stage]
-            if adjusted:
+            adjusted = stage + cumulative
+            if len(adjusted):
                 cumulative = adjusted[-1]
-            combined.extend(adjusted)
+            combined.append(adjusted)
 
-        return combined
+        return np.concatenate(combined) if combined else np.empty(0)
 
     @staticmethod
     def _calculate_principal_stresses(
-        tensors: Dict[float, List[np.ndarray]],
-    ) -> Tuple[List[float], List[float]]:
-        sigma_1, sigma_3 = [], []
-        for time in sorted(tensors.keys()):
-            for sigma in tensors[time]:
-                eigenvalues, _ = np.linalg.eigh(sigma)
-                sigma_1.append(float(np.min(eigenvalues)))
-                sigma_3.append(float(np.max(eigenvalues)))
-        return sigma_1, sigma_3
+        times: np.ndarray,
+        tensors: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns sigma1 (the most compressive principal stress) and sigma3 of all
+        tensors, sorted by time. Tensors with the same time (e.g. the last step of
+        a stage and the first step of the next stage) keep their original order.
+        """
+        if len(tensors) == 0:
+            return np.empty(0), np.empty(0)
+
+        order = np.argsort(times, kind="stable")
+        # eigvalsh returns the eigenvalues of every tensor in ascending order
+        eigenvalues = np.linalg.eigvalsh(tensors[order])
+        return eigenvalues[:, 0], eigenvalues[:, -1]
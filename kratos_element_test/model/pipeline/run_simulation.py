@@ -2,11 +2,10 @@
 # This is a prototype version
 # Contact kratos@deltares.nl
 
-import json
-import shutil
-import tempfile
+import uuid
+from dataclasses import replace
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from kratos_element_test.model.core_utils import _fallback_log, hours_to_seconds
 from kratos_element_test.model.io.material_editor import MaterialEditor
 from kratos_element_test.model.io.project_parameter_editor import ProjectParameterEditor
@@ -21,20 +20,37 @@ from kratos_element_test.model.models import (
     TriaxialAndShearSimulationInputs,
     CRSSimulationInputs,
 )
+from kratos_element_test.model.phase_timer import PhaseTimer
 from kratos_element_test.model.pipeline.generic_test_runner import GenericTestRunner
-from kratos_element_test.model.pipeline.result_collector import ResultCollector
+from kratos_element_test.model.pipeline.progress import (
+    ProgressThrottle,
+    SimulationProgress,
+)
+from kratos_element_test.model.pipeline.result_capture_process import (
+    add_progress_listener,
+    capture_process_settings,
+    pop_captured_stages,
+    remove_progress_listener,
+)
+from kratos_element_test.model.pipeline.result_collector import (
+    WANTED_RESULTS,
+    ResultCollector,
+)
+from kratos_element_test.model.pipeline.simulation_run import CancellationToken
+from kratos_element_test.model.pipeline.work_dir_pool import (
+    WorkDirPool,
+    default_work_dir_pool,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
 
 try:
     from importlib.resources import files as _res_files
 except Exception:
     _res_files = None
 
-REQUIRED_FILES = [
-    "MaterialParameters.json",
-    "mesh.mdpa",
-    "ProjectParameters.json",
-    "ProjectParametersOrchestrator.json",
-]
+MATERIAL_FILE = "MaterialParameters.json"
+MDPA_FILE = "mesh.mdpa"
+PROJECT_FILES = ["ProjectParametersOrchestrator.json", "ProjectParameters.json"]
 
 
 class RunSimulation:
@@ -47,7 +63,35 @@ class RunSimulation:
         ),
         logger: Optional[Callable[[str, str], None]] = None,
         keep_tmp: bool = False,
+        write_gid_output: bool = False,
+        timer: Optional[PhaseTimer] = None,
+        chrome_trace_path: Optional[Path] = None,
+        work_dir_pool: Optional[WorkDirPool] = None,
+        progress_callback: Optional[Callable[[SimulationProgress], None]] = None,
+        cancellation: Optional[CancellationToken] = None,
     ):
+        """
+        By default the results are captured in memory while Kratos runs. With
+        `write_gid_output` the GiD result files are written as well, e.g. to
+        inspect them in GiD together with `keep_tmp`.
+
+        The wall time of every phase of the run is recorded in `timer` and
+        attached to the results. With `chrome_trace_path` the timings are also
+        written as a Chrome trace.
+
+        The simulation files are written to a directory of `work_dir_pool`
+        (by default the pool of the process), which is returned to the pool
+        after the results are collected unless `keep_tmp` is set.
+
+        While Kratos runs, `progress_callback` gets the current stage, step,
+        time and number of nonlinear iterations, together with the results
+        of the steps since the previous report. It is called at most a few
+        times per second, and once more at the end of every stage.
+
+        The run stops with SimulationCancelled at the first step after
+        `cancellation` is cancelled or times out. Its directory is returned
+        to the pool right away.
+        """
         self.test_type = test_inputs.test_type.lower()
         self.material_inputs = material_inputs
         self.num_steps = test_inputs.number_of_steps
@@ -84,48 +128,106 @@ class RunSimulation:
         )
 
         self.keep_tmp = keep_tmp
-
-        self.tmp_dir = Path(tempfile.mkdtemp(prefix=f"{self.test_type}_"))
+        self.write_gid_output = write_gid_output
+        self.capture_id = uuid.uuid4().hex
+        self.timer = timer or PhaseTimer()
+        self.chrome_trace_path = chrome_trace_path
+        self.progress_callback = progress_callback
+        self.cancellation = cancellation
+
+        self.work_dir_pool = work_dir_pool or default_work_dir_pool()
+        self.tmp_dir = self.work_dir_pool.acquire()
         self.material_json_path: Optional[Path] = None
         self.project_json_path: Optional[Path] = None
         self.mdpa_path: Optional[Path] = None
+        self.number_of_stages = 0
 
     def run(self) -> None:
         self.log(f"Starting {self.test_type} simulation...", "info")
 
-        self._copy_simulation_files()
-
-        if self.test_type == "crs":
-            self._prepare_crs_stages()
+        try:
+            with self.timer.phase("run"):
+                self._render_simulation_files()
+
+                output_file_strings = [str(p) for p in self._output_file_paths()]
+                runner = GenericTestRunner(
+                    output_file_strings,
+                    str(self.tmp_dir),
+                    logger=self.log,
+                    timer=self.timer,
+                )
+                if self.progress_callback is None and self.cancellation is None:
+                    runner.run()
+                else:
+                    self._run_with_progress_listener(runner)
+        except Exception:
+            self._discard()
+            raise
 
-        self._set_material_constitutive_law()
-        self._set_project_parameters()
-        self._set_mdpa()
+        self.log("Finished analysis", "info")
 
-        output_file_strings = [str(p) for p in self._output_file_paths()]
-        runner = GenericTestRunner(output_file_strings, str(self.tmp_dir))
-        runner.run()
+    def _run_with_progress_listener(self, runner: GenericTestRunner) -> None:
+        throttle = (
+            ProgressThrottle(self.progress_callback)
+            if self.progress_callback is not None
+            else None
+        )
+        number_of_stages = max(self.number_of_stages, 1)
+        end_time = sum(self.stage_durations) if self.stage_durations else self.end_time
+
+        def on_step(progress: SimulationProgress) -> None:
+            if self.cancellation is not None:
+                self.cancellation.raise_if_stopped()
+            if throttle is not None:
+                throttle.add(
+                    replace(
+                        progress, number_of_stages=number_of_stages, end_time=end_time
+                    )
+                )
 
-        self.log("Finished analysis", "info")
+        add_progress_listener(self.capture_id, on_step)
+        try:
+            runner.run()
+        finally:
+            remove_progress_listener(self.capture_id)
+        if throttle is not None:
+            throttle.flush()
+
+    def _discard(self) -> None:
+        """
+        Drops the results of a failed or cancelled run and returns its
+        directory to the pool.
+        """
+        pop_captured_stages(self.capture_id)
+        if self.keep_tmp:
+            self.work_dir_pool.detach(self.tmp_dir)
+        else:
+            self.work_dir_pool.release(self.tmp_dir)
 
-    def post_process_results(self) -> Dict[str, List[float]]:
+    def post_process_results(self) -> SimulationResults:
         try:
             self.log("Collecting results...", "info")
 
-            output_file_strings = [str(p) for p in self._output_file_paths()]
-            cohesion, phi = get_cohesion_and_phi(self.material_inputs)
-            collector = ResultCollector(output_file_strings, cohesion, phi)
-            results = collector.collect_results()
+            with self.timer.phase("post_process_results"):
+                cohesion, phi = get_cohesion_and_phi(self.material_inputs)
+                collector = ResultCollector(
+                    [], cohesion, phi, logger=self.log, timer=self.timer
+                )
+                results = collector.collect_results_of_stages(
+                    pop_captured_stages(self.capture_id)
+                )
+            if self.chrome_trace_path is not None:
+                self.timer.write_chrome_trace(self.chrome_trace_path)
             self.log("Rendering complete.", "info")
             return results
 
         finally:
             if self.keep_tmp:
+                self.work_dir_pool.detach(self.tmp_dir)
                 print(f"[Info] Temporary folder retained at: {self.tmp_dir}")
             else:
                 try:
-                    shutil.rmtree(self.tmp_dir, ignore_errors=True)
-                    pass
+                    self.work_dir_pool.release(self.tmp_dir)
                 except Exception as e:
                     self.log(f"Failed to clean tmp dir: {e}", "warn")
 
@@ -144,39 +246,60 @@ class RunSimulation:
             f"  - {template_dir}"
         )
 
-    def _copy_simulation_files(self) -> None:
+    def _render_simulation_files(self) -> None:
+        """
+        Loads each template once, applies all edits in memory and writes the
+        material, project parameter and mesh files to the temporary folder
+        exactly once.
+        """
         src_dir = self._find_template_dir(self.test_type)
-        copied = {}
-        for filename in REQUIRED_FILES:
-            src_file = src_dir / filename
-            dst_file = self.tmp_dir / filename
-            if src_file.exists():
-                shutil.copy(src_file, dst_file)
-                copied[filename] = dst_file
-
-        if "ProjectParametersOrchestrator.json" in copied:
-            self.project_json_path = copied["ProjectParametersOrchestrator.json"]
-        elif "ProjectParameters.json" in copied:
-            self.project_json_path = copied["ProjectParameters.json"]
-        else:
+        project_file_name = next(
+            (name for name in PROJECT_FILES if (src_dir / name).exists()), None
+        )
+        if project_file_name is None:
             raise FileNotFoundError(
                 "Neither ProjectParametersOrchestrator.json nor ProjectParameters.json found in template."
             )
-
-        self.material_json_path = copied.get("MaterialParameters.json")
-        self.mdpa_path = copied.get("mesh.mdpa")
-        if self.mdpa_path is None:
+        if not (src_dir / MDPA_FILE).exists():
             raise FileNotFoundError("mesh.mdpa missing in template set.")
 
-    def _prepare_crs_stages(self) -> None:
+        with self.timer.phase("render_inputs"):
+            with self.timer.phase("load_templates"):
+                project_editor = ProjectParameterEditor(
+                    str(src_dir / project_file_name)
+                )
+                material_editor = MaterialEditor(str(src_dir / MATERIAL_FILE))
+                mdpa_editor = MdpaEditor(str(src_dir / MDPA_FILE))
+
+            if self.test_type == "crs":
+                with self.timer.phase("prepare_crs_stages"):
+                    self._prepare_crs_stages(project_editor)
+
+            with self.timer.phase("set_material"):
+                self._set_material_constitutive_law(material_editor)
+            with self.timer.phase("set_project_parameters"):
+                self._set_project_parameters(project_editor)
+            with self.timer.phase("set_output_processes"):
+                self._set_output_processes(project_editor)
+            with self.timer.phase("set_mdpa"):
+                self._set_mdpa(mdpa_editor)
+            self.number_of_stages = project_editor.number_of_stages
+
+            with self.timer.phase("write_inputs"):
+                self.material_json_path = self.tmp_dir / MATERIAL_FILE
+                self.project_json_path = self.tmp_dir / project_file_name
+                self.mdpa_path = self.tmp_dir / MDPA_FILE
+                material_editor.save(self.material_json_path)
+                project_editor.save(self.project_json_path)
+                mdpa_editor.save(self.mdpa_path)
+
+    def _prepare_crs_stages(self, editor: ProjectParameterEditor) -> None:
         if not self.stage_durations or not self.step_counts:
             raise ValueError(
                 "CRS test requires both stage durations and step counts to be provided."
             )
 
-        editor = ProjectParameterEditor(str(self.project_json_path))
-        data = json.load(open(self.project_json_path, "r"))
-        current_stages = len(data.get("stages", {}))
+        current_stages = editor.number_of_stages
         required_stages = len(self.stage_durations)
 
         if required_stages > current_stages:
@@ -185,18 +308,12 @@ class RunSimulation:
             ):
                 editor.append_stage(duration=d, steps=s)
 
-    def _set_material_constitutive_law(self) -> None:
-        editor = MaterialEditor(str(self.material_json_path))
+    def _set_material_constitutive_law(self, editor: MaterialEditor) -> None:
         editor.update_material_properties(self.material_inputs.get_kratos_inputs())
         editor.set_constitutive_law(self.material_inputs.kratos_law_name)
 
-    def _set_project_parameters(self) -> None:
-        with open(self.project_json_path, "r") as f:
-            data = json.load(f)
-
-        editor = ProjectParameterEditor(str(self.project_json_path))
-
-        if "stages" in data:
+    def _set_project_parameters(self, editor: ProjectParameterEditor) -> None:
+        if editor.has_stages:
             if self.stage_durations and self.step_counts:
                 if len(self.stage_durations) != len(self.step_counts):
                     raise ValueError(
@@ -230,8 +347,16 @@ class RunSimulation:
             "apply_initial_uniform_stress_field", "value", stress_vector
         )
 
-    def _set_mdpa(self) -> None:
-        editor = MdpaEditor(str(self.mdpa_path))
+    def _set_output_processes(self, editor: ProjectParameterEditor) -> None:
+        editor.add_output_process(
+            "result_capture",
+            lambda model_part_name: capture_process_settings(
+                model_part_name, self.capture_id, list(WANTED_RESULTS)
+            ),
+            keep_gid_output=self.write_gid_output,
+        )
+
+    def _set_mdpa(self, editor: MdpaEditor) -> None:
         editor.update_maximum_strain(self.maximum_strain)
         editor.update_end_time(self.end_time)
 
@@ -252,12 +377,9 @@ class RunSimulation:
             editor.update_top_displacement_tables(len(self.stage_durations))
 
     def _output_file_paths(self) -> List[Path]:
-        with open(self.project_json_path, "r") as f:
-            project_data = json.load(f)
-
-        if "stages" in project_data:
+        if self.number_of_stages:
             return [
                 self.tmp_dir / "gid_output" / f"output_stage{i + 1}.post.res"
-                for i in range(len(project_data["stages"]))
+                for i in range(self.number_of_stages)
             ]
         return [self.tmp_dir / "gid_output" / "output.post.res"]
@@ -0,0 +1,104 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from typing import Callable, Optional
+
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    ANALYTICAL,
+    FINITE_ELEMENT,
+    MATERIAL_POINT,
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+    validate_execution_mode,
+)
+from kratos_element_test.model.phase_timer import PhaseTimer
+from kratos_element_test.model.pipeline.linear_elastic_simulation import (
+    LinearElasticSimulation,
+)
+from kratos_element_test.model.pipeline.progress import SimulationProgress
+from kratos_element_test.model.pipeline.simulation_run import CancellationToken
+
+
+def solution_method(
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+    execution_mode: str = FINITE_ELEMENT,
+    force_finite_element: bool = False,
+) -> str:
+    """
+    Returns how a test is solved: analytically for linear elastic material in
+    finite element mode, unless the finite element model is forced (e.g. to
+    verify the analytical solution), and otherwise in the execution mode.
+    """
+    validate_execution_mode(execution_mode)
+    if (
+        execution_mode == FINITE_ELEMENT
+        and not force_finite_element
+        and isinstance(material_inputs, LinearElasticMaterialInputs)
+    ):
+        return ANALYTICAL
+    return execution_mode
+
+
+def create_simulation(
+    *,
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+    logger: Optional[Callable[[str, str], None]] = None,
+    execution_mode: str = FINITE_ELEMENT,
+    force_finite_element: bool = False,
+    timer: Optional[PhaseTimer] = None,
+    progress_callback: Optional[Callable[[SimulationProgress], None]] = None,
+    cancellation: Optional[CancellationToken] = None,
+):
+    """
+    Returns the simulation of an element test for the execution mode: the
+    finite element model of the templates, or a single material point that
+    drives the constitutive law directly. Linear elastic tests in finite
+    element mode are solved analytically, unless `force_finite_element` is set.
+    All have run() and post_process_results(). Only the finite element model
+    reports its progress to `progress_callback`; the others take milliseconds.
+    The finite element and material point runs stop when `cancellation` is
+    cancelled or times out.
+    """
+    method = solution_method(material_inputs, execution_mode, force_finite_element)
+    if method == ANALYTICAL:
+        return LinearElasticSimulation(
+            test_inputs=test_inputs,
+            material_inputs=material_inputs,
+            logger=logger,
+            timer=timer,
+        )
+    # Imported here, so Kratos is only loaded by the first simulation that needs it
+    if method == MATERIAL_POINT:
+        from kratos_element_test.model.pipeline.material_point_simulation import (
+            MaterialPointSimulation,
+        )
+
+        return MaterialPointSimulation(
+            test_inputs=test_inputs,
+            material_inputs=material_inputs,
+            logger=logger,
+            timer=timer,
+            cancellation=cancellation,
+        )
+
+    from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+
+    return RunSimulation(
+        test_inputs=test_inputs,
+        material_inputs=material_inputs,
+        logger=logger,
+        timer=timer,
+        progress_callback=progress_callback,
+        cancellation=cancellation,
+    )
@@ -0,0 +1,113 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
+
+
+def run_simulation_in_worker(
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+    keep_tmp: bool = False,
+) -> SimulationResults:
+    """
+    Runs a single simulation and returns its collected results. Meant to be
+    executed in a worker process of a SimulationPool.
+    """
+    # Imported here, so Kratos is only loaded after the worker initializer ran
+    from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+
+    sim = RunSimulation(
+        test_inputs=test_inputs, material_inputs=material_inputs, keep_tmp=keep_tmp
+    )
+    sim.run()
+    return sim.post_process_results()
+
+
+def _initialize_worker(threads_per_worker: int) -> None:
+    os.environ["OMP_NUM_THREADS"] = str(threads_per_worker)
+
+
+class SimulationPool:
+    """
+    Runs simulations in separate worker processes.
+
+    Kratos analyses change the working directory of the process they run in,
+    so simulations cannot share a process. Every worker of this pool runs one
+    simulation at a time. Workers are started with the 'spawn' method, which
+    behaves the same on Windows and Linux.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, threads_per_worker: int = 1):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.threads_per_worker = threads_per_worker
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "SimulationPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown(cancel_pending=exc_type is not None)
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(self.threads_per_worker,),
+        )
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+        self._executor = None
+
+    def submit(self, function: Callable, *args, **kwargs) -> Future:
+        """
+        Submits a picklable, module-level function to the pool.
+        """
+        self.start()
+        return self._executor.submit(function, *args, **kwargs)
+
+    def submit_simulation(
+        self,
+        test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+        material_inputs: (
+            LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+        ),
+    ) -> Future:
+        return self.submit(run_simulation_in_worker, test_inputs, material_inputs)
+
+    def run_simulations(
+        self, jobs: Iterable[Tuple[object, object]]
+    ) -> Iterator[Tuple[int, Future]]:
+        """
+        Submits all (test_inputs, material_inputs) pairs and yields
+        (index, future) tuples in order of completion.
+        """
+        futures = {
+            self.submit_simulation(test_inputs, material_inputs): index
+            for index, (test_inputs, material_inputs) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future
@@ -0,0 +1,126 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import threading
+import time
+from typing import Callable, Optional
+
+from kratos_element_test.model.models import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    RUNNING,
+    TIMED_OUT,
+)
+
+
+class SimulationCancelled(Exception):
+    """
+    Raised when a run is cancelled, or stopped because it exceeded its timeout.
+    """
+
+    def __init__(self, message: str, timed_out: bool = False):
+        super().__init__(message)
+        self.timed_out = timed_out
+
+    @property
+    def state(self) -> str:
+        return TIMED_OUT if self.timed_out else CANCELLED
+
+
+class CancellationToken:
+    """
+    Tells a running simulation to stop, on request or when the timeout has
+    passed. The simulation checks the token at every step, or kills the
+    worker process that runs it.
+    """
+
+    def __init__(self, timeout_in_seconds: Optional[float] = None):
+        self.timeout_in_seconds = timeout_in_seconds
+        self._deadline = (
+            time.monotonic() + timeout_in_seconds if timeout_in_seconds else None
+        )
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def timed_out(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    @property
+    def stopped(self) -> bool:
+        return self.cancelled or self.timed_out
+
+    def raise_if_stopped(self) -> None:
+        if self.cancelled:
+            raise SimulationCancelled("The simulation was cancelled.")
+        if self.timed_out:
+            raise SimulationCancelled(
+                f"The simulation exceeded the timeout of {self.timeout_in_seconds:g} s.",
+                timed_out=True,
+            )
+
+
+class SimulationRun:
+    """
+    Handle of a simulation that runs on a background thread. `target` runs
+    the simulation and gets the cancellation token to pass on. When the run
+    ends, its state is one of completed, failed, cancelled or timed out, and
+    `on_finished` is called with the handle on the background thread.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[CancellationToken], None],
+        timeout_in_seconds: Optional[float] = None,
+        on_finished: Optional[Callable[["SimulationRun"], None]] = None,
+    ):
+        self._target = target
+        self._on_finished = on_finished
+        self.cancellation = CancellationToken(timeout_in_seconds)
+        self.state = RUNNING
+        self.error: Optional[Exception] = None
+        self._finished = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="simulation-run", daemon=True
+        )
+
+    def start(self) -> "SimulationRun":
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self.cancellation.cancel()
+
+    @property
+    def done(self) -> bool:
+        return self._finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the run has ended, or `timeout` seconds have passed.
+        Returns whether the run has ended.
+        """
+        return self._finished.wait(timeout)
+
+    def _run(self) -> None:
+        try:
+            self._target(self.cancellation)
+            self.state = COMPLETED
+        except SimulationCancelled as e:
+            self.state = e.state
+            self.error = e
+        except Exception as e:
+            self.state = FAILED
+            self.error = e
+        finally:
+            self._finished.set()
+            if self._on_finished is not None:
+                self._on_finished(self)
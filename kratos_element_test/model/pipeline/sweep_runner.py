@@ -0,0 +1,198 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.design_of_experiments import (
+    SweepSpec,
+    build_design_run,
+    design_point_name,
+)
+from kratos_element_test.model.io.columnar_result_store import ColumnarResultStore
+from kratos_element_test.model.job_spec import JobRun
+from kratos_element_test.model.models import FINITE_ELEMENT, validate_execution_mode
+from kratos_element_test.model.pipeline.batch_runner import run_timed_simulation
+from kratos_element_test.model.pipeline.simulation_pool import SimulationPool
+from kratos_element_test.model.simulation_results import SimulationResults
+
+SWEEP_FILE_NAME = "sweep.json"
+# Runs submitted to the pool per worker, so inputs and finished results do not
+# pile up for large designs
+RUNS_IN_FLIGHT_PER_WORKER = 2
+
+
+class SweepRunner:
+    """
+    Runs all points of an experiment design and streams the results of every
+    run into a ColumnarResultStore as soon as it completes.
+
+    The output directory holds the store and ``sweep.json``, which describes
+    the design and summarises the runs.
+    """
+
+    def __init__(
+        self,
+        spec: SweepSpec,
+        output_directory: Path,
+        logger: Optional[Callable[[str, str], None]] = None,
+        workers: int = 1,
+        execution_mode: str = FINITE_ELEMENT,
+        force_finite_element: bool = False,
+    ):
+        validate_execution_mode(execution_mode)
+        self.spec = spec
+        self.output_directory = Path(output_directory)
+        self._log = logger or _fallback_log
+        self.workers = max(1, workers)
+        self.execution_mode = execution_mode
+        self.force_finite_element = force_finite_element
+
+    def run(self) -> Dict:
+        store = ColumnarResultStore(self.output_directory)
+        sweep = {
+            "started_at": _timestamp(),
+            "finished_at": None,
+            "method": self.spec.method,
+            "samples": self.spec.samples,
+            "levels": self.spec.levels,
+            "seed": self.spec.seed,
+            "execution_mode": self.execution_mode,
+            "force_finite_element": self.force_finite_element,
+            "factors": [asdict(factor) for factor in self.spec.factors],
+            "base": self.spec.base,
+            "number_of_runs": len(self.spec.points),
+            "number_of_failures": None,
+        }
+        self._write_sweep(sweep)
+
+        if self.workers > 1:
+            failures = self._run_in_pool(store)
+        else:
+            failures = self._run_sequentially(store)
+
+        sweep["finished_at"] = _timestamp()
+        sweep["number_of_failures"] = failures
+        self._write_sweep(sweep)
+        return sweep
+
+    def _job_runs(self) -> Iterator[Tuple[int, JobRun | Exception]]:
+        # Runs are built when they are needed, and invalid design points are
+        # recorded as failed runs instead of stopping the sweep
+        for index, point in enumerate(self.spec.points):
+            try:
+                yield index, build_design_run(
+                    self.spec.base, point, design_point_name(index)
+                )
+            except ValueError as e:
+                yield index, e
+
+    def _run_sequentially(self, store: ColumnarResultStore) -> int:
+        failures = 0
+        number_of_runs = len(self.spec.points)
+        for index, job_run in self._job_runs():
+            name = design_point_name(index)
+            self._log(f"[{index + 1}/{number_of_runs}] Running '{name}'...", "info")
+            if isinstance(job_run, Exception):
+                outcome = job_run
+            else:
+                try:
+                    outcome = run_timed_simulation(
+                        job_run.test_inputs,
+                        job_run.material_inputs,
+                        self._log,
+                        self.execution_mode,
+                        self.force_finite_element,
+                    )
+                except Exception as e:
+                    outcome = e
+            failures += not self._store(store, index, outcome)
+        return failures
+
+    def _run_in_pool(self, store: ColumnarResultStore) -> int:
+        failures = 0
+        finished = 0
+        number_of_runs = len(self.spec.points)
+        job_runs = self._job_runs()
+        in_flight = {}
+        with SimulationPool(max_workers=self.workers) as pool:
+            while True:
+                while len(in_flight) < self.workers * RUNS_IN_FLIGHT_PER_WORKER:
+                    index, job_run = next(job_runs, (None, None))
+                    if index is None:
+                        break
+                    if isinstance(job_run, Exception):
+                        failures += not self._store(store, index, job_run)
+                        finished += 1
+                        continue
+                    future = pool.submit(
+                        run_timed_simulation,
+                        job_run.test_inputs,
+                        job_run.material_inputs,
+                        None,
+                        self.execution_mode,
+                        self.force_finite_element,
+                    )
+                    in_flight[future] = index
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        outcome = e
+                    failures += not self._store(store, index, outcome)
+                    finished += 1
+                    self._log(
+                        f"[{finished}/{number_of_runs}] Finished "
+                        f"'{design_point_name(index)}'.",
+                        "info",
+                    )
+        return failures
+
+    def _store(
+        self,
+        store: ColumnarResultStore,
+        index: int,
+        outcome: Tuple[SimulationResults, float] | Exception,
+    ) -> bool:
+        name = design_point_name(index)
+        point = self.spec.points[index]
+        if isinstance(outcome, Exception):
+            self._log(f"Run '{name}' failed: {outcome}", "error")
+            store.append(
+                index,
+                name=name,
+                status="failed",
+                error=str(outcome),
+                factors=point,
+            )
+            return False
+
+        results, wall_time = outcome
+        store.append(
+            index,
+            results,
+            name=name,
+            status="completed",
+            wall_time_in_seconds=wall_time,
+            factors=point,
+        )
+        return True
+
+    def _write_sweep(self, sweep: Dict) -> None:
+        with open(self.output_directory / SWEEP_FILE_NAME, "w") as f:
+            json.dump(sweep, f, indent=4, default=str)
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -0,0 +1,210 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+import os
+from concurrent.futures import as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    FINITE_ELEMENT,
+    TriaxialAndShearSimulationInputs,
+    validate_execution_mode,
+)
+from kratos_element_test.model.pipeline.batch_runner import run_timed_simulation
+from kratos_element_test.model.pipeline.simulation_pool import SimulationPool
+from kratos_element_test.model.simulation_results import SimulationResults
+from kratos_element_test.model.triaxial_series import (
+    FailureEnvelope,
+    fit_failure_envelope,
+    series_test_inputs,
+)
+
+SERIES_FILE_NAME = "triaxial_series.json"
+
+
+@dataclass
+class TriaxialSeriesResult:
+    """
+    The results of a triaxial test at each cell pressure (None for failed
+    runs, with the reason in `errors`) and the failure envelope fitted to the
+    final stresses of the completed runs.
+    """
+
+    cell_pressures: List[float]
+    results: List[Optional[SimulationResults]]
+    errors: List[Optional[str]]
+    envelope: Optional[FailureEnvelope] = None
+    envelope_error: Optional[str] = None
+    wall_times_in_seconds: List[Optional[float]] = field(default_factory=list)
+
+    def failure_stresses(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns σ₁ and σ₃ at the end of every completed run.
+        """
+        completed = [results for results in self.results if results is not None]
+        return (
+            np.array([results["sigma1"][-1] for results in completed]),
+            np.array([results["sigma3"][-1] for results in completed]),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "envelope": asdict(self.envelope) if self.envelope else None,
+            "envelope_error": self.envelope_error,
+            "runs": [
+                {
+                    "cell_pressure": cell_pressure,
+                    "status": "completed" if results is not None else "failed",
+                    "error": error,
+                    "wall_time_in_seconds": wall_time,
+                    "sigma1_at_failure": (
+                        float(results["sigma1"][-1]) if results is not None else None
+                    ),
+                    "sigma3_at_failure": (
+                        float(results["sigma3"][-1]) if results is not None else None
+                    ),
+                    "results": results.to_dict() if results is not None else None,
+                }
+                for cell_pressure, results, error, wall_time in zip(
+                    self.cell_pressures,
+                    self.results,
+                    self.errors,
+                    self.wall_times_in_seconds,
+                )
+            ],
+        }
+
+    def write(self, output_directory: Path) -> Path:
+        output_directory = Path(output_directory)
+        output_directory.mkdir(parents=True, exist_ok=True)
+        series_file = output_directory / SERIES_FILE_NAME
+        with open(series_file, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+        return series_file
+
+
+class TriaxialSeriesRunner:
+    """
+    Shears the same soil at several cell pressures, like a lab programme does,
+    and fits c' and φ' to the Mohr circles at failure.
+
+    The tests are independent, so they run concurrently in a SimulationPool,
+    one worker per cell pressure unless `workers` limits it.
+    """
+
+    def __init__(
+        self,
+        test_inputs: TriaxialAndShearSimulationInputs,
+        material_inputs: (
+            LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+        ),
+        cell_pressures: Sequence[float],
+        logger: Optional[Callable[[str, str], None]] = None,
+        workers: Optional[int] = None,
+        execution_mode: str = FINITE_ELEMENT,
+        force_finite_element: bool = False,
+    ):
+        validate_execution_mode(execution_mode)
+        self.test_inputs = series_test_inputs(test_inputs, cell_pressures)
+        for inputs in self.test_inputs:
+            inputs.validate()
+        self.material_inputs = material_inputs
+        self.cell_pressures = [float(pressure) for pressure in cell_pressures]
+        self._log = logger or _fallback_log
+        self.workers = max(
+            1, min(workers or os.cpu_count() or 1, len(self.cell_pressures))
+        )
+        self.execution_mode = execution_mode
+        self.force_finite_element = force_finite_element
+
+    def run(self) -> TriaxialSeriesResult:
+        self._log(
+            f"Running triaxial tests at {len(self.cell_pressures)} cell pressures "
+            f"({', '.join(f'{p:g}' for p in self.cell_pressures)} kN/m²)...",
+            "info",
+        )
+        if self.workers > 1:
+            outcomes = self._run_in_pool()
+        else:
+            outcomes = self._run_sequentially()
+
+        series = TriaxialSeriesResult(
+            cell_pressures=self.cell_pressures,
+            results=[None] * len(outcomes),
+            errors=[None] * len(outcomes),
+            wall_times_in_seconds=[None] * len(outcomes),
+        )
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                self._log(
+                    f"Triaxial test at {self.cell_pressures[index]:g} kN/m² "
+                    f"failed: {outcome}",
+                    "error",
+                )
+                series.errors[index] = str(outcome)
+                continue
+            series.results[index], series.wall_times_in_seconds[index] = outcome
+
+        try:
+            series.envelope = fit_failure_envelope(*series.failure_stresses())
+        except ValueError as e:
+            series.envelope_error = str(e)
+            self._log(f"No failure envelope fitted: {e}", "warn")
+            return series
+
+        self._log(
+            f"Fitted failure envelope: c' = {series.envelope.cohesion:.4g} kN/m², "
+            f"φ' = {series.envelope.friction_angle:.4g}°.",
+            "info",
+        )
+        return series
+
+    def _run_sequentially(self) -> List:
+        outcomes = []
+        for test_inputs in self.test_inputs:
+            try:
+                outcomes.append(
+                    run_timed_simulation(
+                        test_inputs,
+                        self.material_inputs,
+                        self._log,
+                        self.execution_mode,
+                        self.force_finite_element,
+                    )
+                )
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _run_in_pool(self) -> List:
+        outcomes = [None] * len(self.test_inputs)
+        with SimulationPool(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(
+                    run_timed_simulation,
+                    test_inputs,
+                    self.material_inputs,
+                    None,
+                    self.execution_mode,
+                    self.force_finite_element,
+                ): index
+                for index, test_inputs in enumerate(self.test_inputs)
+            }
+            for future in as_completed(futures):
+                try:
+                    outcomes[futures[future]] = future.result()
+                except Exception as e:
+                    outcomes[futures[future]] = e
+        return outcomes
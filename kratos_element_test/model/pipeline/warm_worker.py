@@ -0,0 +1,309 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from typing import Callable, Optional
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    FINITE_ELEMENT,
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.progress import SimulationProgress
+from kratos_element_test.model.pipeline.simulation_run import (
+    CancellationToken,
+    SimulationCancelled,
+)
+from kratos_element_test.model.pipeline.work_dir_pool import (
+    WorkDirPool,
+    _default_base_directory,
+    set_default_work_dir_pool,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
+
+ORCHESTRATOR_NAME = "Orchestrators.KratosMultiphysics.SequentialOrchestrator"
+
+# How often a cancellable run checks whether it has been cancelled or timed out
+CANCELLATION_POLL_INTERVAL_IN_SECONDS = 0.1
+
+
+def _peak_memory_in_mb() -> float:
+    """
+    Returns the peak resident memory of the current process in MB.
+    """
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters),
+            counters.cb,
+        )
+        return counters.PeakWorkingSetSize / 1024**2
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _warm_up() -> None:
+    import KratosMultiphysics as Kratos
+    import KratosMultiphysics.GeoMechanicsApplication  # noqa: F401
+    import KratosMultiphysics.LinearSolversApplication  # noqa: F401
+    import importlib
+
+    from kratos_element_test.model.pipeline import simulation_factory  # noqa: F401
+
+    registry_entry = Kratos.Registry[ORCHESTRATOR_NAME]
+    importlib.import_module(registry_entry["ModuleName"])
+
+
+def _worker_main(connection, work_directory: str) -> None:
+    # The parent removes the working directories of the runs below this
+    # directory, also when it has to kill the worker
+    set_default_work_dir_pool(WorkDirPool(Path(work_directory)))
+    _warm_up()
+    from kratos_element_test.model.pipeline.simulation_factory import (
+        create_simulation,
+    )
+
+    connection.send(("ready", _peak_memory_in_mb()))
+
+    def log(msg: str, level: str = "info") -> None:
+        connection.send(("log", msg, level))
+
+    def report_progress(progress) -> None:
+        connection.send(("progress", progress))
+
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            # The parent process is gone
+            break
+        if message[0] == "stop":
+            break
+
+        (
+            _,
+            test_inputs,
+            material_inputs,
+            execution_mode,
+            force_finite_element,
+            wants_progress,
+        ) = message
+        try:
+            sim = create_simulation(
+                test_inputs=test_inputs,
+                material_inputs=material_inputs,
+                logger=log,
+                execution_mode=execution_mode,
+                force_finite_element=force_finite_element,
+                progress_callback=report_progress if wants_progress else None,
+            )
+            sim.run()
+            results = sim.post_process_results()
+            connection.send(("result", results, _peak_memory_in_mb()))
+        except Exception as e:
+            connection.send(("error", str(e), traceback.format_exc()))
+
+
+class WarmWorker:
+    """
+    A long-lived worker process that imports Kratos once and then runs
+    simulations on request, so short runs do not pay the Kratos start-up cost.
+
+    The worker is replaced by a fresh one after `max_runs` runs, or when its
+    peak memory exceeds `max_memory_in_mb`. The replacement is started right
+    away, so it warms up while the caller processes the results.
+
+    A run that is cancelled or times out is stopped by killing the worker,
+    which also stops a constitutive law that hangs inside Kratos. Its
+    working directory is removed and a fresh worker is started.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[Callable[[str, str], None]] = None,
+        max_runs: int = 50,
+        max_memory_in_mb: float = 2048.0,
+        start: bool = True,
+    ):
+        self._log = logger or _fallback_log
+        self.max_runs = max_runs
+        self.max_memory_in_mb = max_memory_in_mb
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process = None
+        self._connection = None
+        self._work_directory: Optional[Path] = None
+        self._runs_in_current_process = 0
+        if start:
+            self.start()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    def start(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            return
+        parent_connection, child_connection = self._context.Pipe()
+        self._work_directory = Path(
+            tempfile.mkdtemp(
+                prefix="kratos_worker_",
+                dir=_default_base_directory(use_ram_disk=True),
+            )
+        )
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(child_connection, str(self._work_directory)),
+            name="kratos-warm-worker",
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+        self._connection = parent_connection
+        self._runs_in_current_process = 0
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        if self._process is None:
+            return
+        try:
+            self._connection.send(("stop",))
+        except (BrokenPipeError, OSError):
+            pass
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._close()
+
+    def _kill(self) -> None:
+        self._process.kill()
+        self._process.join()
+        self._close()
+
+    def _close(self) -> None:
+        self._connection.close()
+        shutil.rmtree(self._work_directory, ignore_errors=True)
+        self._process = None
+        self._connection = None
+        self._work_directory = None
+
+    def run(
+        self,
+        test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+        material_inputs: (
+            LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+        ),
+        execution_mode: str = FINITE_ELEMENT,
+        force_finite_element: bool = False,
+        progress_callback: Optional[Callable[[SimulationProgress], None]] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> SimulationResults:
+        """
+        Runs a simulation in the worker process. The progress reports of the
+        worker are passed on to `progress_callback` on the calling thread.
+        Raises SimulationCancelled when `cancellation` is cancelled or times
+        out before the results arrive.
+        """
+        with self._lock:
+            self.start()
+            try:
+                self._connection.send(
+                    (
+                        "run",
+                        test_inputs,
+                        material_inputs,
+                        execution_mode,
+                        force_finite_element,
+                        progress_callback is not None,
+                    )
+                )
+                results, peak_memory_in_mb = self._wait_for_results(
+                    progress_callback, cancellation
+                )
+            except SimulationCancelled as e:
+                self._log(f"{e} Restarting the simulation worker.", "warn")
+                self.start()
+                raise
+            except (EOFError, BrokenPipeError, ConnectionResetError):
+                self.shutdown()
+                self.start()
+                raise RuntimeError(
+                    "The simulation worker process stopped unexpectedly."
+                )
+
+            self._runs_in_current_process += 1
+            if (
+                self._runs_in_current_process >= self.max_runs
+                or peak_memory_in_mb >= self.max_memory_in_mb
+            ):
+                self._recycle(peak_memory_in_mb)
+            return results
+
+    def _wait_for_results(self, progress_callback=None, cancellation=None):
+        # A "ready" message from a worker that just warmed up is skipped
+        while True:
+            message = self._receive(cancellation)
+            kind = message[0]
+            if kind == "log":
+                self._log(message[1], message[2])
+            elif kind == "progress":
+                if progress_callback is not None:
+                    progress_callback(message[1])
+            elif kind == "result":
+                return message[1], message[2]
+            elif kind == "error":
+                self._log(message[2], "error")
+                raise RuntimeError(message[1])
+
+    def _receive(self, cancellation: Optional[CancellationToken]):
+        if cancellation is not None:
+            while not self._connection.poll(CANCELLATION_POLL_INTERVAL_IN_SECONDS):
+                if cancellation.stopped:
+                    self._kill()
+                    cancellation.raise_if_stopped()
+        return self._connection.recv()
+
+    def _recycle(self, peak_memory_in_mb: float) -> None:
+        self._log(
+            f"Restarting simulation worker after {self._runs_in_current_process} run(s) "
+            f"(peak memory {peak_memory_in_mb:.0f} MB).",
+            "info",
+        )
+        self.shutdown()
+        self.start()
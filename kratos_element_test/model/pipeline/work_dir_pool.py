@@ -0,0 +1,194 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Set
+
+# A RAM-backed file system that is available on most Linux systems
+RAM_DISK = Path("/dev/shm")
+
+
+def _default_base_directory(use_ram_disk: bool) -> Path:
+    if use_ram_disk and RAM_DISK.is_dir() and os.access(RAM_DISK, os.W_OK):
+        return RAM_DISK
+    return Path(tempfile.gettempdir())
+
+
+def _clear_directory(directory: Path) -> None:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+class WorkDirPool:
+    """
+    Hands out empty working directories for simulations and reuses them.
+
+    Creating and deleting a temporary directory for every run is slow on some
+    file systems (e.g. network mounted home directories). The pool creates its
+    directories up front, below a RAM-backed file system when one is
+    available, and empties returned directories on a background thread before
+    handing them out again. Nothing is deleted on the critical path of a run.
+    """
+
+    def __init__(
+        self,
+        base_directory: Optional[Path] = None,
+        size: int = 2,
+        use_ram_disk: bool = True,
+    ):
+        self.base_directory = Path(
+            base_directory or _default_base_directory(use_ram_disk)
+        )
+        self._lock = threading.Lock()
+        self._directories: Set[Path] = set()
+        self._free: List[Path] = []
+        self._cleaner = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="work_dir_cleaner"
+        )
+        self._pending: Set[Future] = set()
+        self._closed = False
+        for _ in range(size):
+            self._free.append(self._create())
+
+    def _create(self) -> Path:
+        directory = Path(
+            tempfile.mkdtemp(prefix="kratos_element_test_", dir=self.base_directory)
+        )
+        self._directories.add(directory)
+        return directory
+
+    @property
+    def number_of_free_directories(self) -> int:
+        with self._lock:
+            return len(self._free)
+
+    def acquire(self) -> Path:
+        """
+        Returns an empty directory for the exclusive use of one run. A new
+        directory is created when all directories are in use or still being
+        emptied.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The working directory pool has been shut down.")
+            return self._free.pop() if self._free else self._create()
+
+    def release(self, directory: Path) -> None:
+        """
+        Returns a directory to the pool. It is emptied on the background
+        thread and handed out again afterwards.
+        """
+        directory = Path(directory)
+        with self._lock:
+            future = None
+            if not self._closed:
+                future = self._cleaner.submit(self._reset, directory)
+                self._pending.add(future)
+        if future is None:
+            shutil.rmtree(directory, ignore_errors=True)
+            return
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def detach(self, directory: Path) -> Path:
+        """
+        Takes a directory out of the pool, so it is kept as it is, e.g. to
+        inspect the files of a run. The caller is responsible for removing it.
+        """
+        directory = Path(directory)
+        with self._lock:
+            self._directories.discard(directory)
+        return directory
+
+    def _reset(self, directory: Path) -> None:
+        try:
+            _clear_directory(directory)
+        except OSError:
+            # Directories that cannot be emptied (e.g. a file that is still
+            # open on Windows) are not reused
+            with self._lock:
+                self._directories.discard(directory)
+            shutil.rmtree(directory, ignore_errors=True)
+            return
+        with self._lock:
+            if not self._closed:
+                self._free.append(directory)
+
+    def wait_for_cleanup(self) -> None:
+        """
+        Blocks until all returned directories have been emptied.
+        """
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return
+            for future in pending:
+                future.result()
+
+    def shutdown(self) -> None:
+        """
+        Removes all directories of the pool, except the detached ones.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._cleaner.shutdown(wait=True)
+        with self._lock:
+            directories, self._directories = self._directories, set()
+            self._free.clear()
+        for directory in directories:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def __enter__(self) -> "WorkDirPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+
+_default_pool: Optional[WorkDirPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def default_work_dir_pool() -> WorkDirPool:
+    """
+    Returns the working directory pool of this process, which is created on
+    first use and removed when the process exits.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = WorkDirPool()
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
+
+
+def set_default_work_dir_pool(pool: WorkDirPool) -> None:
+    """
+    Replaces the working directory pool of this process, e.g. by a pool below
+    a directory that the parent of a worker process removes.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is pool:
+            return
+        if _default_pool is not None:
+            _default_pool.shutdown()
+        _default_pool = pool
+        atexit.register(pool.shutdown)
@@ -0,0 +1,232 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from platformdirs import user_cache_dir
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    FINITE_ELEMENT,
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
+
+CACHE_APP_NAME = "SoilElementSuite"
+CACHE_APP_AUTHOR = "Deltares"
+KRATOS_DISTRIBUTION = "KratosGeoMechanicsApplication"
+
+# Results of a few hundred steps are tens of kilobytes, so this keeps thousands of runs
+DEFAULT_MAX_SIZE_IN_MB = 256.0
+
+# Hashes of the templates and UDSM DLLs that were used last. Older signatures
+# of changed files are dropped, so the hashes do not grow with the session.
+MAX_REMEMBERED_FILE_HASHES = 128
+
+
+def _file_hash(path: Path) -> str:
+    """
+    Returns the sha256 of a file. Hashes are remembered per path, size and
+    modification time, so unchanged files (e.g. a UDSM DLL) are read only once.
+    """
+    stat = path.stat()
+    return _hash_of_file(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=MAX_REMEMBERED_FILE_HASHES)
+def _hash_of_file(path: str, size: int, modification_time_in_ns: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _template_hashes(test_type: str) -> Dict[str, str]:
+    template_dir = (
+        Path(__file__).resolve().parent
+        / "simulation_assets"
+        / "templates"
+        / f"test_{test_type}"
+    )
+    if not template_dir.is_dir():
+        return {}
+    return {
+        path.name: _file_hash(path)
+        for path in sorted(template_dir.iterdir())
+        if path.is_file()
+    }
+
+
+def kratos_version() -> str:
+    try:
+        return metadata.version(KRATOS_DISTRIBUTION)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _udsm_hash(
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+) -> Optional[str]:
+    if not isinstance(material_inputs, UDSMMaterialInputs):
+        return None
+    dll_path = Path(material_inputs.material_parameters.get("UDSM_NAME", ""))
+    if not dll_path.is_file():
+        return None
+    return _file_hash(dll_path)
+
+
+def simulation_cache_key(
+    test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+    solution_method: str = FINITE_ELEMENT,
+) -> str:
+    """
+    Returns a hash that changes whenever anything that affects the results of a
+    simulation changes: the test inputs, the material inputs (including the
+    content of a UDSM DLL and the UDSM number), the solution method, the
+    templates and the Kratos version.
+    """
+    material = asdict(material_inputs)
+    if isinstance(material_inputs, UDSMMaterialInputs):
+        # UMAT_PARAMETERS is only synchronized with the user defined parameters
+        # when the inputs are sent to Kratos, so it is left out of the key
+        material["material_parameters"] = {
+            name: value
+            for name, value in material["material_parameters"].items()
+            if name != "UMAT_PARAMETERS"
+        }
+
+    canonical_inputs = {
+        "test_inputs_type": type(test_inputs).__name__,
+        "test_inputs": asdict(test_inputs),
+        "material_inputs_type": type(material_inputs).__name__,
+        "material_inputs": material,
+        "solution_method": solution_method,
+        "udsm_dll_sha256": _udsm_hash(material_inputs),
+        "templates": _template_hashes(test_inputs.test_type.lower()),
+        "kratos_version": kratos_version(),
+    }
+    serialized = json.dumps(
+        canonical_inputs, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Persistent, size-bounded cache of simulation results.
+
+    Every entry is a JSON file named after the key of the simulation inputs.
+    Reading an entry updates its modification time, and the entries that were
+    used longest ago are removed once the cache grows beyond `max_size_in_mb`.
+    """
+
+    def __init__(
+        self,
+        cache_directory: Optional[Path] = None,
+        max_size_in_mb: float = DEFAULT_MAX_SIZE_IN_MB,
+        logger: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.cache_directory = Path(
+            cache_directory or user_cache_dir(CACHE_APP_NAME, CACHE_APP_AUTHOR)
+        )
+        self.max_size_in_bytes = int(max_size_in_mb * 1024**2)
+        self._log = logger or _fallback_log
+        self.hits = 0
+        self.misses = 0
+
+    def key(
+        self,
+        test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+        material_inputs: (
+            LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+        ),
+        solution_method: str = FINITE_ELEMENT,
+    ) -> str:
+        return simulation_cache_key(test_inputs, material_inputs, solution_method)
+
+    def get(self, key: str) -> Optional[SimulationResults]:
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                results = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            self._log(f"Ignoring unreadable cache entry {path.name}: {e}", "warn")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return SimulationResults.from_dict(results)
+
+    def put(self, key: str, results: SimulationResults) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so readers never see a partial entry
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as f:
+                json.dump(results.to_dict(), f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self._log(f"Could not store results in the cache: {e}", "warn")
+            return
+
+        self._evict()
+
+    def clear(self) -> None:
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def size_in_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self._entries())
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> List[Path]:
+        if not self.cache_directory.is_dir():
+            return []
+        return list(self.cache_directory.glob("*/*.json"))
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size_in_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
@@ -2,7 +2,8 @@ from typing import Callable, Dict, List, Optional
 from pathlib import Path
 import importlib.util
 
-from kratos_element_test.view.ui_constants import TYPE_TO_TEST_NAME
+from kratos_element_test.model.models import COMPLETED, TYPE_TO_TEST_NAME
+from kratos_element_test.model.simulation_results import SimulationResults
 
 
 class ResultManager:
@@ -14,25 +15,46 @@ class ResultManager:
         """
         :param active_test_getter: callable which returns the currently active test
         """
-        self._simulation_results: Dict[str, Dict[str, List[float]]] = {}
+        self._simulation_results: Dict[str, SimulationResults] = {}
         self._experimental_results: Dict[str, Dict[str, List[float]]] = {}
+        self._run_states: Dict[str, str] = {}
         self._active_test_getter = active_test_getter
 
-    def get_results_of_active_test_type(self) -> Optional[Dict[str, List[float]]]:
+    def get_results_of_active_test_type(self) -> Optional[SimulationResults]:
         return self._simulation_results.get(self.get_current_test())
 
-    def set_results_of_active_test_type(self, results: Dict[str, List[float]]):
+    def set_results_of_active_test_type(self, results: SimulationResults):
         self._simulation_results[self._active_test_getter()] = results
+        self._run_states[self._active_test_getter()] = COMPLETED
+
+    def get_run_state_of_active_test_type(self) -> Optional[str]:
+        """
+        Returns the state of the last run of the active test type (e.g.
+        completed or cancelled), or None when it has not been run.
+        """
+        return self._run_states.get(self.get_current_test())
+
+    def set_run_state_of_active_test_type(self, state: str) -> None:
+        """
+        Records the state of a run that did not complete. The results of an
+        earlier run are removed, so they are not mistaken for its results.
+        """
+        self._simulation_results.pop(self._active_test_getter(), None)
+        self._run_states[self._active_test_getter()] = state
 
     def get_current_test(self) -> str:
         return self._active_test_getter()
 
     def clear_results(self) -> None:
         self._simulation_results.clear()
+        self._run_states.clear()
 
     def get_experimental_results(self) -> Dict[str, List[float]]:
         return self._experimental_results.get(self.get_current_test(), {})
 
+    def get_all_experimental_results(self) -> Dict[str, Dict[str, List[float]]]:
+        return dict(self._experimental_results)
+
     def set_experimental_results_for_test_type(
         self, test_type: str, results: Dict[str, List[float]]
     ) -> None:
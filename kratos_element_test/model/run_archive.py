@@ -0,0 +1,373 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import io
+import json
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from platformdirs import user_data_dir
+
+from kratos_element_test.model.core_utils import _fallback_log
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    FINITE_ELEMENT,
+    CRSSimulationInputs,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.result_cache import (
+    CACHE_APP_AUTHOR,
+    CACHE_APP_NAME,
+    kratos_version,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
+
+ARCHIVE_FILE_NAME = "run_archive.sqlite"
+
+# Test inputs that are stored in their own, indexed columns. Only these can be
+# used in queries, besides the material parameters.
+INPUT_COLUMNS = (
+    "maximum_strain",
+    "initial_effective_cell_pressure",
+    "number_of_steps",
+    "duration_in_seconds",
+    "drainage",
+)
+
+# The material types by the names of the material input manager and job specs
+_MATERIAL_TYPES = {
+    LinearElasticMaterialInputs: "linear_elastic",
+    MohrCoulombMaterialInputs: "mohr_coulomb",
+    UDSMMaterialInputs: "udsm",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    test_type TEXT NOT NULL,
+    material_type TEXT NOT NULL,
+    kratos_law_name TEXT,
+    solution_method TEXT NOT NULL,
+    maximum_strain REAL,
+    initial_effective_cell_pressure REAL,
+    number_of_steps INTEGER,
+    duration_in_seconds REAL,
+    drainage TEXT,
+    run_time_in_seconds REAL,
+    phase_timings TEXT,
+    kratos_version TEXT,
+    test_inputs TEXT NOT NULL,
+    material_inputs TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_test ON runs
+    (test_type, material_type, initial_effective_cell_pressure);
+CREATE INDEX IF NOT EXISTS runs_by_creation ON runs (created_at);
+CREATE TABLE IF NOT EXISTS run_parameters (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS run_parameters_by_value ON run_parameters
+    (name, value, run_id);
+CREATE TABLE IF NOT EXISTS run_results (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (id) ON DELETE CASCADE,
+    channels BLOB NOT NULL,
+    scalars TEXT NOT NULL
+);
+"""
+
+
+def _pack_channels(results: SimulationResults) -> bytes:
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer, **{name: results.channel(name) for name in results.channel_names}
+    )
+    return buffer.getvalue()
+
+
+def _unpack_results(channels: bytes, scalars: str) -> SimulationResults:
+    with np.load(io.BytesIO(channels)) as archive:
+        data = {name: archive[name] for name in archive.files}
+    data.update(json.loads(scalars))
+    return SimulationResults(data)
+
+
+def _numeric_parameters(
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    ),
+) -> Dict[str, float]:
+    parameters = {}
+    for name, parameter in material_inputs.user_defined_parameters.items():
+        try:
+            parameters[name] = float(parameter.value)
+        except (TypeError, ValueError):
+            continue
+    return parameters
+
+
+def _condition(column: str, wanted) -> Tuple[str, list]:
+    """
+    Returns the SQL condition and its arguments for one query argument: a
+    (low, high) tuple selects a closed range, where either bound may be None,
+    and any other value selects that value.
+    """
+    if not isinstance(wanted, tuple):
+        return f"{column} = ?", [wanted]
+    low, high = wanted
+    conditions, arguments = [], []
+    if low is not None:
+        conditions.append(f"{column} >= ?")
+        arguments.append(low)
+    if high is not None:
+        conditions.append(f"{column} <= ?")
+        arguments.append(high)
+    return " AND ".join(conditions) or "1", arguments
+
+
+@dataclass
+class ArchivedRun:
+    """
+    A run in the archive. The results are only read from the archive when
+    they are used for the first time.
+    """
+
+    id: int
+    created_at: str
+    test_type: str
+    material_type: str
+    solution_method: str
+    run_time_in_seconds: Optional[float]
+    phase_timings: Dict[str, float]
+    test_inputs: Dict
+    parameters: Dict[str, float]
+    _archive: "RunArchive" = field(repr=False, compare=False)
+    _results: Optional[SimulationResults] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def results(self) -> SimulationResults:
+        if self._results is None:
+            self._results = self.load_results()
+        return self._results
+
+    def load_results(self) -> SimulationResults:
+        """
+        Reads the results from the archive without keeping them, so going
+        through many runs does not hold the results of all of them.
+        """
+        return self._archive.load_results(self.id)
+
+
+class RunArchive:
+    """
+    Local SQLite archive of every completed run: its test and material
+    inputs, its timings and its results. The test inputs and the material
+    parameters are stored in indexed columns, so runs can be looked up by
+    their inputs, and the result channels as one compressed NumPy archive
+    per run. Every call opens its own connection, so the archive can be used
+    from the thread that runs the simulations.
+    """
+
+    def __init__(
+        self,
+        database_path: Optional[Path] = None,
+        logger: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.database_path = Path(
+            database_path
+            or Path(user_data_dir(CACHE_APP_NAME, CACHE_APP_AUTHOR)) / ARCHIVE_FILE_NAME
+        )
+        self._log = logger or _fallback_log
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database_path, timeout=30.0)
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    def add(
+        self,
+        test_inputs: TriaxialAndShearSimulationInputs | CRSSimulationInputs,
+        material_inputs: (
+            LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+        ),
+        results: SimulationResults,
+        solution_method: str = FINITE_ELEMENT,
+        run_time_in_seconds: Optional[float] = None,
+    ) -> Optional[int]:
+        """
+        Stores a run and returns its id, or None when it could not be stored.
+        """
+        test_inputs_dict = asdict(test_inputs)
+        phase_timings = results.timings.totals() if results.timings else {}
+        scalars = {
+            name: results[name] for name in results if name not in results.channel_names
+        }
+        row = {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "test_type": test_inputs.test_type,
+            "material_type": _MATERIAL_TYPES[type(material_inputs)],
+            "kratos_law_name": material_inputs.kratos_law_name,
+            "solution_method": solution_method,
+            **{name: test_inputs_dict.get(name) for name in INPUT_COLUMNS},
+            "run_time_in_seconds": run_time_in_seconds,
+            "phase_timings": json.dumps(phase_timings),
+            "kratos_version": kratos_version(),
+            "test_inputs": json.dumps(test_inputs_dict, default=str),
+            "material_inputs": json.dumps(asdict(material_inputs), default=str),
+        }
+        try:
+            with closing(self._connect()) as connection, connection:
+                cursor = connection.execute(
+                    f"INSERT INTO runs ({', '.join(row)}) "
+                    f"VALUES ({', '.join('?' for _ in row)})",
+                    list(row.values()),
+                )
+                run_id = cursor.lastrowid
+                connection.executemany(
+                    "INSERT INTO run_parameters (run_id, name, value) VALUES (?, ?, ?)",
+                    [
+                        (run_id, name, value)
+                        for name, value in _numeric_parameters(material_inputs).items()
+                    ],
+                )
+                connection.execute(
+                    "INSERT INTO run_results (run_id, channels, scalars) VALUES (?, ?, ?)",
+                    (run_id, _pack_channels(results), json.dumps(scalars)),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._log(f"Could not store the run in the archive: {e}", "warn")
+            return None
+        return run_id
+
+    def find(
+        self,
+        test_type: Optional[str] = None,
+        material_type: Optional[str] = None,
+        solution_method: Optional[str] = None,
+        inputs: Optional[Dict] = None,
+        parameters: Optional[Dict] = None,
+        limit: Optional[int] = None,
+    ) -> List[ArchivedRun]:
+        """
+        Returns the archived runs that match all given arguments, newest
+        first. `inputs` selects on the test inputs of INPUT_COLUMNS and
+        `parameters` on the material parameters. Their values are either a
+        value, or a (low, high) range, e.g. all triaxial runs at 100 kPa with
+        a friction angle between 25 and 35 degrees:
+
+            archive.find(
+                test_type="triaxial",
+                inputs={"initial_effective_cell_pressure": 100.0},
+                parameters={"GEO_FRICTION_ANGLE": (25.0, 35.0)},
+            )
+        """
+        conditions, arguments = [], []
+        for column, wanted in [
+            ("test_type", test_type),
+            ("material_type", material_type),
+            ("solution_method", solution_method),
+        ]:
+            if wanted is not None:
+                conditions.append(f"runs.{column} = ?")
+                arguments.append(wanted)
+
+        for column, wanted in (inputs or {}).items():
+            if column not in INPUT_COLUMNS:
+                raise ValueError(
+                    f"Unknown input: {column}. "
+                    f"Expected one of {', '.join(INPUT_COLUMNS)}."
+                )
+            condition, condition_arguments = _condition(f"runs.{column}", wanted)
+            conditions.append(condition)
+            arguments.extend(condition_arguments)
+
+        for name, wanted in (parameters or {}).items():
+            condition, condition_arguments = _condition("value", wanted)
+            conditions.append(
+                "runs.id IN (SELECT run_id FROM run_parameters "
+                f"WHERE name = ? AND {condition})"
+            )
+            arguments.extend([name, *condition_arguments])
+
+        query = (
+            "SELECT id, created_at, test_type, material_type, solution_method, "
+            "run_time_in_seconds, phase_timings, test_inputs FROM runs"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY runs.id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            arguments.append(int(limit))
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, arguments).fetchall()
+            parameters_by_run: Dict[int, Dict[str, float]] = {
+                row[0]: {} for row in rows
+            }
+            for run_id, name, value in connection.execute(
+                "SELECT run_id, name, value FROM run_parameters "
+                f"WHERE run_id IN (SELECT id FROM ({query}))",
+                arguments,
+            ):
+                parameters_by_run[run_id][name] = value
+
+        return [
+            ArchivedRun(
+                id=run_id,
+                created_at=created_at,
+                test_type=run_test_type,
+                material_type=run_material_type,
+                solution_method=run_solution_method,
+                run_time_in_seconds=run_time_in_seconds,
+                phase_timings=json.loads(phase_timings),
+                test_inputs=json.loads(test_inputs),
+                parameters=parameters_by_run[run_id],
+                _archive=self,
+            )
+            for (
+                run_id,
+                created_at,
+                run_test_type,
+                run_material_type,
+                run_solution_method,
+                run_time_in_seconds,
+                phase_timings,
+                test_inputs,
+            ) in rows
+        ]
+
+    def load_results(self, run_id: int) -> SimulationResults:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT channels, scalars FROM run_results WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No run with id {run_id} in the archive.")
+        return _unpack_results(*row)
+
+    def remove(self, run_id: int) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM runs WHERE id = ?", (run_id,))
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
@@ -0,0 +1,107 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+
+from kratos_element_test.model.phase_timer import PhaseTimer
+
+# Entries that describe the material rather than the course of the test
+SCALAR_NAMES = ("cohesion", "phi")
+
+
+class SimulationResults(Mapping):
+    """
+    Read-only container of the results of one simulation.
+
+    Every result channel (e.g. "sigma1" or "yy_strain") is stored once as a
+    contiguous NumPy array that cannot be modified, and indexing returns that
+    array without copying it. Scalars such as the cohesion and friction angle
+    are stored as they are. The container can be read like the dict of lists
+    it replaces. `timings` holds the phase timings of the run that produced the
+    results, if they were recorded. With `copy` set to False, arrays of the
+    right type (e.g. memory-mapped from a result file) are used as they are.
+    """
+
+    def __init__(
+        self,
+        data: Mapping[str, Any],
+        dtype=np.float64,
+        timings: Optional[PhaseTimer] = None,
+        copy: bool = True,
+    ):
+        self.dtype = np.dtype(dtype)
+        self.timings = timings
+        self._channels: Dict[str, np.ndarray] = {}
+        self._scalars: Dict[str, Any] = {}
+        for name, values in data.items():
+            if name in SCALAR_NAMES or values is None or np.isscalar(values):
+                self._scalars[name] = values
+                continue
+            if copy:
+                channel = np.array(values, dtype=self.dtype)
+            else:
+                # A view, so the array that was passed in stays writeable
+                channel = np.asarray(values, dtype=self.dtype).view()
+            channel.flags.writeable = False
+            self._channels[name] = channel
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Any], dtype=np.float64
+    ) -> "SimulationResults":
+        return cls(data, dtype=dtype)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the results as plain Python lists and scalars, e.g. for JSON.
+        """
+        data: Dict[str, Any] = {
+            name: channel.tolist() for name, channel in self._channels.items()
+        }
+        data.update(self._scalars)
+        return data
+
+    def astype(self, dtype) -> "SimulationResults":
+        return SimulationResults(
+            {**self._channels, **self._scalars}, dtype=dtype, timings=self.timings
+        )
+
+    @property
+    def channel_names(self) -> tuple:
+        return tuple(self._channels)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(channel.nbytes for channel in self._channels.values())
+
+    def channel(self, name: str, default: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._channels.get(name, default)
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._channels:
+            return self._channels[name]
+        return self._scalars[name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._channels
+        yield from self._scalars
+
+    def __len__(self) -> int:
+        return len(self._channels) + len(self._scalars)
+
+    def __reduce__(self):
+        return self.__class__, (
+            {**self._channels, **self._scalars},
+            self.dtype,
+            self.timings,
+        )
+
+    def __repr__(self) -> str:
+        channels = ", ".join(
+            f"{name}[{len(channel)}]" for name, channel in self._channels.items()
+        )
+        return f"SimulationResults({channels}, dtype={self.dtype})"
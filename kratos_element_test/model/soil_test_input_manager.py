@@ -1,10 +1,7 @@
-from kratos_element_test.model.core_utils import hours_to_seconds
 from kratos_element_test.model.models import (
     TriaxialAndShearSimulationInputs,
     CRSSimulationInputs,
     StrainIncrement,
-)
-from kratos_element_test.view.ui_constants import (
     TRIAXIAL,
     DIRECT_SHEAR,
     TEST_NAME_TO_TYPE,
@@ -27,19 +24,7 @@ class SoilTestInputManager:
         self._current_test_type = TRIAXIAL
 
     def update_crs_totals(self):
-        crs_inputs = self.input_data.get(CRS)
-        crs_inputs.number_of_steps = sum(
-            increment.steps for increment in crs_inputs.strain_increments
-        )
-        crs_inputs.duration_in_seconds = hours_to_seconds(
-            sum(
-                increment.duration_in_hours
-                for increment in crs_inputs.strain_increments
-            )
-        )
-        crs_inputs.maximum_strain = sum(
-            increment.strain_increment for increment in crs_inputs.strain_increments
-        )
+        self.input_data.get(CRS).update_totals()
 
     def set_crs_strain_increment(self, index, new_increment):
         crs_inputs = self.input_data.get(CRS)
@@ -96,3 +81,6 @@ class SoilTestInputManager:
         self,
     ) -> TriaxialAndShearSimulationInputs | CRSSimulationInputs:
         return self.input_data[self._current_test_type]
+
+    def get_triaxial_inputs(self) -> TriaxialAndShearSimulationInputs:
+        return self.input_data[TRIAXIAL]
@@ -0,0 +1,68 @@
+# Inputs of the element tests that are shared by the tests
+
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    CRSSimulationInputs,
+    StrainIncrement,
+    TriaxialAndShearSimulationInputs,
+)
+
+
+def linear_elastic_inputs(young_modulus=1e4, poisson_ratio=0.3):
+    material_inputs = LinearElasticMaterialInputs()
+    material_inputs.user_defined_parameters["YOUNG_MODULUS"].value = young_modulus
+    material_inputs.user_defined_parameters["POISSON_RATIO"].value = poisson_ratio
+    return material_inputs
+
+
+def mohr_coulomb_inputs(
+    young_modulus=1e4,
+    poisson_ratio=0.3,
+    cohesion=5.0,
+    friction_angle=30.0,
+    **other_parameters,
+):
+    material_inputs = MohrCoulombMaterialInputs()
+    for name, value in {
+        "YOUNG_MODULUS": young_modulus,
+        "POISSON_RATIO": poisson_ratio,
+        "GEO_COHESION": cohesion,
+        "GEO_FRICTION_ANGLE": friction_angle,
+        **other_parameters,
+    }.items():
+        material_inputs.user_defined_parameters[name].value = value
+    return material_inputs
+
+
+def triaxial_inputs(
+    maximum_strain=2.0, number_of_steps=20, initial_effective_cell_pressure=50.0
+):
+    return TriaxialAndShearSimulationInputs(
+        test_type="triaxial",
+        maximum_strain=maximum_strain,
+        number_of_steps=number_of_steps,
+        initial_effective_cell_pressure=initial_effective_cell_pressure,
+    )
+
+
+def crs_inputs(steps_per_increment=10):
+    test_inputs = CRSSimulationInputs(
+        test_type="crs",
+        strain_increments=[
+            StrainIncrement(
+                duration_in_hours=1.0,
+                strain_increment=-1.0,
+                steps=steps_per_increment,
+            ),
+            StrainIncrement(
+                duration_in_hours=1.0,
+                strain_increment=-2.0,
+                steps=steps_per_increment,
+            ),
+        ],
+    )
+    test_inputs.update_totals()
+    return test_inputs
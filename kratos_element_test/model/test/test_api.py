@@ -0,0 +1,93 @@
+import subprocess
+import sys
+import unittest
+
+from parameterized import parameterized
+
+from kratos_element_test.api import (
+    FINITE_ELEMENT,
+    MATERIAL_POINT,
+    CRSSimulationInputs,
+    LinearElasticMaterialInputs,
+    StrainIncrement,
+    TriaxialAndShearSimulationInputs,
+    run_test,
+)
+from kratos_element_test.model.test.input_factories import (
+    mohr_coulomb_inputs,
+)
+
+# Runs a linear elastic test in an interpreter in which tkinter and matplotlib
+# cannot be imported, like on a compute node without a display
+_HEADLESS_SCRIPT = """
+import sys
+
+sys.modules["tkinter"] = None
+sys.modules["matplotlib"] = None
+
+from kratos_element_test.api import (
+    LinearElasticMaterialInputs,
+    TriaxialAndShearSimulationInputs,
+    run_test,
+)
+
+material_inputs = LinearElasticMaterialInputs()
+material_inputs.user_defined_parameters["YOUNG_MODULUS"].value = 1e4
+material_inputs.user_defined_parameters["POISSON_RATIO"].value = 0.3
+results = run_test(
+    TriaxialAndShearSimulationInputs(test_type="triaxial", number_of_steps=10),
+    material_inputs,
+)
+print(len(results["sigma1"]))
+"""
+
+
+class RunTestTest(unittest.TestCase):
+    def test_runs_without_tkinter_and_matplotlib(self):
+        completed = subprocess.run(
+            [sys.executable, "-c", _HEADLESS_SCRIPT],
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip().splitlines()[-1], "10")
+
+    @parameterized.expand([(FINITE_ELEMENT,), (MATERIAL_POINT,)])
+    def test_triaxial_test(self, execution_mode):
+        results = run_test(
+            TriaxialAndShearSimulationInputs(test_type="triaxial", number_of_steps=10),
+            mohr_coulomb_inputs(),
+            execution_mode=execution_mode,
+        )
+
+        self.assertEqual(len(results["sigma1"]), 10)
+        self.assertAlmostEqual(results["cohesion"], 5.0)
+        self.assertAlmostEqual(results["phi"], 30.0)
+
+    def test_totals_of_crs_test_are_updated(self):
+        test_inputs = CRSSimulationInputs(
+            test_type="crs",
+            strain_increments=[
+                StrainIncrement(duration_in_hours=1.0, strain_increment=-1.0, steps=5),
+                StrainIncrement(duration_in_hours=1.0, strain_increment=-2.0, steps=5),
+            ],
+        )
+
+        results = run_test(
+            test_inputs, mohr_coulomb_inputs(), execution_mode=MATERIAL_POINT
+        )
+
+        self.assertEqual(test_inputs.number_of_steps, 10)
+        self.assertAlmostEqual(results["yy_strain"][-1], -0.03)
+
+    def test_invalid_test_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            run_test(
+                TriaxialAndShearSimulationInputs(test_type="oedometer"),
+                LinearElasticMaterialInputs(),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,279 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from kratos_element_test.model.io.result_file import read_results
+from kratos_element_test.model.job_spec import load_job_spec, parse_job_spec
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import CRSSimulationInputs
+from kratos_element_test.model.pipeline.batch_runner import (
+    BatchRunner,
+    MANIFEST_FILE_NAME,
+)
+
+
+class JobSpecTest(unittest.TestCase):
+    def test_defaults_are_merged_into_each_run(self):
+        job_spec = parse_job_spec(
+            {
+                "defaults": {
+                    "test": {"test_type": "triaxial", "number_of_steps": 10},
+                    "material": {
+                        "type": "linear_elastic",
+                        "parameters": {"YOUNG_MODULUS": 1e6, "POISSON_RATIO": 0.3},
+                    },
+                },
+                "runs": [
+                    {"name": "a", "test": {"initial_effective_cell_pressure": 50}},
+                    {
+                        "name": "b",
+                        "material": {
+                            "type": "mohr_coulomb",
+                            "parameters": {"GEO_FRICTION_ANGLE": 30},
+                        },
+                    },
+                ],
+            }
+        )
+
+        first, second = job_spec.runs
+        self.assertEqual(first.test_inputs.initial_effective_cell_pressure, 50)
+        self.assertEqual(first.test_inputs.number_of_steps, 10)
+        self.assertIsInstance(first.material_inputs, LinearElasticMaterialInputs)
+        self.assertEqual(
+            first.material_inputs.user_defined_parameters["YOUNG_MODULUS"].value, 1e6
+        )
+        self.assertIsInstance(second.material_inputs, MohrCoulombMaterialInputs)
+        self.assertEqual(
+            second.material_inputs.get_kratos_inputs()["GEO_FRICTION_ANGLE"], 30.0
+        )
+        self.assertEqual(
+            second.material_inputs.get_kratos_inputs()["YOUNG_MODULUS"], 1e6
+        )
+
+    def test_crs_totals_are_derived_from_strain_increments(self):
+        job_spec = parse_job_spec(
+            {
+                "runs": [
+                    {
+                        "test": {
+                            "test_type": "crs",
+                            "strain_increments": [
+                                {"duration_in_hours": 1.0, "strain_increment": -1.0},
+                                {"duration_in_hours": 2.0, "strain_increment": -2.0},
+                            ],
+                        },
+                        "material": {"type": "linear_elastic"},
+                    }
+                ]
+            }
+        )
+
+        test_inputs = job_spec.runs[0].test_inputs
+        self.assertIsInstance(test_inputs, CRSSimulationInputs)
+        self.assertEqual(test_inputs.number_of_steps, 200)
+        self.assertEqual(test_inputs.duration_in_seconds, 3.0 * 3600)
+        self.assertEqual(test_inputs.maximum_strain, -3.0)
+
+    def test_udsm_material_keeps_parameter_order(self):
+        job_spec = parse_job_spec(
+            {
+                "runs": [
+                    {
+                        "test": {"test_type": "direct_shear"},
+                        "material": {
+                            "type": "udsm",
+                            "dll_path": "model.dll",
+                            "udsm_number": 2,
+                            "parameters": {"k": 0.1, "l": {"value": 0.2, "unit": "-"}},
+                        },
+                    }
+                ]
+            }
+        )
+
+        material_inputs = job_spec.runs[0].material_inputs
+        self.assertIsInstance(material_inputs, UDSMMaterialInputs)
+        self.assertEqual(material_inputs.material_parameters["UDSM_NUMBER"], 2)
+        self.assertEqual(
+            material_inputs.get_kratos_inputs()["UMAT_PARAMETERS"], [0.1, 0.2]
+        )
+
+    def test_udsm_dll_path_is_relative_to_the_spec_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            spec_path = Path(directory) / "jobs" / "spec.json"
+            spec_path.parent.mkdir()
+            spec_path.write_text(
+                json.dumps(
+                    {
+                        "runs": [
+                            {
+                                "test": {"test_type": "triaxial"},
+                                "material": {
+                                    "type": "udsm",
+                                    "dll_path": "../models/model.dll",
+                                },
+                            }
+                        ]
+                    }
+                )
+            )
+
+            job_spec = load_job_spec(spec_path)
+
+            self.assertEqual(
+                job_spec.runs[0].material_inputs.material_parameters["UDSM_NAME"],
+                str((Path(directory) / "models" / "model.dll").resolve()),
+            )
+
+    def test_invalid_entries_raise(self):
+        with self.assertRaises(ValueError):
+            parse_job_spec({"runs": []})
+        with self.assertRaises(ValueError):
+            parse_job_spec(
+                {
+                    "runs": [
+                        {
+                            "test": {"test_type": "triaxial"},
+                            "material": {"type": "unknown"},
+                        }
+                    ]
+                }
+            )
+        with self.assertRaises(ValueError):
+            parse_job_spec(
+                {
+                    "runs": [
+                        {
+                            "test": {"test_type": "triaxial", "not_a_field": 1},
+                            "material": {"type": "linear_elastic"},
+                        }
+                    ]
+                }
+            )
+
+
+class BatchRunnerTest(unittest.TestCase):
+    def test_batch_writes_results_and_manifest(self):
+        job_spec = parse_job_spec(
+            {
+                "defaults": {
+                    "material": {
+                        "type": "linear_elastic",
+                        "parameters": {"YOUNG_MODULUS": 9e5, "POISSON_RATIO": 0.3},
+                    }
+                },
+                "runs": [
+                    {
+                        "name": "triaxial 100 kPa",
+                        "test": {"test_type": "triaxial", "number_of_steps": 10},
+                    },
+                    {
+                        "name": "invalid material",
+                        "test": {"test_type": "triaxial", "number_of_steps": 10},
+                        "material": {
+                            "type": "udsm",
+                            "dll_path": "does_not_exist.dll",
+                        },
+                    },
+                ],
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as output_directory:
+            manifest = BatchRunner(
+                job_spec, Path(output_directory), logger=lambda msg, level: None
+            ).run()
+
+            self.assertEqual(manifest["number_of_runs"], 2)
+            self.assertEqual(manifest["number_of_failures"], 1)
+            completed, failed = manifest["runs"]
+            self.assertEqual(completed["status"], "completed")
+            self.assertEqual(failed["status"], "failed")
+
+            with open(Path(output_directory) / completed["result_file"]) as f:
+                stored = json.load(f)
+            self.assertEqual(stored["name"], "triaxial 100 kPa")
+            self.assertEqual(len(stored["results"]["sigma1"]), 10)
+            self.assertTrue((Path(output_directory) / MANIFEST_FILE_NAME).is_file())
+
+    def test_batch_with_workers_records_runs_in_spec_order(self):
+        job_spec = parse_job_spec(
+            {
+                "defaults": {
+                    "test": {"test_type": "triaxial", "number_of_steps": 10},
+                    "material": {
+                        "type": "linear_elastic",
+                        "parameters": {"YOUNG_MODULUS": 9e5, "POISSON_RATIO": 0.3},
+                    },
+                },
+                "runs": [
+                    {"name": "p50", "test": {"initial_effective_cell_pressure": 50}},
+                    {"name": "p100", "test": {"initial_effective_cell_pressure": 100}},
+                    {"name": "p200", "test": {"initial_effective_cell_pressure": 200}},
+                ],
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as output_directory:
+            manifest = BatchRunner(
+                job_spec,
+                Path(output_directory),
+                logger=lambda msg, level: None,
+                workers=2,
+            ).run()
+
+        self.assertEqual(manifest["number_of_failures"], 0)
+        self.assertEqual(
+            [entry["name"] for entry in manifest["runs"]], ["p50", "p100", "p200"]
+        )
+
+    def test_batch_writes_npz_result_files(self):
+        job_spec = parse_job_spec(
+            {
+                "runs": [
+                    {
+                        "name": "p100",
+                        "test": {"test_type": "triaxial", "number_of_steps": 10},
+                        "material": {
+                            "type": "linear_elastic",
+                            "parameters": {
+                                "YOUNG_MODULUS": 9e5,
+                                "POISSON_RATIO": 0.3,
+                            },
+                        },
+                    }
+                ],
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as output_directory:
+            manifest = BatchRunner(
+                job_spec,
+                Path(output_directory),
+                logger=lambda msg, level: None,
+                result_format="npz",
+            ).run()
+
+            [entry] = manifest["runs"]
+            self.assertEqual(entry["result_file"], "0001_p100.npz")
+            results, metadata = read_results(
+                Path(output_directory) / entry["result_file"]
+            )
+            self.assertEqual(len(results["sigma1"]), 10)
+            self.assertEqual(metadata["name"], "p100")
+            self.assertEqual(metadata["test_inputs"]["number_of_steps"], 10)
+            del results
+
+    def test_unknown_result_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            BatchRunner(parse_job_spec({"runs": []}), Path("."), result_format="xlsx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,318 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from openpyxl import load_workbook
+from parameterized import parameterized
+
+from kratos_element_test.api import export_excel
+from kratos_element_test.model.design_of_experiments import (
+    FULL_FACTORIAL,
+    parse_sweep_spec,
+)
+from kratos_element_test.model.io.bulk_excel_export import (
+    ExportRun,
+    collect_runs,
+    count_runs,
+    write_workbook,
+    write_workbooks,
+)
+from kratos_element_test.model.job_spec import parse_job_spec
+from kratos_element_test.model.material_input_data_models import (
+    MohrCoulombMaterialInputs,
+)
+from kratos_element_test.model.models import TriaxialAndShearSimulationInputs
+from kratos_element_test.model.pipeline.batch_runner import BatchRunner
+from kratos_element_test.model.pipeline.sweep_runner import SweepRunner
+from kratos_element_test.model.run_archive import RunArchive
+from kratos_element_test.model.simulation_results import SimulationResults
+from kratos_element_test.view.kratos_element_test_cli import main
+
+
+def _quiet_log(msg, level):
+    pass
+
+
+def _results(number_of_points=11):
+    return SimulationResults(
+        {
+            "sigma1": np.linspace(0.0, -100.0, number_of_points),
+            "sigma3": np.full(number_of_points, -50.0),
+            "yy_strain": np.linspace(0.0, -0.2, number_of_points),
+            "vol_strain": np.linspace(0.0, 0.01, number_of_points),
+            "mean_stress": np.linspace(50.0, 80.0, number_of_points),
+            "von_mises": np.linspace(0.0, 50.0, number_of_points),
+            "cohesion": 5.0,
+            "phi": 30.0,
+        }
+    )
+
+
+def _job_spec(number_of_runs):
+    return parse_job_spec(
+        {
+            "defaults": {
+                "test": {"test_type": "triaxial", "number_of_steps": 10},
+                "material": {
+                    "type": "linear_elastic",
+                    "parameters": {"YOUNG_MODULUS": 1e4, "POISSON_RATIO": 0.3},
+                },
+            },
+            "runs": [
+                {
+                    "name": f"run {index}",
+                    "test": {"initial_effective_cell_pressure": 50.0 * index},
+                }
+                for index in range(1, number_of_runs + 1)
+            ],
+        }
+    )
+
+
+def _sheet_rows(path, sheet_name):
+    return list(load_workbook(path)[sheet_name].iter_rows(values_only=True))
+
+
+def _sheet_names(path):
+    workbook = load_workbook(path, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+class WriteWorkbookTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.directory = Path(self._directory.name)
+
+    def test_all_runs_are_written_to_one_workbook(self):
+        runs = [
+            ExportRun(
+                "first",
+                "triaxial",
+                _results(),
+                {"test_inputs": {"initial_effective_cell_pressure": 100.0}},
+            ),
+            ExportRun("second", "triaxial", _results(5)),
+        ]
+        progress = []
+
+        number_of_runs = write_workbook(
+            runs,
+            self.directory / "runs.xlsx",
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(number_of_runs, 2)
+        self.assertEqual(progress, [(1, 2), (2, 2)])
+        self.assertEqual(
+            _sheet_names(self.directory / "runs.xlsx"),
+            [
+                "Runs",
+                "triaxial plot 1",
+                "triaxial plot 2",
+                "triaxial plot 3",
+                "triaxial plot 4",
+            ],
+        )
+        header, first, second = _sheet_rows(self.directory / "runs.xlsx", "Runs")
+        self.assertEqual(
+            header[:7],
+            (
+                "run",
+                *"name test_type cohesion phi".split(),
+                "sigma1_at_end",
+                "sigma3_at_end",
+            ),
+        )
+        self.assertEqual(first[:7], (1, "first", "triaxial", 5, 30, -100, -50))
+        self.assertEqual(first[header.index("initial_effective_cell_pressure")], 100)
+        self.assertEqual(second[1], "second")
+
+        header, *rows = _sheet_rows(self.directory / "runs.xlsx", "triaxial plot 3")
+        self.assertEqual(header, ("run", "σ3 (kPa)", "σ1 (kPa)"))
+        self.assertEqual([row[0] for row in rows], [1] * 11 + [2] * 5)
+        np.testing.assert_allclose([row[2] for row in rows[:11]], _results()["sigma1"])
+
+    def test_values_that_are_not_finite_are_left_empty(self):
+        results = _results(3)
+        results = SimulationResults(
+            {**results, "sigma1": np.array([0.0, np.nan, np.inf])}
+        )
+
+        write_workbook(
+            [ExportRun("run", "triaxial", results)], self.directory / "runs.xlsx"
+        )
+
+        _, *rows = _sheet_rows(self.directory / "runs.xlsx", "triaxial plot 3")
+        self.assertEqual([row[2] for row in rows], [0, None, None])
+
+    def test_unknown_test_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            write_workbook(
+                [ExportRun("run", "oedometer", _results())],
+                self.directory / "runs.xlsx",
+            )
+
+    @parameterized.expand([("sequential", 1), ("pool", 2)])
+    def test_every_run_is_written_to_its_own_workbook(self, _, workers):
+        runs = [ExportRun(f"run {index}", "triaxial", _results()) for index in range(3)]
+        runs.append(ExportRun("no data", "triaxial", SimulationResults({})))
+        progress = []
+
+        paths = write_workbooks(
+            runs,
+            self.directory / "workbooks",
+            workers=workers,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(
+            [path.name for path in paths],
+            ["0001_run_0.xlsx", "0002_run_1.xlsx", "0003_run_2.xlsx"],
+        )
+        self.assertEqual(progress[-1], (4, 4))
+        self.assertEqual(
+            _sheet_names(paths[0]),
+            ["Plot 1", "Plot 2", "Plot 3", "Plot 4", "Plot 5"],
+        )
+
+
+class CollectRunsTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.directory = Path(self._directory.name)
+
+    @parameterized.expand([("json",), ("npz",)])
+    def test_runs_of_a_batch_are_collected(self, result_format):
+        BatchRunner(
+            _job_spec(2),
+            self.directory,
+            logger=_quiet_log,
+            result_format=result_format,
+        ).run()
+
+        runs = list(collect_runs([self.directory]))
+
+        self.assertEqual([run.name for run in runs], ["run 1", "run 2"])
+        self.assertEqual(runs[0].test_type, "triaxial")
+        self.assertEqual(
+            runs[1].metadata["test_inputs"]["initial_effective_cell_pressure"],
+            100.0,
+        )
+        self.assertEqual(len(runs[0].results["sigma1"]), 10)
+
+    def test_completed_runs_of_a_sweep_are_collected(self):
+        spec = parse_sweep_spec(
+            {
+                "base": {
+                    "test": {"test_type": "triaxial", "number_of_steps": 10},
+                    "material": {
+                        "type": "linear_elastic",
+                        "parameters": {"YOUNG_MODULUS": 1e4, "POISSON_RATIO": 0.3},
+                    },
+                },
+                "factors": [{"name": "test.number_of_steps", "levels": [0, 5, 10]}],
+                "design": {"method": FULL_FACTORIAL},
+            }
+        )
+        SweepRunner(spec, self.directory, logger=_quiet_log).run()
+
+        runs = list(collect_runs([self.directory]))
+
+        self.assertEqual([len(run.results["sigma1"]) for run in runs], [5, 10])
+        self.assertEqual(runs[0].metadata["factors"], {"test.number_of_steps": 5})
+        self.assertEqual(count_runs([self.directory]), 2)
+
+    def test_unknown_source_is_rejected(self):
+        with self.assertRaises(ValueError):
+            list(collect_runs([self.directory]))
+
+
+class ExportExcelTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.directory = Path(self._directory.name)
+
+    def test_archived_runs_are_exported(self):
+        archive = RunArchive(self.directory / "runs.sqlite")
+        for cell_pressure in [50.0, 100.0]:
+            archive.add(
+                TriaxialAndShearSimulationInputs(
+                    test_type="triaxial",
+                    initial_effective_cell_pressure=cell_pressure,
+                ),
+                MohrCoulombMaterialInputs(),
+                _results(),
+            )
+
+        runs = archive.find()
+
+        [path] = export_excel(runs, self.directory / "archive.xlsx")
+
+        _, newest, oldest = _sheet_rows(path, "Runs")
+        self.assertEqual((newest[1], oldest[1]), ("run_2", "run_1"))
+        # The results are not kept by the archived runs after the export
+        self.assertEqual([run._results for run in runs], [None, None])
+
+    @parameterized.expand([("one_workbook", False), ("workbook_per_run", True)])
+    def test_progress_is_reported_with_the_total(self, _, one_workbook_per_run):
+        runs = [ExportRun(f"run {index}", "triaxial", _results()) for index in range(3)]
+        progress = []
+
+        export_excel(
+            runs,
+            self.directory / "runs.xlsx",
+            one_workbook_per_run=one_workbook_per_run,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(progress, [(1, 3), (2, 3), (3, 3)])
+
+    def test_total_counts_the_completed_runs_of_a_batch(self):
+        BatchRunner(_job_spec(2), self.directory / "batch", logger=_quiet_log).run()
+        runs = [ExportRun("extra", "triaxial", _results())]
+        progress = []
+
+        export_excel(
+            [self.directory / "batch", *runs],
+            self.directory / "runs.xlsx",
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(progress, [(1, 3), (2, 3), (3, 3)])
+
+    def test_single_source_may_be_given_as_a_string(self):
+        BatchRunner(_job_spec(2), self.directory / "batch", logger=_quiet_log).run()
+
+        [path] = export_excel(
+            str(self.directory / "batch"), self.directory / "runs.xlsx"
+        )
+
+        _, *rows = _sheet_rows(path, "Runs")
+        self.assertEqual([row[1] for row in rows], ["run 1", "run 2"])
+
+    def test_batch_is_exported_from_the_command_line(self):
+        BatchRunner(_job_spec(3), self.directory / "batch", logger=_quiet_log).run()
+
+        exit_code = main(
+            [
+                "export",
+                str(self.directory / "batch"),
+                "-o",
+                str(self.directory / "workbooks"),
+                "--one-workbook-per-run",
+            ]
+        )
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(list((self.directory / "workbooks").glob("*.xlsx"))), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from kratos_element_test.model.calibration.calibrator import (
+    CalibrationFailed,
+    CalibrationParameter,
+    Calibrator,
+)
+from kratos_element_test.model.calibration.misfit import (
+    CalibrationTarget,
+    target_misfit,
+    weighted_misfit,
+)
+from kratos_element_test.model.calibration.optimizers import (
+    DIFFERENTIAL_EVOLUTION,
+    NELDER_MEAD,
+    differential_evolution,
+    nelder_mead,
+)
+from kratos_element_test.model.main_model import MainModel
+from kratos_element_test.model.material_input_data_models import (
+    Parameter,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.pipeline.simulation_factory import create_simulation
+from kratos_element_test.model.test.input_factories import (
+    linear_elastic_inputs,
+    triaxial_inputs,
+)
+
+
+def _lab_results(material_inputs):
+    sim = create_simulation(
+        test_inputs=triaxial_inputs(),
+        material_inputs=material_inputs,
+        logger=lambda msg, level: None,
+    )
+    sim.run()
+    results = sim.post_process_results()
+    return {
+        "yy_strain": results["yy_strain"].tolist(),
+        "sigma1_sigma3_diff": np.abs(results["sigma1"] - results["sigma3"]).tolist(),
+        "vol_strain": results["vol_strain"].tolist(),
+        "p'": results["mean_stress"].tolist(),
+        "q": results["von_mises"].tolist(),
+    }
+
+
+def _quadratic(candidates):
+    return np.sum((candidates - np.array([0.3, 0.7])) ** 2, axis=1)
+
+
+class MisfitTest(unittest.TestCase):
+    def test_simulation_of_the_lab_material_has_no_misfit(self):
+        lab_results = _lab_results(linear_elastic_inputs())
+        target = CalibrationTarget(triaxial_inputs(), lab_results)
+        results = _run(linear_elastic_inputs())
+
+        misfits = target_misfit(target, results)
+
+        self.assertEqual(set(misfits), {"sigma1_sigma3_diff", "vol_strain", "p'", "q"})
+        for misfit in misfits.values():
+            self.assertAlmostEqual(misfit, 0.0, places=20)
+
+    def test_weights_scale_the_misfit_and_zero_weights_leave_quantities_out(self):
+        lab_results = _lab_results(linear_elastic_inputs())
+        results = _run(linear_elastic_inputs(young_modulus=2e4))
+        misfits = target_misfit(
+            CalibrationTarget(triaxial_inputs(), lab_results), results
+        )
+
+        weighted = weighted_misfit(
+            CalibrationTarget(
+                triaxial_inputs(),
+                lab_results,
+                weights={"sigma1_sigma3_diff": 2.0, "vol_strain": 0.0},
+            ),
+            results,
+        )
+
+        self.assertGreater(misfits["sigma1_sigma3_diff"], 0.0)
+        self.assertAlmostEqual(
+            weighted,
+            2.0 * misfits["sigma1_sigma3_diff"] + misfits["p'"] + misfits["q"],
+        )
+
+    def test_lab_results_need_the_driving_quantity(self):
+        target = CalibrationTarget(triaxial_inputs(), {"q": [0.0, 1.0]})
+
+        with self.assertRaises(ValueError):
+            target.validate()
+
+
+class OptimizerTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (lambda f: differential_evolution(f, 2, 600, seed=0),),
+            (lambda f: nelder_mead(f, 2, 300, tolerance=1e-8),),
+        ]
+    )
+    def test_minimum_of_a_quadratic_is_found(self, optimize):
+        result = optimize(_quadratic)
+
+        np.testing.assert_allclose(result.x, [0.3, 0.7], atol=1e-3)
+        self.assertLess(result.misfit, 1e-6)
+
+    def test_evaluation_budget_is_respected(self):
+        batch_sizes = []
+
+        def objective(candidates):
+            batch_sizes.append(len(candidates))
+            return _quadratic(candidates)
+
+        result = nelder_mead(objective, 2, 20, tolerance=0.0)
+
+        self.assertLessEqual(result.evaluations, 20)
+        self.assertEqual(sum(batch_sizes), result.evaluations)
+        self.assertFalse(result.converged)
+        # The reflection, expansion and contractions are evaluated as one batch
+        self.assertEqual(batch_sizes[1], 4)
+        self.assertEqual(
+            [entry[0] for entry in result.history], list(np.cumsum(batch_sizes))
+        )
+
+
+class CalibratorTest(unittest.TestCase):
+    @parameterized.expand([(NELDER_MEAD,), (DIFFERENTIAL_EVOLUTION,)])
+    def test_young_modulus_is_recovered_from_lab_results(self, method):
+        lab_results = _lab_results(linear_elastic_inputs(young_modulus=3e4))
+        calibrator = Calibrator(
+            linear_elastic_inputs(young_modulus=1e4),
+            [CalibrationParameter("YOUNG_MODULUS", 1e3, 1e5, log_scale=True)],
+            [CalibrationTarget(triaxial_inputs(), lab_results)],
+            logger=lambda msg, level: None,
+        )
+
+        result = calibrator.run(method=method, max_evaluations=200, seed=1)
+
+        self.assertAlmostEqual(result.parameters["YOUNG_MODULUS"] / 3e4, 1.0, places=3)
+        self.assertLessEqual(result.evaluations, 200)
+        self.assertEqual(
+            result.material_inputs.user_defined_parameters["YOUNG_MODULUS"].value,
+            result.parameters["YOUNG_MODULUS"],
+        )
+        misfits = [entry["misfit"] for entry in result.history]
+        self.assertEqual(misfits, sorted(misfits, reverse=True))
+
+    def test_unknown_parameter_is_rejected(self):
+        with self.assertRaises(KeyError):
+            Calibrator(
+                linear_elastic_inputs(),
+                [CalibrationParameter("GEO_COHESION", 1.0, 10.0)],
+                [
+                    CalibrationTarget(
+                        triaxial_inputs(), {"yy_strain": [0.0], "q": [0.0]}
+                    )
+                ],
+            )
+
+    def test_calibration_fails_when_no_candidate_can_be_simulated(self):
+        material_inputs = UDSMMaterialInputs(
+            user_defined_parameters={"G": Parameter(value=1e4, unit="kPa")}
+        )
+        material_inputs.material_parameters["UDSM_NAME"] = "does_not_exist.dll"
+        messages = []
+        calibrator = Calibrator(
+            material_inputs,
+            [CalibrationParameter("G", 1e3, 1e5)],
+            [CalibrationTarget(triaxial_inputs(), {"yy_strain": [0.0], "q": [0.0]})],
+            logger=lambda msg, level: messages.append((level, msg)),
+        )
+
+        with self.assertRaisesRegex(CalibrationFailed, "does_not_exist.dll"):
+            calibrator.run(max_evaluations=4)
+
+        warnings = [msg for level, msg in messages if level == "warn"]
+        self.assertEqual(len(warnings), 4)
+        self.assertIn("does_not_exist.dll", warnings[0])
+
+    def test_main_model_calibrates_against_imported_lab_results(self):
+        model = MainModel(logger=lambda msg, level: None)
+        model.get_material_input_manager().set_current_material_type("linear_elastic")
+        manager = model.get_material_input_manager()
+        manager.update_material_parameter_of_current_type("YOUNG_MODULUS", 1e4)
+        manager.update_material_parameter_of_current_type("POISSON_RATIO", 0.3)
+        test_inputs = model.get_soil_test_input_manager().input_data["Triaxial"]
+        test_inputs.maximum_strain = 2.0
+        test_inputs.number_of_steps = 20
+        test_inputs.initial_effective_cell_pressure = 50.0
+        model.get_result_manager().import_lab_results_dict(
+            {"triaxial": _lab_results(linear_elastic_inputs(poisson_ratio=0.2))}
+        )
+
+        result = model.calibrate(
+            [CalibrationParameter("POISSON_RATIO", 0.0, 0.45)],
+            method=NELDER_MEAD,
+            max_evaluations=100,
+        )
+
+        self.assertAlmostEqual(result.parameters["POISSON_RATIO"], 0.2, places=4)
+        self.assertEqual(
+            manager.get_current_material_inputs()
+            .user_defined_parameters["POISSON_RATIO"]
+            .value,
+            0.3,
+        )
+
+
+def _run(material_inputs):
+    sim = create_simulation(
+        test_inputs=triaxial_inputs(),
+        material_inputs=material_inputs,
+        logger=lambda msg, level: None,
+    )
+    sim.run()
+    return sim.post_process_results()
+
+
+if __name__ == "__main__":
+    unittest.main()
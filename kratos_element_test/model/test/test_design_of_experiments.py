@@ -0,0 +1,178 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from kratos_element_test.model.design_of_experiments import (
+    FULL_FACTORIAL,
+    LATIN_HYPERCUBE,
+    SOBOL,
+    Factor,
+    apply_design_point,
+    generate_design,
+    latin_hypercube,
+    parse_sweep_spec,
+    build_design_run,
+    design_point_name,
+    sobol_sequence,
+)
+
+BASE_RUN = {
+    "test": {
+        "test_type": "crs",
+        "strain_increments": [
+            {"duration_in_hours": 1.0, "strain_increment": -1.0, "steps": 10},
+            {"duration_in_hours": 1.0, "strain_increment": -1.0, "steps": 10},
+        ],
+    },
+    "material": {
+        "type": "linear_elastic",
+        "parameters": {"YOUNG_MODULUS": 1e4, "POISSON_RATIO": 0.3},
+    },
+}
+
+
+class DesignTest(unittest.TestCase):
+    def test_full_factorial_design_has_every_combination_of_levels(self):
+        design = generate_design(
+            [
+                Factor("material.YOUNG_MODULUS", lower=1e3, upper=1e5, log_scale=True),
+                Factor("test.number_of_steps", levels=[10, 20]),
+            ],
+            method=FULL_FACTORIAL,
+            levels=3,
+        )
+
+        self.assertEqual(len(design), 6)
+        np.testing.assert_allclose(
+            sorted({point["material.YOUNG_MODULUS"] for point in design}),
+            [1e3, 1e4, 1e5],
+        )
+        self.assertEqual({point["test.number_of_steps"] for point in design}, {10, 20})
+
+    def test_latin_hypercube_has_one_sample_per_stratum(self):
+        samples = latin_hypercube(20, 3, seed=1)
+
+        for dimension in range(3):
+            strata = np.floor(samples[:, dimension] * 20).astype(int)
+            self.assertEqual(sorted(strata), list(range(20)))
+        np.testing.assert_array_equal(samples, latin_hypercube(20, 3, seed=1))
+
+    def test_sobol_sequence_starts_with_the_published_points(self):
+        np.testing.assert_array_equal(
+            sobol_sequence(8, 3),
+            [
+                [0.0, 0.0, 0.0],
+                [0.5, 0.5, 0.5],
+                [0.75, 0.25, 0.25],
+                [0.25, 0.75, 0.75],
+                [0.375, 0.375, 0.625],
+                [0.875, 0.875, 0.125],
+                [0.625, 0.125, 0.875],
+                [0.125, 0.625, 0.375],
+            ],
+        )
+
+    def test_sobol_sequence_fills_every_stratum_of_each_dimension(self):
+        samples = sobol_sequence(256, 21)
+
+        for dimension in range(21):
+            strata = np.floor(samples[:, dimension] * 256).astype(int)
+            self.assertEqual(len(set(strata)), 256)
+
+    @parameterized.expand([(LATIN_HYPERCUBE,), (SOBOL,)])
+    def test_sampled_values_stay_within_the_bounds(self, method):
+        design = generate_design(
+            [
+                Factor("test.initial_effective_cell_pressure", lower=10, upper=200),
+                Factor("test.number_of_steps", lower=10, upper=100, integer=True),
+            ],
+            method=method,
+            samples=32,
+            seed=0,
+        )
+
+        self.assertEqual(len(design), 32)
+        for point in design:
+            self.assertTrue(10 <= point["test.initial_effective_cell_pressure"] <= 200)
+            self.assertIsInstance(point["test.number_of_steps"], int)
+
+    def test_invalid_factors_are_rejected(self):
+        with self.assertRaises(ValueError):
+            generate_design([Factor("material.YOUNG_MODULUS")])
+        with self.assertRaises(ValueError):
+            generate_design([Factor("material.YOUNG_MODULUS", levels=[1.0])], "grid")
+        with self.assertRaises(ValueError):
+            generate_design([Factor("YOUNG_MODULUS", levels=[1.0])])
+
+    def test_design_point_fills_in_material_parameters_and_test_fields(self):
+        run = apply_design_point(
+            BASE_RUN,
+            {
+                "material.YOUNG_MODULUS": 5e4,
+                "test.strain_increments.1.strain_increment": -2.5,
+            },
+        )
+
+        self.assertEqual(run["material"]["parameters"]["YOUNG_MODULUS"], 5e4)
+        self.assertEqual(run["test"]["strain_increments"][1]["strain_increment"], -2.5)
+        self.assertEqual(run["test"]["strain_increments"][0]["strain_increment"], -1.0)
+        self.assertEqual(BASE_RUN["material"]["parameters"]["YOUNG_MODULUS"], 1e4)
+
+    def test_sweep_spec_builds_one_run_per_design_point(self):
+        spec = parse_sweep_spec(
+            {
+                "base": BASE_RUN,
+                "factors": [
+                    {"name": "material.POISSON_RATIO", "levels": [0.2, 0.3]},
+                    {
+                        "name": "test.strain_increments",
+                        "levels": [
+                            [
+                                {
+                                    "duration_in_hours": 1,
+                                    "strain_increment": -1,
+                                    "steps": 5,
+                                }
+                            ],
+                            [
+                                {
+                                    "duration_in_hours": 2,
+                                    "strain_increment": -2,
+                                    "steps": 5,
+                                }
+                            ],
+                        ],
+                    },
+                ],
+                "design": {"method": FULL_FACTORIAL},
+            }
+        )
+
+        runs = [
+            build_design_run(spec.base, point, design_point_name(index))
+            for index, point in enumerate(spec.points)
+        ]
+
+        self.assertEqual(len(runs), 4)
+        self.assertEqual(
+            [len(run.test_inputs.strain_increments) for run in runs], [1, 1, 1, 1]
+        )
+        self.assertEqual(
+            [run.test_inputs.duration_in_seconds for run in runs],
+            [3600.0, 7200.0, 3600.0, 7200.0],
+        )
+        self.assertEqual(
+            [run.material_inputs.get_kratos_inputs()["POISSON_RATIO"] for run in runs],
+            [0.2, 0.2, 0.3, 0.3],
+        )
+
+    def test_invalid_design_point_is_reported(self):
+        with self.assertRaises(ValueError):
+            build_design_run(
+                BASE_RUN, {"test.strain_increments.0.steps": 0}, "point_0001"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import unittest
+from pathlib import Path
+
+import numpy as np
+from KratosMultiphysics.GeoMechanicsApplication.gid_output_file_reader import (
+    GiDOutputFileReader,
+)
+
+from kratos_element_test.model.io.gid_result_reader import (
+    ResultRequest,
+    iter_gid_result_blocks,
+    read_gid_results,
+)
+
+
+class GiDResultReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.test_path = Path(os.path.dirname(__file__)) / "output.post.res"
+        self.full_output = GiDOutputFileReader().read_output_from(self.test_path)
+
+    def test_only_wanted_results_are_parsed(self):
+        blocks = list(
+            iter_gid_result_blocks(
+                self.test_path, {"CAUCHY_STRESS_TENSOR": ResultRequest()}
+            )
+        )
+
+        parsed = {block.name for block in blocks if block.values is not None}
+        self.assertEqual(parsed, {"CAUCHY_STRESS_TENSOR"})
+        self.assertEqual(
+            len(blocks),
+            sum(len(items) for items in self.full_output["results"].values()),
+        )
+
+    def test_values_of_first_element_at_requested_gauss_point(self):
+        series, _ = read_gid_results(
+            self.test_path,
+            {
+                "CAUCHY_STRESS_TENSOR": ResultRequest(gauss_point_index=0),
+                "VON_MISES_STRESS": ResultRequest(
+                    gauss_point_index=1, number_of_gauss_points=3
+                ),
+            },
+        )
+
+        expected_stress = [
+            item["values"][0]["value"][0]
+            for item in self.full_output["results"]["CAUCHY_STRESS_TENSOR"]
+            if item["values"]
+        ]
+        np.testing.assert_array_equal(
+            series["CAUCHY_STRESS_TENSOR"].values, expected_stress
+        )
+        expected_von_mises = [
+            item["values"][0]["value"][1]
+            for item in self.full_output["results"]["VON_MISES_STRESS"]
+            if item["values"] and len(item["values"][0]["value"]) == 3
+        ]
+        np.testing.assert_array_equal(
+            series["VON_MISES_STRESS"].values[:, 0], expected_von_mises
+        )
+        np.testing.assert_array_equal(
+            series["VON_MISES_STRESS"].times, [0.2, 0.4, 0.6, 0.8, 1.0]
+        )
+
+    def test_time_steps_match_the_full_reader(self):
+        _, time_steps = read_gid_results(self.test_path, {})
+
+        np.testing.assert_array_equal(
+            time_steps,
+            GiDOutputFileReader.get_time_steps_from_first_valid_result(
+                self.full_output
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
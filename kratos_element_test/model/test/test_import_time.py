@@ -0,0 +1,65 @@
+import json
+import subprocess
+import sys
+import unittest
+
+from parameterized import parameterized
+
+# Modules that take long to import and are only needed for some actions:
+# Kratos for a run, pandas and openpyxl for an export, pefile for a UDSM and
+# matplotlib for the plots
+HEAVY_MODULES = [
+    "KratosMultiphysics",
+    "pandas",
+    "openpyxl",
+    "pefile",
+    "matplotlib",
+]
+
+# Generous, so that only a heavy import that slipped in makes the test fail
+IMPORT_TIME_BUDGET_IN_SECONDS = 1.5
+
+_IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{"duration": duration, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _import_in_fresh_interpreter(module):
+    completed = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class ImportTimeTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("main_model", "kratos_element_test.model.main_model"),
+            (
+                "element_test_controller",
+                "kratos_element_test.controller.element_test_controller",
+            ),
+            ("api", "kratos_element_test.api"),
+            ("splash_screen", "kratos_element_test.view.splash_screen"),
+        ]
+    )
+    def test_startup_modules_load_without_heavy_dependencies(self, _, module):
+        imported = _import_in_fresh_interpreter(module)
+
+        loaded = {name.split(".")[0] for name in imported["modules"]}
+        self.assertEqual(sorted(loaded.intersection(HEAVY_MODULES)), [])
+        self.assertLess(imported["duration"], IMPORT_TIME_BUDGET_IN_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
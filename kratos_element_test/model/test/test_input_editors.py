@@ -0,0 +1,111 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from kratos_element_test.model.io.mdpa_editor import MdpaEditor
+from kratos_element_test.model.io.project_parameter_editor import ProjectParameterEditor
+
+MDPA_TEMPLATE = """Begin Table 1 TIME DISPLACEMENT_Y
+  0.0 0.0
+  $end_time $maximum_strain
+End Table
+
+Begin Properties 0
+  FIRST_TIME_STEP $first_timestep
+  UNKNOWN $not_a_placeholder
+End Properties
+"""
+
+
+class MdpaEditorTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.template_path = Path(self._directory.name) / "template.mdpa"
+        self.template_path.write_text(MDPA_TEMPLATE)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_placeholders_are_rendered_in_memory_and_written_once(self):
+        messages = []
+        editor = MdpaEditor(
+            str(self.template_path), logger=lambda msg, level: messages.append(msg)
+        )
+        editor.update_maximum_strain(20.0)
+        editor.update_end_time(1.0)
+        editor.update_first_timestep(0.05)
+        editor.update_middle_maximum_strain(20.0)
+
+        output_path = Path(self._directory.name) / "mesh.mdpa"
+        editor.save(output_path)
+
+        self.assertEqual(self.template_path.read_text(), MDPA_TEMPLATE)
+        rendered = output_path.read_text()
+        self.assertIn("  1.0 -0.2000\n", rendered)
+        self.assertIn("FIRST_TIME_STEP 0.0500\n", rendered)
+        self.assertIn("UNKNOWN $not_a_placeholder\n", rendered)
+        self.assertEqual(messages, ["Could not update middle maximum strain."])
+
+
+class ProjectParameterEditorTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.template_path = Path(self._directory.name) / "ProjectParameters.json"
+        self.template = {
+            "problem_data": {"end_time": 1.0, "echo_level": 1},
+            "solver_settings": {
+                "time_stepping": {"time_step": 0.05},
+                "model_import_settings": {"input_filename": "time_step"},
+            },
+            "processes": {
+                "loads_process_list": [
+                    {
+                        "python_module": "apply_initial_uniform_stress_field",
+                        "Parameters": {"value": [0.0, 0.0, 0.0, 0.0]},
+                    }
+                ]
+            },
+        }
+        self.template_path.write_text(json.dumps(self.template))
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_edits_are_kept_in_memory_until_saved(self):
+        editor = ProjectParameterEditor(str(self.template_path))
+        editor.update_property("time_step", 0.1)
+        editor.update_property("end_time", 2.0)
+        editor.update_nested_value(
+            "apply_initial_uniform_stress_field", "value", [-100.0] * 3 + [0.0]
+        )
+
+        self.assertEqual(json.loads(self.template_path.read_text()), self.template)
+
+        output_path = Path(self._directory.name) / "rendered.json"
+        editor.save(output_path)
+        rendered = json.loads(output_path.read_text())
+        self.assertEqual(rendered["problem_data"]["end_time"], 2.0)
+        self.assertEqual(rendered["solver_settings"]["time_stepping"]["time_step"], 0.1)
+        self.assertEqual(
+            rendered["solver_settings"]["model_import_settings"]["input_filename"],
+            "time_step",
+        )
+        self.assertEqual(
+            rendered["processes"]["loads_process_list"][0]["Parameters"]["value"],
+            [-100.0, -100.0, -100.0, 0.0],
+        )
+
+    def test_missing_property_is_reported(self):
+        messages = []
+        editor = ProjectParameterEditor(
+            str(self.template_path), logger=lambda msg, level: messages.append(msg)
+        )
+
+        editor.update_property("start_time", 0.0)
+
+        self.assertEqual(messages, ["Could not find 'start_time' to update."])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from kratos_element_test.model.material_input_data_models import (
+    MohrCoulombMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    ANALYTICAL,
+    FINITE_ELEMENT,
+    MATERIAL_POINT,
+    CRSSimulationInputs,
+    StrainIncrement,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.linear_elastic_simulation import (
+    LinearElasticSimulation,
+)
+from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+from kratos_element_test.model.pipeline.simulation_factory import (
+    create_simulation,
+    solution_method,
+)
+from kratos_element_test.model.test.input_factories import (
+    linear_elastic_inputs,
+)
+
+YOUNG_MODULUS = 9e5
+
+
+def _test_inputs(test_type):
+    if test_type == "crs":
+        test_inputs = CRSSimulationInputs(
+            test_type="crs",
+            strain_increments=[
+                StrainIncrement(duration_in_hours=1.0, strain_increment=-1.0, steps=8),
+                StrainIncrement(duration_in_hours=2.0, strain_increment=0.5, steps=6),
+            ],
+        )
+        test_inputs.update_totals()
+        return test_inputs
+    return TriaxialAndShearSimulationInputs(
+        test_type=test_type,
+        maximum_strain=5.0,
+        initial_effective_cell_pressure=50.0,
+        number_of_steps=10,
+    )
+
+
+def _run(test_type, force_finite_element):
+    sim = create_simulation(
+        test_inputs=_test_inputs(test_type),
+        material_inputs=linear_elastic_inputs(young_modulus=YOUNG_MODULUS),
+        logger=lambda msg, level: None,
+        force_finite_element=force_finite_element,
+    )
+    sim.run()
+    return sim.post_process_results()
+
+
+class LinearElasticSimulationTest(unittest.TestCase):
+    @parameterized.expand(["triaxial", "direct_shear", "crs"])
+    def test_results_equal_those_of_the_finite_element_model(self, test_type):
+        finite_element_results = _run(test_type, force_finite_element=True)
+        analytical_results = _run(test_type, force_finite_element=False)
+
+        self.assertEqual(
+            finite_element_results.channel_names, analytical_results.channel_names
+        )
+        for name in finite_element_results.channel_names:
+            np.testing.assert_allclose(
+                analytical_results[name],
+                finite_element_results[name],
+                rtol=1e-9,
+                atol=1e-9,
+                err_msg=name,
+            )
+
+    def test_triaxial_axial_stress_increases_with_the_young_modulus(self):
+        results = _run("triaxial", force_finite_element=False)
+
+        np.testing.assert_allclose(results["sigma_xx"], -50.0)
+        self.assertAlmostEqual(results["sigma_yy"][-1], -50.0 - YOUNG_MODULUS * 0.05)
+        self.assertAlmostEqual(results["yy_strain"][-1], -0.05)
+
+    def test_linear_elastic_material_is_solved_analytically_unless_forced(self):
+        self.assertIsInstance(
+            create_simulation(
+                test_inputs=_test_inputs("triaxial"),
+                material_inputs=linear_elastic_inputs(),
+            ),
+            LinearElasticSimulation,
+        )
+        self.assertIsInstance(
+            create_simulation(
+                test_inputs=_test_inputs("triaxial"),
+                material_inputs=linear_elastic_inputs(),
+                force_finite_element=True,
+            ),
+            RunSimulation,
+        )
+
+    @parameterized.expand(
+        [
+            (linear_elastic_inputs, FINITE_ELEMENT, False, ANALYTICAL),
+            (linear_elastic_inputs, FINITE_ELEMENT, True, FINITE_ELEMENT),
+            (linear_elastic_inputs, MATERIAL_POINT, False, MATERIAL_POINT),
+            (MohrCoulombMaterialInputs, FINITE_ELEMENT, False, FINITE_ELEMENT),
+        ]
+    )
+    def test_solution_method(
+        self, material_inputs_factory, execution_mode, force_finite_element, expected
+    ):
+        self.assertEqual(
+            solution_method(
+                material_inputs_factory(), execution_mode, force_finite_element
+            ),
+            expected,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
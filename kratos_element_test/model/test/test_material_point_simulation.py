@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from kratos_element_test.model.models import (
+    FINITE_ELEMENT,
+    MATERIAL_POINT,
+    CRSSimulationInputs,
+    StrainIncrement,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.material_point_simulation import (
+    MaterialPointSimulation,
+)
+from kratos_element_test.model.pipeline.simulation_factory import create_simulation
+from kratos_element_test.model.test.input_factories import (
+    linear_elastic_inputs,
+    mohr_coulomb_inputs,
+)
+
+
+def _test_inputs(test_type):
+    if test_type == "crs":
+        test_inputs = CRSSimulationInputs(
+            test_type="crs",
+            strain_increments=[
+                StrainIncrement(duration_in_hours=1.0, strain_increment=-1.0, steps=8),
+                StrainIncrement(duration_in_hours=2.0, strain_increment=0.5, steps=6),
+            ],
+        )
+        test_inputs.update_totals()
+        return test_inputs
+    return TriaxialAndShearSimulationInputs(
+        test_type=test_type, maximum_strain=5.0, number_of_steps=10
+    )
+
+
+def _run(execution_mode, test_inputs, material_inputs):
+    sim = create_simulation(
+        test_inputs=test_inputs,
+        material_inputs=material_inputs,
+        logger=lambda msg, level: None,
+        execution_mode=execution_mode,
+        force_finite_element=True,
+    )
+    sim.run()
+    return sim.post_process_results()
+
+
+class MaterialPointSimulationTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("triaxial", linear_elastic_inputs),
+            ("direct_shear", linear_elastic_inputs),
+            ("crs", linear_elastic_inputs),
+            ("direct_shear", mohr_coulomb_inputs),
+            ("crs", mohr_coulomb_inputs),
+        ]
+    )
+    def test_results_equal_those_of_the_finite_element_model(
+        self, test_type, material_inputs_factory
+    ):
+        finite_element_results = _run(
+            FINITE_ELEMENT, _test_inputs(test_type), material_inputs_factory()
+        )
+        material_point_results = _run(
+            MATERIAL_POINT, _test_inputs(test_type), material_inputs_factory()
+        )
+
+        self.assertEqual(
+            finite_element_results.channel_names, material_point_results.channel_names
+        )
+        for name in finite_element_results.channel_names:
+            np.testing.assert_allclose(
+                material_point_results[name],
+                finite_element_results[name],
+                rtol=1e-9,
+                atol=1e-9,
+                err_msg=name,
+            )
+
+    def test_triaxial_lateral_stress_stays_at_the_cell_pressure_after_yielding(self):
+        test_inputs = _test_inputs("triaxial")
+        test_inputs.initial_effective_cell_pressure = 50.0
+        sim = MaterialPointSimulation(
+            test_inputs=test_inputs,
+            material_inputs=mohr_coulomb_inputs(cohesion=10.0),
+            logger=lambda msg, level: None,
+        )
+        sim.run()
+        results = sim.post_process_results()
+
+        np.testing.assert_allclose(results["sigma_xx"], -50.0)
+        # Mohr-Coulomb failure: sigma1 = sigma3 * Kp - 2 c sqrt(Kp), with Kp = 3
+        self.assertAlmostEqual(
+            results["sigma1"][-1], -50.0 * 3.0 - 2.0 * 10.0 * np.sqrt(3.0), places=6
+        )
+
+    def test_unknown_execution_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            create_simulation(
+                test_inputs=_test_inputs("triaxial"),
+                material_inputs=linear_elastic_inputs(),
+                execution_mode="unknown",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
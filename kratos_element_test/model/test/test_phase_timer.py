@@ -0,0 +1,115 @@
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+)
+from kratos_element_test.model.models import TriaxialAndShearSimulationInputs
+from kratos_element_test.model.phase_timer import PhaseTimer
+from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+from kratos_element_test.model.simulation_results import SimulationResults
+
+
+class PhaseTimerTest(unittest.TestCase):
+    def test_nested_phases_are_recorded_in_start_order(self):
+        timer = PhaseTimer()
+        with timer.phase("run"):
+            with timer.phase("render"):
+                pass
+            with timer.phase("solve"):
+                pass
+        with timer.phase("render"):
+            pass
+
+        self.assertEqual(list(timer.totals()), ["run", "render", "solve"])
+        self.assertEqual(
+            [(timing.name, timing.depth) for timing in timer._in_start_order()],
+            [("run", 0), ("render", 1), ("solve", 1), ("render", 0)],
+        )
+        self.assertGreaterEqual(
+            timer.total("run"),
+            sum(t.duration_in_seconds for t in timer.timings if t.depth == 1),
+        )
+
+    def test_phase_is_recorded_when_it_raises(self):
+        timer = PhaseTimer()
+        with self.assertRaises(ValueError):
+            with timer.phase("failing"):
+                raise ValueError()
+
+        with timer.phase("next"):
+            pass
+
+        self.assertEqual(
+            [(timing.name, timing.depth) for timing in timer.timings],
+            [("failing", 0), ("next", 0)],
+        )
+
+    def test_chrome_trace_contains_complete_events(self):
+        timer = PhaseTimer()
+        with timer.phase("run"):
+            with timer.phase("solve"):
+                pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            trace_path = Path(directory) / "trace.json"
+            timer.write_chrome_trace(trace_path)
+            trace = json.loads(trace_path.read_text())
+
+        events = trace["traceEvents"]
+        self.assertEqual([event["name"] for event in events], ["run", "solve"])
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
+        self.assertGreaterEqual(events[0]["dur"], events[1]["dur"])
+
+    def test_timings_survive_pickling_of_results(self):
+        timer = PhaseTimer()
+        with timer.phase("run"):
+            pass
+        results = SimulationResults({"sigma1": [1.0]}, timings=timer)
+
+        restored = pickle.loads(pickle.dumps(results))
+
+        self.assertEqual(restored.timings.totals(), timer.totals())
+        self.assertNotIn("timings", restored.to_dict())
+
+
+class RunSimulationTimingTest(unittest.TestCase):
+    def test_results_carry_the_timings_of_all_phases(self):
+        material_inputs = LinearElasticMaterialInputs()
+        material_inputs.user_defined_parameters["YOUNG_MODULUS"].value = 9e5
+        material_inputs.user_defined_parameters["POISSON_RATIO"].value = 0.3
+
+        with tempfile.TemporaryDirectory() as directory:
+            trace_path = Path(directory) / "trace.json"
+            sim = RunSimulation(
+                test_inputs=TriaxialAndShearSimulationInputs(test_type="triaxial"),
+                material_inputs=material_inputs,
+                logger=lambda msg, level: None,
+                chrome_trace_path=trace_path,
+            )
+            sim.run()
+            results = sim.post_process_results()
+            trace = json.loads(trace_path.read_text())
+
+        totals = results.timings.totals()
+        for phase in [
+            "run",
+            "render_inputs",
+            "write_inputs",
+            "kratos",
+            "construct_stages",
+            "run_stage_1",
+            "post_process_results",
+            "principal_stresses",
+        ]:
+            self.assertIn(phase, totals)
+        self.assertGreater(totals["run"], totals["kratos"])
+        self.assertEqual({event["name"] for event in trace["traceEvents"]}, set(totals))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+import numpy as np
+
+from kratos_element_test.model.io.gid_result_reader import ResultSeries
+from kratos_element_test.model.models import (
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.progress import (
+    PartialResults,
+    ProgressThrottle,
+    SimulationProgress,
+)
+from kratos_element_test.model.pipeline.result_collector import STRESS_TENSOR
+from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+from kratos_element_test.model.pipeline.warm_worker import WarmWorker
+from kratos_element_test.model.test.input_factories import (
+    crs_inputs,
+    mohr_coulomb_inputs,
+)
+
+
+def _progress(stage, step):
+    time = float(step)
+    return SimulationProgress(
+        stage=stage,
+        number_of_stages=2,
+        step=step,
+        time=time,
+        end_time=10.0,
+        nonlinear_iterations=2,
+        time_steps=np.array([time]),
+        series={
+            STRESS_TENSOR: ResultSeries(
+                times=np.array([time]), values=np.full((1, 6), -time)
+            )
+        },
+    )
+
+
+class ProgressThrottleTest(unittest.TestCase):
+    def test_steps_between_reports_are_merged(self):
+        reports = []
+        throttle = ProgressThrottle(reports.append, min_interval_in_seconds=60.0)
+
+        for step in range(1, 5):
+            throttle.add(_progress(1, step))
+        throttle.flush()
+
+        self.assertEqual([report.step for report in reports], [1, 4])
+        np.testing.assert_array_equal(reports[1].time_steps, [2.0, 3.0, 4.0])
+        self.assertEqual(reports[1].series[STRESS_TENSOR].values.shape, (3, 6))
+
+    def test_a_new_stage_flushes_the_previous_stage(self):
+        reports = []
+        throttle = ProgressThrottle(reports.append, min_interval_in_seconds=60.0)
+
+        for stage, step in [(1, 1), (1, 2), (2, 1)]:
+            throttle.add(_progress(stage, step))
+
+        self.assertEqual(
+            [(report.stage, report.step) for report in reports], [(1, 1), (1, 2)]
+        )
+
+    def test_description_shows_the_state_of_the_run(self):
+        self.assertEqual(
+            _progress(2, 5).describe(),
+            "Stage 2/2, step 5, t = 5 s (50%), 2 iteration(s)",
+        )
+
+
+class RunSimulationProgressTest(unittest.TestCase):
+    def _run(self, test_inputs):
+        reports = []
+        partial_results = PartialResults(5.0, 30.0)
+
+        def on_progress(progress):
+            reports.append(progress)
+            partial_results.add(progress)
+
+        sim = RunSimulation(
+            test_inputs=test_inputs,
+            material_inputs=mohr_coulomb_inputs(),
+            logger=lambda msg, level: None,
+            progress_callback=on_progress,
+        )
+        sim.run()
+        return reports, partial_results.to_results(), sim.post_process_results()
+
+    def test_partial_results_add_up_to_the_results(self):
+        reports, partial, results = self._run(
+            TriaxialAndShearSimulationInputs(test_type="triaxial", number_of_steps=20)
+        )
+
+        self.assertEqual(reports[-1].step, 20)
+        self.assertAlmostEqual(reports[-1].fraction, 1.0)
+        self.assertGreaterEqual(reports[-1].nonlinear_iterations, 1)
+        self.assertEqual(partial.channel_names, results.channel_names)
+        for name in results.channel_names:
+            np.testing.assert_array_equal(partial[name], results[name])
+
+    def test_crs_stages_are_reported(self):
+        reports, partial, results = self._run(crs_inputs())
+
+        stages = [report.stage for report in reports]
+        self.assertEqual(stages, sorted(stages))
+        self.assertEqual((stages[0], stages[-1]), (1, 2))
+        self.assertTrue(all(report.number_of_stages == 2 for report in reports))
+        self.assertEqual(reports[-1].step, 10)
+        np.testing.assert_array_equal(partial["yy_strain"], results["yy_strain"])
+
+
+class WarmWorkerProgressTest(unittest.TestCase):
+    def test_progress_of_the_worker_is_passed_on(self):
+        worker = WarmWorker(logger=lambda msg, level: None)
+        self.addCleanup(worker.shutdown)
+        reports = []
+
+        results = worker.run(
+            TriaxialAndShearSimulationInputs(test_type="triaxial", number_of_steps=10),
+            mohr_coulomb_inputs(),
+            progress_callback=reports.append,
+        )
+
+        self.assertEqual(reports[-1].step, 10)
+        self.assertEqual(
+            sum(len(report.time_steps) for report in reports), len(results["sigma1"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
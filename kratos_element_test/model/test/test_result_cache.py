@@ -0,0 +1,153 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from kratos_element_test.model.main_model import MainModel
+from kratos_element_test.model.material_input_data_models import (
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import TriaxialAndShearSimulationInputs
+from kratos_element_test.model.result_cache import (
+    MAX_REMEMBERED_FILE_HASHES,
+    ResultCache,
+    _file_hash,
+    _hash_of_file,
+    simulation_cache_key,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
+from kratos_element_test.model.test.input_factories import (
+    linear_elastic_inputs,
+)
+
+
+class SimulationCacheKeyTest(unittest.TestCase):
+    def test_identical_inputs_give_identical_keys(self):
+        test_inputs = TriaxialAndShearSimulationInputs(test_type="triaxial")
+
+        self.assertEqual(
+            simulation_cache_key(test_inputs, linear_elastic_inputs()),
+            simulation_cache_key(
+                TriaxialAndShearSimulationInputs(test_type="triaxial"),
+                linear_elastic_inputs(),
+            ),
+        )
+
+    def test_changed_inputs_give_different_keys(self):
+        test_inputs = TriaxialAndShearSimulationInputs(test_type="triaxial")
+        key = simulation_cache_key(test_inputs, linear_elastic_inputs())
+
+        self.assertNotEqual(
+            key,
+            simulation_cache_key(test_inputs, linear_elastic_inputs(young_modulus=1e6)),
+        )
+        self.assertNotEqual(
+            key,
+            simulation_cache_key(
+                TriaxialAndShearSimulationInputs(
+                    test_type="triaxial", drainage="undrained"
+                ),
+                linear_elastic_inputs(),
+            ),
+        )
+
+    def test_udsm_key_depends_on_dll_content_and_number(self):
+        test_inputs = TriaxialAndShearSimulationInputs(test_type="triaxial")
+        with tempfile.TemporaryDirectory() as directory:
+            dll_path = Path(directory) / "model.dll"
+            dll_path.write_bytes(b"first build")
+            material_inputs = UDSMMaterialInputs()
+            material_inputs.material_parameters["UDSM_NAME"] = str(dll_path)
+            first_key = simulation_cache_key(test_inputs, material_inputs)
+
+            material_inputs.material_parameters["UDSM_NUMBER"] = 2
+            self.assertNotEqual(
+                first_key, simulation_cache_key(test_inputs, material_inputs)
+            )
+
+            material_inputs.material_parameters["UDSM_NUMBER"] = 1
+            dll_path.write_bytes(b"second build")
+            os.utime(dll_path, ns=(0, 1))
+            self.assertNotEqual(
+                first_key, simulation_cache_key(test_inputs, material_inputs)
+            )
+
+    def test_remembered_file_hashes_are_bounded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            dll_path = Path(directory) / "model.dll"
+            for build in range(MAX_REMEMBERED_FILE_HASHES + 10):
+                dll_path.write_bytes(f"build {build}".encode())
+                os.utime(dll_path, ns=(0, build))
+                _file_hash(dll_path)
+
+        self.assertLessEqual(
+            _hash_of_file.cache_info().currsize, MAX_REMEMBERED_FILE_HASHES
+        )
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.cache_directory = Path(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_hits_and_misses_are_counted(self):
+        cache = ResultCache(self.cache_directory)
+        results = SimulationResults({"sigma1": [1.0, 2.0], "cohesion": None})
+
+        self.assertIsNone(cache.get("abc"))
+        cache.put("abc", results)
+
+        self.assertEqual(cache.get("abc").to_dict(), results.to_dict())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        results = SimulationResults({"sigma1": [0.0] * 1000})
+        cache = ResultCache(self.cache_directory)
+        cache.put("first", results)
+        cache.max_size_in_bytes = int(cache.size_in_bytes() * 2.5)
+        cache.put("second", results)
+        os.utime(cache._entry_path("first"), ns=(0, 0))
+        os.utime(cache._entry_path("second"), ns=(0, 1))
+        cache.get("first")
+
+        cache.put("third", results)
+
+        self.assertIsNotNone(cache.get("first"))
+        self.assertIsNone(cache.get("second"))
+        self.assertIsNotNone(cache.get("third"))
+
+    def test_repeated_run_is_served_from_the_cache(self):
+        messages = []
+        model = MainModel(
+            logger=lambda msg, level: messages.append(msg),
+            result_cache=ResultCache(self.cache_directory),
+        )
+        model.get_material_input_manager().set_current_material_type("linear_elastic")
+        model.get_material_input_manager().update_material_parameter_of_current_type(
+            "YOUNG_MODULUS", 9e5
+        )
+        model.get_material_input_manager().update_material_parameter_of_current_type(
+            "POISSON_RATIO", 0.3
+        )
+
+        model.run_simulation()
+        first_results = model.get_latest_results()
+        model.run_simulation()
+
+        cache = model.get_result_cache()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        np.testing.assert_array_equal(
+            model.get_latest_results()["sigma1"], first_results["sigma1"]
+        )
+        self.assertEqual(
+            messages.count("Loaded results of an identical earlier run."), 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import shutil
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from kratos_element_test.model.models import (
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.result_collector import ResultCollector
+from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+from kratos_element_test.model.test.input_factories import (
+    crs_inputs,
+    mohr_coulomb_inputs,
+)
+
+
+class ResultCaptureProcessTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            [
+                TriaxialAndShearSimulationInputs(
+                    test_type="triaxial", number_of_steps=20
+                )
+            ],
+            [
+                TriaxialAndShearSimulationInputs(
+                    test_type="direct_shear", number_of_steps=20
+                )
+            ],
+            [crs_inputs(steps_per_increment=20)],
+        ]
+    )
+    def test_captured_results_match_gid_output(self, test_inputs):
+        sim = RunSimulation(
+            test_inputs=test_inputs,
+            material_inputs=mohr_coulomb_inputs(),
+            logger=lambda msg, level: None,
+            keep_tmp=True,
+            write_gid_output=True,
+        )
+        self.addCleanup(shutil.rmtree, sim.tmp_dir, ignore_errors=True)
+        sim.run()
+
+        from_gid_output = ResultCollector(
+            [str(path) for path in sim._output_file_paths()], 5.0, 30.0
+        ).collect_results()
+        captured = sim.post_process_results()
+
+        self.assertEqual(captured.channel_names, from_gid_output.channel_names)
+        for name in captured.channel_names:
+            # The GiD output is written with six significant digits. The
+            # volumetric strain is a sum of strain components of that accuracy.
+            reference = "yy_strain" if name == "vol_strain" else name
+            scale = max(np.max(np.abs(from_gid_output[reference])), 1e-8)
+            np.testing.assert_allclose(
+                captured[name], from_gid_output[name], rtol=0.0, atol=1e-5 * scale
+            )
+
+    def test_no_gid_output_is_written_by_default(self):
+        sim = RunSimulation(
+            test_inputs=TriaxialAndShearSimulationInputs(
+                test_type="triaxial", number_of_steps=10
+            ),
+            material_inputs=mohr_coulomb_inputs(),
+            logger=lambda msg, level: None,
+            keep_tmp=True,
+        )
+        self.addCleanup(shutil.rmtree, sim.tmp_dir, ignore_errors=True)
+        sim.run()
+
+        results = sim.post_process_results()
+
+        self.assertFalse((sim.tmp_dir / "gid_output").exists())
+        self.assertEqual(len(results["sigma1"]), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ from kratos_element_test.model.core_utils import (
     seconds_list_to_hours_list,
 )
 from kratos_element_test.model.pipeline.result_collector import ResultCollector
+from kratos_element_test.model.simulation_results import SimulationResults
 
 
 class ResultCollectorTest(unittest.TestCase):
@@ -54,7 +55,7 @@ class ResultCollectorTest(unittest.TestCase):
         )
         try:
             results = collector.collect_results()
-            self.assertIsInstance(results, dict)
+            self.assertIsInstance(results, SimulationResults)
         except Exception as e:
             self.fail(f"collect_results raised an exception unexpectedly: {e}")
 
@@ -104,6 +105,23 @@ class ResultCollectorTest(unittest.TestCase):
         ]
         np.testing.assert_array_almost_equal(results["yy_strain"], expected_yy_strain)
 
+    def test_principal_stresses_match_per_tensor_eigenvalues_in_time_order(self):
+        rng = np.random.default_rng(1)
+        components = rng.uniform(-200.0, 50.0, size=(50, 3, 3))
+        tensors = 0.5 * (components + components.transpose(0, 2, 1))
+        times = rng.integers(0, 10, size=50).astype(float)
+
+        sigma_1, sigma_3 = ResultCollector._calculate_principal_stresses(times, tensors)
+
+        expected_sigma_1, expected_sigma_3 = [], []
+        for time in sorted(set(times)):
+            for tensor in tensors[times == time]:
+                eigenvalues, _ = np.linalg.eigh(tensor)
+                expected_sigma_1.append(np.min(eigenvalues))
+                expected_sigma_3.append(np.max(eigenvalues))
+        np.testing.assert_array_almost_equal(sigma_1, expected_sigma_1)
+        np.testing.assert_array_almost_equal(sigma_3, expected_sigma_3)
+
 
 if __name__ == "__main__":
     unittest.main()
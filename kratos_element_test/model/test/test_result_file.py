@@ -0,0 +1,104 @@
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from parameterized import parameterized
+
+from kratos_element_test.model.io.excel_export import write_excel_from_result_file
+from kratos_element_test.model.io.result_file import read_results, write_results
+from kratos_element_test.model.simulation_results import SimulationResults
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _results():
+    return SimulationResults(
+        {
+            "yy_strain": np.linspace(0.0, -0.2, 11),
+            "vol_strain": np.linspace(0.0, -0.1, 11),
+            "sigma1": np.linspace(-100.0, -300.0, 11),
+            "sigma3": np.full(11, -100.0),
+            "mean_stress": np.linspace(-100.0, -166.7, 11),
+            "von_mises": np.linspace(0.0, 200.0, 11),
+            "cohesion": 5.0,
+            "phi": 30.0,
+        }
+    )
+
+
+def _is_memory_mapped(array):
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array is not None
+
+
+class ResultFileTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.directory = Path(self._directory.name)
+
+    @parameterized.expand([("uncompressed", False), ("compressed", True)])
+    def test_npz_file_holds_results_and_metadata(self, _, compress):
+        path = write_results(
+            self.directory / "run.npz",
+            _results(),
+            compress=compress,
+            test_type="triaxial",
+            test_inputs={"number_of_steps": 10},
+        )
+
+        results, metadata = read_results(path)
+
+        self.assertEqual(results.channel_names, _results().channel_names)
+        for name in results.channel_names:
+            np.testing.assert_array_equal(results[name], _results()[name])
+            self.assertFalse(results[name].flags.writeable)
+            self.assertEqual(_is_memory_mapped(results[name]), not compress)
+        self.assertEqual((results["cohesion"], results["phi"]), (5.0, 30.0))
+        self.assertEqual(
+            metadata, {"test_type": "triaxial", "test_inputs": {"number_of_steps": 10}}
+        )
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet_file_holds_results_and_metadata(self):
+        path = write_results(
+            self.directory / "run.parquet", _results(), test_type="triaxial"
+        )
+
+        results, metadata = read_results(path)
+
+        for name in _results().channel_names:
+            np.testing.assert_array_equal(results[name], _results()[name])
+        self.assertEqual(results["phi"], 30.0)
+        self.assertEqual(metadata, {"test_type": "triaxial"})
+
+    @unittest.skipIf(HAS_PYARROW, "pyarrow is installed")
+    def test_parquet_file_needs_pyarrow(self):
+        with self.assertRaises(ImportError):
+            write_results(self.directory / "run.parquet", _results())
+
+    def test_unknown_suffix_is_rejected(self):
+        with self.assertRaises(ValueError):
+            write_results(self.directory / "run.csv", _results())
+
+    def test_excel_is_derived_from_result_file(self):
+        path = write_results(
+            self.directory / "run.npz", _results(), test_type="triaxial"
+        )
+
+        excel_path = write_excel_from_result_file(path)
+
+        self.assertEqual(excel_path, self.directory / "run.xlsx")
+        sheets = pd.read_excel(excel_path, sheet_name=None)
+        self.assertEqual(
+            list(sheets), ["Plot 1", "Plot 2", "Plot 3", "Plot 4", "Plot 5"]
+        )
+        np.testing.assert_allclose(sheets["Plot 3"].iloc[:, 1], _results()["sigma1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
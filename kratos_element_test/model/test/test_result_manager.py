@@ -3,7 +3,7 @@ import unittest
 from parameterized import parameterized
 
 from kratos_element_test.model.result_manager import ResultManager
-from kratos_element_test.view.ui_constants import TRIAXIAL, DIRECT_SHEAR, CRS
+from kratos_element_test.model.models import TRIAXIAL, DIRECT_SHEAR, CRS
 
 
 class ResultManagerTest(unittest.TestCase):
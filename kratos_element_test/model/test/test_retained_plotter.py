@@ -0,0 +1,134 @@
+import unittest
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from parameterized import parameterized
+
+from kratos_element_test.plotters.matplotlib_plotter import MatplotlibPlotter
+from kratos_element_test.plotters.retained_plotter import (
+    PLOT_CHANNELS,
+    RetainedPlotter,
+    _grown_limits,
+)
+
+NUMBER_OF_AXES = {"triaxial": 5, "direct_shear": 4, "crs": 5}
+NUMBER_OF_POINTS = 20
+
+
+def _results(test_type, number_of_points):
+    """
+    The first points of the results of a test that has NUMBER_OF_POINTS
+    points when it is complete.
+    """
+    fraction = np.linspace(0.0, 1.0, NUMBER_OF_POINTS)[:number_of_points]
+    results = {"cohesion": 5.0, "phi": 30.0}
+    for index, channel in enumerate(PLOT_CHANNELS[test_type]):
+        if channel not in results:
+            results[channel] = -(50.0 + 10.0 * (index + 1) * fraction)
+    return results
+
+
+def _figure(test_type):
+    figure = Figure(figsize=(12, 8), dpi=50)
+    FigureCanvasAgg(figure)
+    axes = [
+        figure.add_subplot(2, 3, index + 1)
+        for index in range(NUMBER_OF_AXES[test_type])
+    ]
+    return figure, axes
+
+
+def _image(figure):
+    return np.asarray(figure.canvas.buffer_rgba()).copy()
+
+
+class RetainedPlotterTest(unittest.TestCase):
+    @parameterized.expand([("triaxial",), ("direct_shear",), ("crs",)])
+    def test_update_in_place_equals_a_full_plot(self, test_type):
+        retained_figure, retained_axes = _figure(test_type)
+        plotter = RetainedPlotter(retained_axes)
+        plotter.plot(test_type, _results(test_type, 5))
+        plotter.render()
+        lines = [list(ax.lines) for ax in retained_axes]
+
+        plotter.plot(test_type, _results(test_type, NUMBER_OF_POINTS))
+        plotter.render()
+
+        full_figure, full_axes = _figure(test_type)
+        getattr(MatplotlibPlotter(full_axes), test_type)(
+            *[
+                _results(test_type, NUMBER_OF_POINTS)[channel]
+                for channel in PLOT_CHANNELS[test_type]
+            ]
+        )
+        full_figure.canvas.draw()
+
+        # The lines were updated, not plotted again
+        self.assertEqual([list(ax.lines) for ax in retained_axes], lines)
+        for retained_ax, full_ax in zip(retained_axes, full_axes):
+            self.assertEqual(retained_ax.get_xlim(), full_ax.get_xlim())
+            self.assertEqual(retained_ax.get_ylim(), full_ax.get_ylim())
+            for retained_line, full_line in zip(retained_ax.lines, full_ax.lines):
+                np.testing.assert_array_equal(
+                    retained_line.get_xydata(), full_line.get_xydata()
+                )
+        np.testing.assert_array_equal(_image(retained_figure), _image(full_figure))
+
+    def test_blitted_update_equals_a_full_draw(self):
+        figure, axes = _figure("triaxial")
+        plotter = RetainedPlotter(axes)
+        draws = []
+        figure.canvas.mpl_connect("draw_event", draws.append)
+        plotter.plot("triaxial", _results("triaxial", 5))
+        plotter.render()
+        # The limits grow, so the whole figure is drawn
+        plotter.plot("triaxial", _results("triaxial", 10), streaming=True)
+        plotter.render()
+        self.assertEqual(len(draws), 2)
+
+        # The new points fit in the grown limits, so only the lines are blitted
+        plotter.plot("triaxial", _results("triaxial", 11), streaming=True)
+        plotter.render()
+        self.assertEqual(len(draws), 2)
+        blitted = _image(figure)
+
+        figure.canvas.draw()
+        np.testing.assert_array_equal(blitted, _image(figure))
+
+    def test_final_update_draws_the_lines_as_normal_artists(self):
+        figure, axes = _figure("triaxial")
+        plotter = RetainedPlotter(axes)
+        plotter.plot("triaxial", _results("triaxial", 5))
+        plotter.plot("triaxial", _results("triaxial", 10), streaming=True)
+        self.assertTrue(any(line.get_animated() for line in axes[0].lines))
+
+        plotter.plot("triaxial", _results("triaxial", NUMBER_OF_POINTS))
+
+        self.assertFalse(any(line.get_animated() for ax in axes for line in ax.lines))
+
+    def test_clear_empties_the_axes(self):
+        figure, axes = _figure("triaxial")
+        plotter = RetainedPlotter(axes)
+        plotter.plot("triaxial", _results("triaxial", 5))
+
+        plotter.clear()
+
+        self.assertEqual([len(ax.lines) for ax in axes], [0] * len(axes))
+
+
+class GrownLimitsTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("fits", (0.0, 10.0), (1.0, 9.0), (0.0, 10.0)),
+            ("grows_up", (0.0, 10.0), (0.0, 20.0), (0.0, 25.0)),
+            ("grows_down", (0.0, 10.0), (-10.0, 10.0), (-15.0, 10.0)),
+            ("inverted", (10.0, 0.0), (20.0, 0.0), (25.0, 0.0)),
+        ]
+    )
+    def test_limits_grow_with_headroom(self, _, current, target, expected):
+        self.assertEqual(_grown_limits(current, target, 0.25), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from parameterized import parameterized
+
+from kratos_element_test.model.main_model import MainModel
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+)
+from kratos_element_test.model.models import (
+    CRS,
+    MATERIAL_POINT,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.phase_timer import PhaseTimer
+from kratos_element_test.model.run_archive import RunArchive
+from kratos_element_test.model.simulation_results import SimulationResults
+from kratos_element_test.model.test.input_factories import (
+    mohr_coulomb_inputs,
+)
+
+
+def _results(scale=1.0):
+    timer = PhaseTimer()
+    with timer.phase("kratos"):
+        pass
+    return SimulationResults(
+        {
+            "sigma1": np.linspace(0.0, -100.0, 11) * scale,
+            "yy_strain": np.linspace(0.0, -0.2, 11),
+            "cohesion": 5.0,
+            "phi": 30.0,
+        },
+        timings=timer,
+    )
+
+
+class RunArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.archive = RunArchive(Path(self._directory.name) / "runs.sqlite")
+
+    def _add(self, friction_angle, cell_pressure, test_type="triaxial"):
+        return self.archive.add(
+            TriaxialAndShearSimulationInputs(
+                test_type=test_type, initial_effective_cell_pressure=cell_pressure
+            ),
+            mohr_coulomb_inputs(friction_angle=friction_angle),
+            _results(friction_angle),
+            MATERIAL_POINT,
+            run_time_in_seconds=0.5,
+        )
+
+    def test_archived_results_are_loaded_when_used(self):
+        run_id = self._add(30.0, 100.0)
+
+        [run] = self.archive.find()
+
+        self.assertEqual(run.id, run_id)
+        self.assertEqual(run.material_type, "mohr_coulomb")
+        self.assertEqual(run.solution_method, MATERIAL_POINT)
+        self.assertEqual(run.run_time_in_seconds, 0.5)
+        self.assertIn("kratos", run.phase_timings)
+        self.assertEqual(run.test_inputs["initial_effective_cell_pressure"], 100.0)
+        self.assertEqual(run.parameters["GEO_FRICTION_ANGLE"], 30.0)
+        self.assertIsNone(run._results)
+        np.testing.assert_array_equal(run.results["sigma1"], _results(30.0)["sigma1"])
+        self.assertEqual(run.results["phi"], 30.0)
+
+    def test_results_are_loaded_without_keeping_them(self):
+        self._add(30.0, 100.0)
+        [run] = self.archive.find()
+
+        results = run.load_results()
+
+        np.testing.assert_array_equal(results["sigma1"], _results(30.0)["sigma1"])
+        self.assertIsNone(run._results)
+
+    @parameterized.expand(
+        [
+            ("range", {"GEO_FRICTION_ANGLE": (25.0, 35.0)}, {}, [3, 2]),
+            ("lower bound", {"GEO_FRICTION_ANGLE": (30.0, None)}, {}, [4, 3, 2]),
+            ("value", {"GEO_COHESION": 5.0}, {}, [4, 3, 2, 1]),
+            (
+                "cell pressure",
+                {"GEO_FRICTION_ANGLE": (25.0, 35.0)},
+                {"initial_effective_cell_pressure": 100.0},
+                [2],
+            ),
+        ]
+    )
+    def test_runs_are_found_by_their_inputs(self, _, parameters, inputs, run_ids):
+        for friction_angle, cell_pressure in [
+            (20.0, 100.0),
+            (30.0, 100.0),
+            (32.0, 200.0),
+            (40.0, 100.0),
+        ]:
+            self._add(friction_angle, cell_pressure)
+        self._add(30.0, 100.0, test_type="direct_shear")
+
+        runs = self.archive.find(
+            test_type="triaxial", inputs=inputs, parameters=parameters
+        )
+
+        self.assertEqual([run.id for run in runs], run_ids)
+
+    def test_unknown_input_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.archive.find(inputs={"id = 1 OR 1": 1})
+
+    def test_removed_run_is_gone(self):
+        run_id = self._add(30.0, 100.0)
+
+        self.archive.remove(run_id)
+
+        self.assertEqual(len(self.archive), 0)
+        with self.assertRaises(KeyError):
+            self.archive.load_results(run_id)
+
+
+class MainModelRunArchiveTest(unittest.TestCase):
+    def test_runs_are_archived_and_shown_again(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        archive = RunArchive(Path(directory.name) / "runs.sqlite")
+        model = MainModel(
+            logger=lambda msg, level: None,
+            execution_mode=MATERIAL_POINT,
+            run_archive=archive,
+        )
+        model.set_material_type("linear_elastic")
+        manager = model.get_material_input_manager()
+        manager.update_material_parameter_of_current_type("YOUNG_MODULUS", 1e4)
+        manager.update_material_parameter_of_current_type("POISSON_RATIO", 0.3)
+
+        model.run_simulation()
+        triaxial_results = model.get_latest_results()
+        model.get_soil_test_input_manager().set_current_test_type(CRS)
+        model.clear_results()
+
+        [run] = archive.find(test_type="triaxial", material_type="linear_elastic")
+        model.show_archived_run(run)
+
+        self.assertEqual(model.get_current_test_type(), "Triaxial")
+        np.testing.assert_array_equal(
+            model.get_latest_results()["sigma1"], triaxial_results["sigma1"]
+        )
+        self.assertGreater(run.run_time_in_seconds, 0.0)
+
+    def test_linear_elastic_inputs_are_archived(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        archive = RunArchive(Path(directory.name) / "runs.sqlite")
+
+        archive.add(
+            TriaxialAndShearSimulationInputs(test_type="triaxial"),
+            LinearElasticMaterialInputs(),
+            _results(),
+        )
+
+        self.assertEqual(
+            archive.find(material_type="linear_elastic")[0].parameters,
+            {"YOUNG_MODULUS": 0.0, "POISSON_RATIO": 0.0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from kratos_element_test.model.models import TriaxialAndShearSimulationInputs
+from kratos_element_test.model.pipeline.simulation_pool import (
+    SimulationPool,
+    run_simulation_in_worker,
+)
+from kratos_element_test.model.test.input_factories import (
+    linear_elastic_inputs,
+)
+
+
+class SimulationPoolTest(unittest.TestCase):
+    def test_pooled_runs_match_runs_in_this_process(self):
+        test_inputs = TriaxialAndShearSimulationInputs(
+            test_type="triaxial", number_of_steps=10
+        )
+        jobs = [
+            (test_inputs, linear_elastic_inputs(young_modulus=e)) for e in (5e5, 1e6)
+        ]
+
+        with SimulationPool(max_workers=2) as pool:
+            pooled = dict(
+                (index, future.result()) for index, future in pool.run_simulations(jobs)
+            )
+
+        self.assertEqual(sorted(pooled), [0, 1])
+        for index, (test_inputs, material_inputs) in enumerate(jobs):
+            expected = run_simulation_in_worker(test_inputs, material_inputs)
+            np.testing.assert_array_almost_equal(
+                pooled[index]["sigma1"], expected["sigma1"]
+            )
+
+    def test_failures_are_raised_from_the_future(self):
+        with SimulationPool(max_workers=1) as pool:
+            future = pool.submit_simulation(
+                TriaxialAndShearSimulationInputs(test_type="unknown"),
+                linear_elastic_inputs(young_modulus=1e6),
+            )
+            with self.assertRaisesRegex(
+                FileNotFoundError, "Could not locate templates for 'unknown'"
+            ):
+                future.result()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from kratos_element_test.model.simulation_results import SimulationResults
+
+
+class SimulationResultsTest(unittest.TestCase):
+    def setUp(self):
+        self.results = SimulationResults(
+            {
+                "sigma1": [-100.0, -200.0, -300.0],
+                "time_steps": [0.1, 0.2, 0.3],
+                "cohesion": 3.0,
+                "phi": None,
+            }
+        )
+
+    def test_channels_are_read_only_float64_arrays(self):
+        sigma1 = self.results["sigma1"]
+
+        self.assertIsInstance(sigma1, np.ndarray)
+        self.assertEqual(sigma1.dtype, np.float64)
+        self.assertTrue(sigma1.flags.c_contiguous)
+        with self.assertRaises(ValueError):
+            sigma1[0] = 0.0
+
+    def test_channels_are_returned_without_copying(self):
+        self.assertIs(self.results["sigma1"], self.results["sigma1"])
+
+    def test_reads_like_a_dict(self):
+        self.assertEqual(
+            list(self.results), ["sigma1", "time_steps", "cohesion", "phi"]
+        )
+        self.assertEqual(self.results["cohesion"], 3.0)
+        self.assertIsNone(self.results.get("phi"))
+        self.assertIsNone(self.results.get("not_a_channel"))
+        self.assertIn("time_steps", self.results)
+        self.assertEqual(self.results.channel_names, ("sigma1", "time_steps"))
+
+    def test_dict_round_trip(self):
+        data = self.results.to_dict()
+
+        self.assertEqual(data["sigma1"], [-100.0, -200.0, -300.0])
+        self.assertIsInstance(data["sigma1"][0], float)
+        self.assertEqual(SimulationResults.from_dict(data).to_dict(), data)
+
+    def test_single_precision_halves_the_memory(self):
+        single = self.results.astype(np.float32)
+
+        self.assertEqual(single["sigma1"].dtype, np.float32)
+        self.assertEqual(single.nbytes * 2, self.results.nbytes)
+        self.assertEqual(single["cohesion"], 3.0)
+
+    def test_pickled_results_stay_read_only(self):
+        restored = pickle.loads(pickle.dumps(self.results))
+
+        np.testing.assert_array_equal(restored["sigma1"], self.results["sigma1"])
+        self.assertFalse(restored["sigma1"].flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()
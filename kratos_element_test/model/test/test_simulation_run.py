@@ -0,0 +1,149 @@
+import time
+import unittest
+
+from kratos_element_test.model.main_model import MainModel
+from kratos_element_test.model.models import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    MATERIAL_POINT,
+    TIMED_OUT,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.result_capture_process import (
+    pop_captured_stages,
+)
+from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+from kratos_element_test.model.pipeline.simulation_run import (
+    CancellationToken,
+    SimulationCancelled,
+    SimulationRun,
+)
+from kratos_element_test.model.pipeline.warm_worker import WarmWorker
+from kratos_element_test.model.pipeline.work_dir_pool import WorkDirPool
+from kratos_element_test.model.test.input_factories import (
+    mohr_coulomb_inputs,
+)
+
+
+def _wait_until_stopped(cancellation):
+    while True:
+        cancellation.raise_if_stopped()
+        time.sleep(0.01)
+
+
+class SimulationRunTest(unittest.TestCase):
+    def test_completed_run(self):
+        finished = []
+        run = SimulationRun(lambda cancellation: None, on_finished=finished.append)
+
+        self.assertTrue(run.start().wait(5.0))
+
+        self.assertEqual(run.state, COMPLETED)
+        self.assertEqual(finished, [run])
+
+    def test_failed_run(self):
+        def fail(cancellation):
+            raise ValueError("diverged")
+
+        run = SimulationRun(fail).start()
+        run.wait(5.0)
+
+        self.assertEqual(run.state, FAILED)
+        self.assertEqual(str(run.error), "diverged")
+
+    def test_cancelled_run(self):
+        run = SimulationRun(_wait_until_stopped).start()
+
+        run.cancel()
+
+        self.assertTrue(run.wait(5.0))
+        self.assertEqual(run.state, CANCELLED)
+
+    def test_run_that_exceeds_its_timeout(self):
+        run = SimulationRun(_wait_until_stopped, timeout_in_seconds=0.05).start()
+
+        self.assertTrue(run.wait(5.0))
+        self.assertEqual(run.state, TIMED_OUT)
+        self.assertTrue(run.error.timed_out)
+
+
+class RunSimulationCancellationTest(unittest.TestCase):
+    def test_cancelled_run_returns_its_directory_to_the_pool(self):
+        cancellation = CancellationToken()
+        cancellation.cancel()
+        with WorkDirPool(size=1) as pool:
+            sim = RunSimulation(
+                test_inputs=TriaxialAndShearSimulationInputs(
+                    test_type="triaxial", number_of_steps=10
+                ),
+                material_inputs=mohr_coulomb_inputs(),
+                logger=lambda msg, level: None,
+                work_dir_pool=pool,
+                cancellation=cancellation,
+            )
+
+            with self.assertRaises(SimulationCancelled):
+                sim.run()
+            pool.wait_for_cleanup()
+
+            self.assertEqual(pool.number_of_free_directories, 1)
+            self.assertEqual(list(sim.tmp_dir.iterdir()), [])
+            self.assertEqual(pop_captured_stages(sim.capture_id), [])
+
+
+class MainModelCancellationTest(unittest.TestCase):
+    def test_timed_out_run_is_recorded(self):
+        model = MainModel(logger=lambda msg, level: None, execution_mode=MATERIAL_POINT)
+        model.set_material_type("mohr_coulomb")
+        manager = model.get_material_input_manager()
+        for name, parameter in mohr_coulomb_inputs().user_defined_parameters.items():
+            manager.update_material_parameter_of_current_type(name, parameter.value)
+        result_manager = model.get_result_manager()
+
+        run = model.start_simulation(timeout_in_seconds=1e-9)
+
+        self.assertTrue(run.wait(30.0))
+        self.assertEqual(run.state, TIMED_OUT)
+        self.assertEqual(result_manager.get_run_state_of_active_test_type(), TIMED_OUT)
+        self.assertIsNone(result_manager.get_results_of_active_test_type())
+
+        model.set_timeout_in_seconds(None)
+        run = model.start_simulation()
+
+        self.assertTrue(run.wait(30.0))
+        self.assertEqual(run.state, COMPLETED)
+        self.assertEqual(result_manager.get_run_state_of_active_test_type(), COMPLETED)
+
+    def test_timeout_must_be_positive(self):
+        model = MainModel(logger=lambda msg, level: None)
+
+        with self.assertRaises(ValueError):
+            model.set_timeout_in_seconds(0.0)
+
+
+class WarmWorkerCancellationTest(unittest.TestCase):
+    def test_cancelled_worker_is_replaced(self):
+        worker = WarmWorker(logger=lambda msg, level: None)
+        self.addCleanup(worker.shutdown)
+        first_pid = worker.pid
+        first_work_directory = worker._work_directory
+        test_inputs = TriaxialAndShearSimulationInputs(
+            test_type="triaxial", number_of_steps=10
+        )
+
+        with self.assertRaises(SimulationCancelled):
+            worker.run(
+                test_inputs,
+                mohr_coulomb_inputs(),
+                cancellation=CancellationToken(timeout_in_seconds=1e-9),
+            )
+
+        self.assertNotEqual(worker.pid, first_pid)
+        self.assertFalse(first_work_directory.exists())
+        results = worker.run(test_inputs, mohr_coulomb_inputs())
+        self.assertEqual(len(results["sigma1"]), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
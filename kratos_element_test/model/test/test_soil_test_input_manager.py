@@ -2,9 +2,8 @@ import unittest
 
 from parameterized import parameterized
 
-from kratos_element_test.model.models import StrainIncrement
+from kratos_element_test.model.models import DIRECT_SHEAR, TRIAXIAL, StrainIncrement
 from kratos_element_test.model.soil_test_input_manager import SoilTestInputManager
-from kratos_element_test.view.ui_constants import TRIAXIAL, DIRECT_SHEAR
 
 
 class SoilTestInputManagerTest(unittest.TestCase):
@@ -0,0 +1,114 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from kratos_element_test.model.design_of_experiments import (
+    LATIN_HYPERCUBE,
+    parse_sweep_spec,
+)
+from kratos_element_test.model.io.columnar_result_store import ColumnarResultStore
+from kratos_element_test.model.pipeline.sweep_runner import (
+    SWEEP_FILE_NAME,
+    SweepRunner,
+)
+from kratos_element_test.model.simulation_results import SimulationResults
+
+
+def _sweep_spec():
+    return parse_sweep_spec(
+        {
+            "base": {
+                "test": {
+                    "test_type": "triaxial",
+                    "number_of_steps": 10,
+                    "initial_effective_cell_pressure": 50,
+                },
+                "material": {
+                    "type": "linear_elastic",
+                    "parameters": {"YOUNG_MODULUS": 1e4, "POISSON_RATIO": 0.3},
+                },
+            },
+            "factors": [
+                {"name": "material.YOUNG_MODULUS", "lower": 1e3, "upper": 1e5},
+                {"name": "test.number_of_steps", "levels": [0, 10]},
+            ],
+            "design": {"method": LATIN_HYPERCUBE, "samples": 6, "seed": 3},
+        }
+    )
+
+
+class ColumnarResultStoreTest(unittest.TestCase):
+    def test_runs_are_appended_to_the_channel_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ColumnarResultStore(Path(directory))
+            store.append(0, SimulationResults({"a": [1.0, 2.0], "phi": 30.0}), x=1)
+            store.append(1, status="failed")
+            store.append(2, SimulationResults({"a": [3.0]}), x=2)
+
+            reopened = ColumnarResultStore(Path(directory))
+            reopened.append(3, SimulationResults({"a": [4.0]}))
+
+            np.testing.assert_array_equal(reopened.channel("a"), [1, 2, 3, 4])
+            np.testing.assert_array_equal(reopened.results_of_run(2)["a"], [3.0])
+            self.assertEqual(reopened.results_of_run(0)["phi"], 30.0)
+            self.assertEqual([run["run"] for run in reopened.runs()], [0, 1, 2, 3])
+            with self.assertRaises(KeyError):
+                reopened.results_of_run(1)
+
+
+class SweepRunnerTest(unittest.TestCase):
+    def test_every_design_point_is_stored(self):
+        spec = _sweep_spec()
+        with tempfile.TemporaryDirectory() as directory:
+            sweep = SweepRunner(
+                spec, Path(directory), logger=lambda msg, level: None
+            ).run()
+            store = ColumnarResultStore(Path(directory))
+            runs = store.runs()
+            with open(Path(directory) / SWEEP_FILE_NAME) as f:
+                written_sweep = json.load(f)
+
+            completed = [run for run in runs if run["status"] == "completed"]
+            self.assertEqual(len(runs), 6)
+            self.assertEqual(sweep["number_of_failures"], 6 - len(completed))
+            self.assertEqual(written_sweep["number_of_runs"], 6)
+            self.assertEqual(len(store.channel("sigma1")), 10 * len(completed))
+            for run in runs:
+                self.assertEqual(run["factors"], spec.points[run["run"]])
+                # Zero steps is invalid input
+                expected_status = (
+                    "failed"
+                    if run["factors"]["test.number_of_steps"] == 0
+                    else "completed"
+                )
+                self.assertEqual(run["status"], expected_status)
+
+    def test_pool_stores_the_same_results(self):
+        spec = _sweep_spec()
+        with tempfile.TemporaryDirectory() as directory:
+            SweepRunner(
+                spec, Path(directory) / "sequential", logger=lambda msg, level: None
+            ).run()
+            SweepRunner(
+                spec,
+                Path(directory) / "pool",
+                logger=lambda msg, level: None,
+                workers=2,
+            ).run()
+            sequential = ColumnarResultStore(Path(directory) / "sequential")
+            pool = ColumnarResultStore(Path(directory) / "pool")
+
+            for run in sequential.runs():
+                if run["status"] != "completed":
+                    continue
+                np.testing.assert_array_equal(
+                    pool.results_of_run(run["run"])["sigma1"],
+                    sequential.results_of_run(run["run"])["sigma1"],
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
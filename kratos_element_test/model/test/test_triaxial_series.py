@@ -0,0 +1,178 @@
+import json
+import math
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from parameterized import parameterized
+
+from kratos_element_test.model.main_model import MainModel
+from kratos_element_test.model.models import (
+    MATERIAL_POINT,
+    TriaxialAndShearSimulationInputs,
+)
+from kratos_element_test.model.pipeline.triaxial_series_runner import (
+    SERIES_FILE_NAME,
+    TriaxialSeriesRunner,
+)
+from kratos_element_test.model.triaxial_series import (
+    fit_failure_envelope,
+    parse_triaxial_series_spec,
+    series_test_inputs,
+)
+
+MOHR_COULOMB = {
+    "type": "mohr_coulomb",
+    "parameters": {
+        "YOUNG_MODULUS": 1e4,
+        "POISSON_RATIO": 0.3,
+        "GEO_COHESION": 10.0,
+        "GEO_FRICTION_ANGLE": 30.0,
+    },
+}
+
+
+def _stresses_at_failure(cell_pressures, cohesion, friction_angle):
+    """
+    Returns σ₁ and σ₃ (compression negative) of Mohr circles that touch the
+    Mohr-Coulomb envelope.
+    """
+    sin_phi = math.sin(math.radians(friction_angle))
+    n_phi = (1.0 + sin_phi) / (1.0 - sin_phi)
+    sigma_3 = np.asarray(cell_pressures, dtype=float)
+    sigma_1 = n_phi * sigma_3 + 2.0 * cohesion * math.sqrt(n_phi)
+    return -sigma_1, -sigma_3
+
+
+class FailureEnvelopeTest(unittest.TestCase):
+    @parameterized.expand([(0.0, 25.0), (10.0, 30.0), (25.0, 40.0)])
+    def test_envelope_of_touching_circles_is_recovered(self, cohesion, phi):
+        sigma_1, sigma_3 = _stresses_at_failure([50.0, 100.0, 200.0], cohesion, phi)
+
+        envelope = fit_failure_envelope(sigma_1, sigma_3)
+
+        self.assertAlmostEqual(envelope.cohesion, cohesion, places=8)
+        self.assertAlmostEqual(envelope.friction_angle, phi, places=8)
+        self.assertAlmostEqual(envelope.residual, 0.0, places=8)
+        self.assertEqual(envelope.number_of_circles, 3)
+
+    def test_scattered_circles_give_a_residual(self):
+        sigma_1, sigma_3 = _stresses_at_failure([50.0, 100.0, 200.0, 400.0], 10, 30)
+        scatter = np.array([2.0, -2.0, -2.0, 2.0])
+
+        envelope = fit_failure_envelope(sigma_1 + scatter, sigma_3)
+
+        self.assertGreater(envelope.residual, 0.0)
+        self.assertLess(envelope.residual, 1.0)
+        self.assertAlmostEqual(envelope.friction_angle, 30.0, delta=0.5)
+
+    @parameterized.expand(
+        [
+            ("one_circle", [-300.0], [-100.0]),
+            ("same_circles", [-300.0, -300.0], [-100.0, -100.0]),
+            ("mismatch", [-300.0, -400.0], [-100.0]),
+            ("shrinking_circles", [-300.0, -250.0], [-100.0, -200.0]),
+        ]
+    )
+    def test_invalid_circles_are_rejected(self, _, sigma_1, sigma_3):
+        with self.assertRaises(ValueError):
+            fit_failure_envelope(sigma_1, sigma_3)
+
+
+class TriaxialSeriesInputsTest(unittest.TestCase):
+    def test_each_cell_pressure_gets_its_own_inputs(self):
+        test_inputs = TriaxialAndShearSimulationInputs(
+            test_type="triaxial", number_of_steps=10
+        )
+
+        series = series_test_inputs(test_inputs, [50, 100])
+
+        self.assertEqual(
+            [inputs.initial_effective_cell_pressure for inputs in series],
+            [50.0, 100.0],
+        )
+        self.assertTrue(all(inputs.number_of_steps == 10 for inputs in series))
+        self.assertEqual(test_inputs.initial_effective_cell_pressure, 100.0)
+
+    @parameterized.expand(
+        [
+            ("direct_shear", "direct_shear", [50, 100]),
+            ("one_pressure", "triaxial", [50]),
+            ("duplicates", "triaxial", [50, 50]),
+        ]
+    )
+    def test_invalid_series_are_rejected(self, _, test_type, cell_pressures):
+        with self.assertRaises(ValueError):
+            series_test_inputs(
+                TriaxialAndShearSimulationInputs(test_type=test_type), cell_pressures
+            )
+
+    def test_spec_is_parsed(self):
+        spec = parse_triaxial_series_spec(
+            {
+                "test": {"number_of_steps": 20},
+                "material": MOHR_COULOMB,
+                "cell_pressures": [50, 100, 200],
+            }
+        )
+
+        self.assertEqual(spec.test_inputs.test_type, "triaxial")
+        self.assertEqual(spec.test_inputs.number_of_steps, 20)
+        self.assertEqual(spec.cell_pressures, [50.0, 100.0, 200.0])
+        self.assertIsNone(spec.output_directory)
+
+
+class TriaxialSeriesRunnerTest(unittest.TestCase):
+    def test_envelope_of_the_material_is_recovered(self):
+        spec = parse_triaxial_series_spec(
+            {"test": {"number_of_steps": 50}, "material": MOHR_COULOMB}
+        )
+        runner = TriaxialSeriesRunner(
+            spec.test_inputs,
+            spec.material_inputs,
+            [50.0, 100.0, 200.0],
+            logger=lambda msg, level: None,
+            workers=1,
+            execution_mode=MATERIAL_POINT,
+        )
+
+        series = runner.run()
+
+        self.assertEqual(series.errors, [None, None, None])
+        self.assertAlmostEqual(series.envelope.cohesion, 10.0, places=3)
+        self.assertAlmostEqual(series.envelope.friction_angle, 30.0, places=3)
+        np.testing.assert_allclose(series.failure_stresses()[1], [-50, -100, -200])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            series_file = series.write(Path(tmp))
+            with open(series_file) as f:
+                written = json.load(f)
+        self.assertEqual(series_file.name, SERIES_FILE_NAME)
+        self.assertAlmostEqual(written["envelope"]["cohesion"], 10.0, places=3)
+        self.assertEqual(
+            [run["cell_pressure"] for run in written["runs"]], [50.0, 100.0, 200.0]
+        )
+
+    def test_main_model_runs_the_current_triaxial_inputs(self):
+        model = MainModel(logger=lambda msg, level: None, execution_mode=MATERIAL_POINT)
+        model.set_material_type("mohr_coulomb")
+        manager = model.get_material_input_manager()
+        for name, value in MOHR_COULOMB["parameters"].items():
+            manager.update_material_parameter_of_current_type(name, value)
+        model.get_soil_test_input_manager().get_triaxial_inputs().number_of_steps = 50
+
+        series = model.run_triaxial_series([50.0, 200.0], workers=1)
+
+        self.assertEqual(len(series.results), 2)
+        self.assertAlmostEqual(series.envelope.friction_angle, 30.0, places=3)
+        self.assertEqual(
+            model.get_soil_test_input_manager()
+            .get_triaxial_inputs()
+            .initial_effective_cell_pressure,
+            100.0,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import contextlib
+import io
+import unittest
+
+from kratos_element_test.view import ui_logger
+
+
+class FakeTextWidget:
+    """
+    Stands in for the Tk text widget of the log viewer, so the logger can be
+    tested without a display. Callbacks scheduled with `after` run when
+    `run_scheduled` is called.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.scheduled = []
+
+    def tag_configure(self, tag, **options):
+        pass
+
+    def after(self, delay_in_ms, callback, *args):
+        self.scheduled.append((callback, args))
+
+    def run_scheduled(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for callback, args in scheduled:
+            callback(*args)
+
+    def winfo_exists(self):
+        return True
+
+    def config(self, **options):
+        pass
+
+    def insert(self, index, text, tag):
+        self.lines.extend(text.splitlines())
+
+    def index(self, index):
+        # Like Tk, "end-1c" is on the empty line after the last newline
+        return f"{len(self.lines) + 1}.0"
+
+    def delete(self, first, last):
+        if last == "end":
+            self.lines.clear()
+        else:
+            del self.lines[: int(last.split(".")[0]) - 1]
+
+    def see(self, index):
+        pass
+
+
+class UILoggerTest(unittest.TestCase):
+    def setUp(self):
+        self.widget = FakeTextWidget()
+        ui_logger.init_log_widget(self.widget)
+        self.addCleanup(setattr, ui_logger, "_log_widget", None)
+        self.addCleanup(ui_logger.set_log_level, "info")
+        self.addCleanup(ui_logger.clear_log)
+
+    def test_messages_are_shown_with_their_prefix_when_drained(self):
+        ui_logger.log_message("started")
+        ui_logger.log_message("almost done", "warn")
+
+        self.assertEqual(self.widget.lines, [])
+        self.widget.run_scheduled()
+
+        self.assertEqual(self.widget.lines, ["[INFO] started", "[WARN] almost done"])
+        # The widget keeps draining
+        self.assertEqual(len(self.widget.scheduled), 1)
+
+    def test_messages_below_the_log_level_are_not_shown(self):
+        ui_logger.set_log_level("warn")
+
+        for level in ["debug", "info", "warn", "error"]:
+            ui_logger.log_message(level, level)
+        self.widget.run_scheduled()
+
+        self.assertEqual(self.widget.lines, ["[WARN] warn", "[ERROR] error"])
+
+    def test_debug_messages_are_shown_at_the_debug_level(self):
+        ui_logger.set_log_level("debug")
+
+        ui_logger.log_message("details", "debug")
+        self.widget.run_scheduled()
+
+        self.assertEqual(self.widget.lines, ["[DEBUG] details"])
+
+    def test_oldest_pending_messages_are_dropped_and_counted(self):
+        number_of_messages = ui_logger.MAX_PENDING_MESSAGES + 3
+        for index in range(number_of_messages):
+            ui_logger.log_message(f"message {index}")
+
+        messages = ui_logger._take_pending()
+
+        self.assertEqual(len(messages), ui_logger.MAX_PENDING_MESSAGES + 1)
+        self.assertEqual(messages[0], ("warn", "3 log message(s) were dropped."))
+        self.assertEqual(messages[1], ("info", "message 3"))
+        self.assertEqual(messages[-1], ("info", f"message {number_of_messages - 1}"))
+        # The count starts again once it was reported
+        ui_logger.log_message("next")
+        self.assertEqual(ui_logger._take_pending(), [("info", "next")])
+
+    def test_widget_keeps_the_last_lines_only(self):
+        number_of_messages = ui_logger.MAX_LOG_LINES + 10
+        for index in range(number_of_messages):
+            ui_logger.log_message(f"message {index}")
+        self.widget.run_scheduled()
+
+        self.assertEqual(len(self.widget.lines), ui_logger.MAX_LOG_LINES)
+        self.assertEqual(self.widget.lines[0], "[INFO] message 10")
+        self.assertEqual(
+            self.widget.lines[-1], f"[INFO] message {number_of_messages - 1}"
+        )
+
+    def test_replaced_widget_stops_draining(self):
+        ui_logger.init_log_widget(FakeTextWidget())
+
+        ui_logger.log_message("for the new widget")
+        self.widget.run_scheduled()
+
+        self.assertEqual(self.widget.lines, [])
+        self.assertEqual(self.widget.scheduled, [])
+
+    def test_messages_are_printed_without_a_widget(self):
+        ui_logger._log_widget = None
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            ui_logger.log_message("no widget", "error")
+            ui_logger.log_message("hidden", "debug")
+
+        self.assertEqual(output.getvalue(), "ERROR: no widget\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from kratos_element_test.model.models import TriaxialAndShearSimulationInputs
+from kratos_element_test.model.pipeline.simulation_pool import (
+    run_simulation_in_worker,
+)
+from kratos_element_test.model.pipeline.warm_worker import WarmWorker
+from kratos_element_test.model.test.input_factories import (
+    linear_elastic_inputs,
+)
+
+
+class WarmWorkerTest(unittest.TestCase):
+    def setUp(self):
+        self.messages = []
+        self.worker = WarmWorker(
+            logger=lambda msg, level: self.messages.append((msg, level)), max_runs=1
+        )
+
+    def tearDown(self):
+        self.worker.shutdown()
+
+    def test_results_match_runs_in_this_process(self):
+        test_inputs = TriaxialAndShearSimulationInputs(
+            test_type="triaxial", number_of_steps=10
+        )
+
+        results = self.worker.run(test_inputs, linear_elastic_inputs())
+
+        expected = run_simulation_in_worker(test_inputs, linear_elastic_inputs())
+        np.testing.assert_array_almost_equal(results["sigma1"], expected["sigma1"])
+        np.testing.assert_array_almost_equal(
+            results["yy_strain"], expected["yy_strain"]
+        )
+
+    def test_worker_is_recycled_after_max_runs(self):
+        test_inputs = TriaxialAndShearSimulationInputs(
+            test_type="triaxial", number_of_steps=10
+        )
+        first_pid = self.worker.pid
+
+        self.worker.run(test_inputs, linear_elastic_inputs())
+
+        self.assertNotEqual(self.worker.pid, first_pid)
+        self.assertTrue(any("Restarting" in msg for msg, _ in self.messages))
+
+    def test_failures_are_raised_and_the_worker_stays_usable(self):
+        with self.assertRaises(RuntimeError):
+            self.worker.run(
+                TriaxialAndShearSimulationInputs(test_type="unknown"),
+                linear_elastic_inputs(),
+            )
+
+        results = self.worker.run(
+            TriaxialAndShearSimulationInputs(test_type="triaxial", number_of_steps=10),
+            linear_elastic_inputs(),
+        )
+        self.assertEqual(len(results["sigma1"]), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
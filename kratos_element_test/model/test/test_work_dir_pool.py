@@ -0,0 +1,89 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+)
+from kratos_element_test.model.models import TriaxialAndShearSimulationInputs
+from kratos_element_test.model.pipeline.run_simulation import RunSimulation
+from kratos_element_test.model.pipeline.work_dir_pool import WorkDirPool
+
+
+class WorkDirPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.base_directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.base_directory, ignore_errors=True)
+        self.pool = WorkDirPool(self.base_directory, size=2)
+        self.addCleanup(self.pool.shutdown)
+
+    def test_directories_are_created_up_front(self):
+        self.assertEqual(self.pool.number_of_free_directories, 2)
+        self.assertEqual(len(list(self.base_directory.iterdir())), 2)
+
+    def test_released_directories_are_emptied_and_reused(self):
+        directory = self.pool.acquire()
+        (directory / "mesh.mdpa").write_text("mesh")
+        (directory / "gid_output").mkdir()
+        (directory / "gid_output" / "output.post.res").write_text("results")
+
+        self.pool.release(directory)
+        self.pool.wait_for_cleanup()
+
+        self.assertEqual(self.pool.number_of_free_directories, 2)
+        self.assertEqual(list(directory.iterdir()), [])
+        self.assertIn(directory, [self.pool.acquire(), self.pool.acquire()])
+
+    def test_new_directories_are_created_when_all_are_in_use(self):
+        directories = {self.pool.acquire() for _ in range(3)}
+
+        self.assertEqual(len(directories), 3)
+        self.assertTrue(all(d.is_dir() for d in directories))
+
+    def test_detached_directories_survive_the_pool(self):
+        directory = self.pool.acquire()
+        (directory / "mesh.mdpa").write_text("mesh")
+
+        self.pool.detach(directory)
+        self.pool.shutdown()
+
+        self.assertEqual(list(self.base_directory.iterdir()), [directory])
+        self.assertEqual((directory / "mesh.mdpa").read_text(), "mesh")
+
+    def test_shut_down_pool_hands_out_no_directories(self):
+        self.pool.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self.pool.acquire()
+
+
+class RunSimulationWorkDirTest(unittest.TestCase):
+    def test_run_returns_its_directory_to_the_pool(self):
+        with WorkDirPool(size=1) as pool:
+            material_inputs = LinearElasticMaterialInputs()
+            material_inputs.user_defined_parameters["YOUNG_MODULUS"].value = 1e4
+            material_inputs.user_defined_parameters["POISSON_RATIO"].value = 0.3
+            sim = RunSimulation(
+                test_inputs=TriaxialAndShearSimulationInputs(
+                    test_type="triaxial", number_of_steps=5
+                ),
+                material_inputs=material_inputs,
+                logger=lambda msg, level: None,
+                work_dir_pool=pool,
+            )
+            work_dir = sim.tmp_dir
+            self.assertEqual(pool.number_of_free_directories, 0)
+
+            sim.run()
+            self.assertTrue((work_dir / "mesh.mdpa").exists())
+            results = sim.post_process_results()
+            pool.wait_for_cleanup()
+
+            self.assertEqual(len(results["sigma1"]), 5)
+            self.assertEqual(pool.number_of_free_directories, 1)
+            self.assertEqual(list(work_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import json
+import math
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from kratos_element_test.model.job_spec import (
+    build_material_inputs,
+    build_test_inputs,
+)
+from kratos_element_test.model.material_input_data_models import (
+    LinearElasticMaterialInputs,
+    MohrCoulombMaterialInputs,
+    UDSMMaterialInputs,
+)
+from kratos_element_test.model.models import TriaxialAndShearSimulationInputs
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+
+@dataclass
+class FailureEnvelope:
+    """
+    The Mohr-Coulomb failure envelope τ = c' + σ' tan(φ') fitted to a series
+    of Mohr circles. `residual` is the root mean square distance between the
+    circles and the envelope in kN/m².
+    """
+
+    cohesion: float
+    friction_angle: float
+    residual: float
+    number_of_circles: int
+
+
+@dataclass
+class TriaxialSeriesSpec:
+    test_inputs: TriaxialAndShearSimulationInputs
+    material_inputs: (
+        LinearElasticMaterialInputs | MohrCoulombMaterialInputs | UDSMMaterialInputs
+    )
+    cell_pressures: List[float] = field(default_factory=list)
+    output_directory: Path | None = None
+
+
+def fit_failure_envelope(
+    sigma_1: Sequence[float], sigma_3: Sequence[float]
+) -> FailureEnvelope:
+    """
+    Fits c' and φ' to the Mohr circles of the principal stresses at failure
+    (compression negative, as in the simulation results) with a least-squares
+    fit over all circles at once. A circle with centre s and radius t touches
+    the envelope when t = s sin(φ') + c' cos(φ'), which is linear in s.
+    """
+    sigma_1 = np.asarray(sigma_1, dtype=float)
+    sigma_3 = np.asarray(sigma_3, dtype=float)
+    if sigma_1.shape != sigma_3.shape or sigma_1.ndim != 1:
+        raise ValueError("Every Mohr circle needs both σ₁ and σ₃.")
+
+    centres = -0.5 * (sigma_1 + sigma_3)
+    radii = 0.5 * np.abs(sigma_1 - sigma_3)
+    if len(np.unique(centres)) < 2:
+        raise ValueError(
+            "Fitting a failure envelope needs at least two Mohr circles with "
+            "different centres."
+        )
+
+    design = np.column_stack((centres, np.ones_like(centres)))
+    (sin_phi, c_cos_phi), *_ = np.linalg.lstsq(design, radii, rcond=None)
+    if not 0.0 <= sin_phi < 1.0:
+        raise ValueError(
+            "The Mohr circles do not follow a Mohr-Coulomb failure envelope."
+        )
+
+    # s sin(φ') + c' cos(φ') is the distance between the centre and the envelope
+    cos_phi = math.sqrt(1.0 - sin_phi**2)
+    residual = float(np.sqrt(np.mean((design @ (sin_phi, c_cos_phi) - radii) ** 2)))
+    return FailureEnvelope(
+        cohesion=float(c_cos_phi / cos_phi),
+        friction_angle=math.degrees(math.asin(sin_phi)),
+        residual=residual,
+        number_of_circles=len(centres),
+    )
+
+
+def series_test_inputs(
+    test_inputs: TriaxialAndShearSimulationInputs, cell_pressures: Sequence[float]
+) -> List[TriaxialAndShearSimulationInputs]:
+    """
+    Returns the inputs of a triaxial test for each of the cell pressures.
+    """
+    if test_inputs.test_type != "triaxial":
+        raise ValueError(
+            f"A triaxial series needs triaxial test inputs, but got {test_inputs.test_type}."
+        )
+    if len(cell_pressures) < 2:
+        raise ValueError("A triaxial series needs at least two cell pressures.")
+    if len(set(cell_pressures)) != len(cell_pressures):
+        raise ValueError("The cell pressures of a triaxial series must differ.")
+    return [
+        replace(test_inputs, initial_effective_cell_pressure=float(pressure))
+        for pressure in cell_pressures
+    ]
+
+
+def load_triaxial_series_spec(spec_path: Path) -> TriaxialSeriesSpec:
+    """
+    Reads a triaxial series specification from a JSON or TOML file. It holds
+    a ``test`` and ``material`` table in job spec form, the
+    ``cell_pressures`` to shear the soil at and an optional
+    ``output_directory``.
+    """
+    spec_path = Path(spec_path)
+    if spec_path.suffix.lower() == ".toml":
+        if tomllib is None:
+            raise RuntimeError(
+                "Reading TOML series specs requires Python 3.11 or newer."
+            )
+        with open(spec_path, "rb") as f:
+            raw_spec = tomllib.load(f)
+    else:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            raw_spec = json.load(f)
+
+    spec = parse_triaxial_series_spec(raw_spec)
+    if spec.output_directory is not None:
+        spec.output_directory = spec_path.parent / spec.output_directory
+    return spec
+
+
+def parse_triaxial_series_spec(raw_spec: Dict) -> TriaxialSeriesSpec:
+    if not isinstance(raw_spec, dict) or "material" not in raw_spec:
+        raise ValueError("A triaxial series spec needs a 'material' table.")
+    try:
+        test_inputs = build_test_inputs(
+            {"test_type": "triaxial", **raw_spec.get("test", {})}
+        )
+        material_inputs = build_material_inputs(raw_spec["material"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid triaxial series spec: {e}") from e
+
+    output_directory: Optional[str] = raw_spec.get("output_directory")
+    return TriaxialSeriesSpec(
+        test_inputs=test_inputs,
+        material_inputs=material_inputs,
+        cell_pressures=[float(p) for p in raw_spec.get("cell_pressures", [])],
+        output_directory=Path(output_directory) if output_directory else None,
+    )
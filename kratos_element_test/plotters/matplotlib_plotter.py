@@ -24,6 +24,7 @@ from kratos_element_test.plotters.plotter_labels import (
     TITLE_DIFF_PRINCIPAL_SIGMA_VS_STRAIN,
     TITLE_VOL_VS_VERT_STRAIN,
     TITLE_MOHR,
+    TITLE_MOHR_SERIES,
     TITLE_P_VS_Q,
     TITLE_SHEAR_VS_STRAIN,
     TITLE_VERTICAL_STRAIN_VS_TIME,
@@ -31,16 +32,25 @@ from kratos_element_test.plotters.plotter_labels import (
     TITLE_VERTICAL_STRESS_VS_HORIZONTAL_STRESS,
     LEGEND_MC,
     LEGEND_MC_FAILURE,
+    LEGEND_FITTED_FAILURE,
+    LEGEND_CELL_PRESSURE,
 )
 from kratos_element_test.plotters.lab_result_overlay_registry import OVERLAYS_BY_TEST
 
 
+def _with_origin(values) -> np.ndarray:
+    """
+    Returns a new array with 0.0 in front of the values, which are not modified.
+    """
+    return np.concatenate(([0.0], np.asarray(values, dtype=float)))
+
+
 class MatplotlibPlotter:
     def __init__(self, axes, logger=None):
         self._log = logger or _fallback_log
         self.axes = list(axes or [])
 
-    def _clear(self):
+    def clear(self):
         for ax in self.axes:
             try:
                 ax.clear()
@@ -96,7 +106,7 @@ class MatplotlibPlotter:
     def plot_experimental_only(
         self, test_type: str, experimental_results: Dict[str, List[float]]
     ) -> None:
-        self._clear()
+        self.clear()
 
         specs = OVERLAYS_BY_TEST.get(test_type, ())
         if not specs or not experimental_results:
@@ -144,10 +154,10 @@ class MatplotlibPlotter:
         phi=None,
         experimental_results: Optional[Dict[str, List[float]]] = None,
     ):
-        self._clear()
+        self.clear()
         # 0: |σ1-σ3| vs εyy
         self.plot_delta_sigma_triaxial(
-            self.axes[0], yy, np.abs(np.array(sigma1) - np.array(sigma3))
+            self.axes[0], yy, np.abs(np.asarray(sigma1) - np.asarray(sigma3))
         )
         # 1: εv vs εyy
         self.plot_volumetric_vertical_strain_triaxial(self.axes[1], yy, vol)
@@ -175,7 +185,7 @@ class MatplotlibPlotter:
         phi=None,
         experimental_results: Optional[Dict[str, List[float]]] = None,
     ):
-        self._clear()
+        self.clear()
         # 0: τ vs γ
         self.plot_strain_stress_direct_shear(self.axes[0], gamma_xy, tau_xy)
         # 1: σ1 vs σ3
@@ -204,7 +214,7 @@ class MatplotlibPlotter:
         phi=None,
         experimental_results: Optional[Dict[str, List[float]]] = None,
     ):
-        self._clear()
+        self.clear()
         # 0: σýy vs εyy
         self.plot_vertical_stress_vs_vertical_strain_crs(
             self.axes[0], yy_strain, sigma_yy
@@ -289,10 +299,7 @@ class MatplotlibPlotter:
         ax.plot(sigma, tau, label="Kratos Simulation", color="blue")
 
         if cohesion is not None and friction_angle is not None:
-            phi_rad = np.radians(friction_angle)
-            x_line = np.linspace(0, sigma_1, 200)
-            y_line = x_line * np.tan(phi_rad) - cohesion
-            ax.plot(x_line, -y_line, "r--", label=LEGEND_MC_FAILURE)
+            self._plot_failure_envelope(ax, sigma_1, cohesion, friction_angle)
             ax.legend(loc="upper left")
 
         ax.set_title(TITLE_MOHR)
@@ -304,6 +311,88 @@ class MatplotlibPlotter:
         ax.set_ylim(bottom=0, top=-0.6 * np.max(sigma_1))
         ax.minorticks_on()
 
+    def _plot_failure_envelope(
+        self,
+        ax,
+        sigma_end,
+        cohesion,
+        friction_angle,
+        style="r--",
+        label=LEGEND_MC_FAILURE,
+    ):
+        phi_rad = np.radians(friction_angle)
+        x_line = np.linspace(0, sigma_end, 200)
+        y_line = x_line * np.tan(phi_rad) - cohesion
+        ax.plot(x_line, -y_line, style, label=label)
+
+    def triaxial_series(
+        self,
+        sigma_1,
+        sigma_3,
+        fitted_cohesion=None,
+        fitted_friction_angle=None,
+        cohesion=None,
+        phi=None,
+    ):
+        self.clear()
+        # 0: Mohr's Circles of all cell pressures with the fitted envelope
+        self.plot_mohr_circles_triaxial_series(
+            self.axes[0],
+            sigma_1,
+            sigma_3,
+            fitted_cohesion,
+            fitted_friction_angle,
+            cohesion,
+            phi,
+        )
+
+    def plot_mohr_circles_triaxial_series(
+        self,
+        ax,
+        sigma_1,
+        sigma_3,
+        fitted_cohesion=None,
+        fitted_friction_angle=None,
+        cohesion=None,
+        friction_angle=None,
+    ):
+        sigma_1 = np.asarray(sigma_1, dtype=float)
+        sigma_3 = np.asarray(sigma_3, dtype=float)
+        theta = np.linspace(0, np.pi, 200)
+        for s1, s3 in zip(sigma_1, sigma_3):
+            center = (s1 + s3) / 2
+            radius = (s1 - s3) / 2
+            ax.plot(
+                center + radius * np.cos(theta),
+                -radius * np.sin(theta),
+                label=LEGEND_CELL_PRESSURE.format(cell_pressure=abs(s3)),
+            )
+
+        sigma_end = sigma_1[np.argmax(np.abs(sigma_1))]
+        if cohesion is not None and friction_angle is not None:
+            self._plot_failure_envelope(ax, sigma_end, cohesion, friction_angle)
+        if fitted_cohesion is not None and fitted_friction_angle is not None:
+            self._plot_failure_envelope(
+                ax,
+                sigma_end,
+                fitted_cohesion,
+                fitted_friction_angle,
+                style="k-.",
+                label=LEGEND_FITTED_FAILURE.format(
+                    cohesion=fitted_cohesion, friction_angle=fitted_friction_angle
+                ),
+            )
+        ax.legend(loc="upper left")
+
+        ax.set_title(TITLE_MOHR_SERIES)
+        ax.set_xlabel(EFFECTIVE_STRESS_LABEL)
+        ax.set_ylabel(MOBILIZED_SHEAR_STRESS_LABEL)
+        ax.grid(True)
+        ax.invert_xaxis()
+        ax.set_xlim(left=0, right=1.2 * sigma_end)
+        ax.set_ylim(bottom=0, top=-0.6 * sigma_end)
+        ax.minorticks_on()
+
     def plot_p_q_triaxial(self, ax, p_list, q_list):
         ax.plot(p_list, q_list, "-", color="blue", label="Kratos Simulation")
         ax.set_title(TITLE_P_VS_Q)
@@ -334,7 +423,7 @@ class MatplotlibPlotter:
         ax.minorticks_on()
 
     def plot_strain_stress_direct_shear(self, ax, shear_strain_xy, shear_stress_xy):
-        gamma_xy = 2 * np.array(shear_strain_xy)
+        gamma_xy = 2 * np.asarray(shear_strain_xy)
         ax.plot(
             np.abs(gamma_xy),
             np.abs(shear_stress_xy),
@@ -405,11 +494,9 @@ class MatplotlibPlotter:
         ax.minorticks_on()
 
     def plot_vertical_stress_vs_vertical_strain_crs(self, ax, yy_strain, sigma_yy):
-        yy_strain.insert(0, 0.0)
-        sigma_yy.insert(0, 0.0)
         ax.plot(
-            yy_strain,
-            sigma_yy,
+            _with_origin(yy_strain),
+            _with_origin(sigma_yy),
             "-",
             color="blue",
             label="Kratos Simulation",
@@ -424,10 +511,9 @@ class MatplotlibPlotter:
         ax.minorticks_on()
 
     def plot_vertical_stress_vs_horizontal_stress_crs(self, ax, sigma_xx, sigma_yy):
-        sigma_xx.insert(0, 0.0)
         ax.plot(
-            sigma_xx,
-            sigma_yy,
+            _with_origin(sigma_xx),
+            _with_origin(sigma_yy),
             "-",
             color="blue",
             label="Kratos Simulation",
@@ -442,9 +528,13 @@ class MatplotlibPlotter:
         ax.minorticks_on()
 
     def plot_p_q_crs(self, ax, p_list, q_list):
-        p_list.insert(0, 0.0)
-        q_list.insert(0, 0.0)
-        ax.plot(p_list, q_list, "-", color="blue", label="Kratos Simulation")
+        ax.plot(
+            _with_origin(p_list),
+            _with_origin(q_list),
+            "-",
+            color="blue",
+            label="Kratos Simulation",
+        )
         ax.set_title(TITLE_P_VS_Q)
         ax.set_xlabel(P_STRESS_LABEL)
         ax.set_ylabel(Q_STRESS_LABEL)
@@ -503,10 +593,9 @@ class MatplotlibPlotter:
         ax.minorticks_on()
 
     def plot_vertical_strain_vs_time_crs(self, ax, yy_strain, time_steps):
-        time_steps.insert(0, 0.0)
         ax.plot(
-            time_steps,
-            yy_strain,
+            _with_origin(time_steps),
+            _with_origin(yy_strain),
             "-",
             color="blue",
             label="Kratos Simulation",
@@ -25,6 +25,7 @@ TITLE_SIGMA1_VS_SIGMA3 = "σ₁ vs σ₃"
 TITLE_DIFF_PRINCIPAL_SIGMA_VS_STRAIN = "|σ₁ - σ₃| vs εᵧᵧ"
 TITLE_VOL_VS_VERT_STRAIN = "εᵥ vs εᵧᵧ"
 TITLE_MOHR = "Mohr's Circle"
+TITLE_MOHR_SERIES = "Mohr's Circles at Failure"
 TITLE_P_VS_Q = "p' vs q"
 TITLE_SHEAR_VS_STRAIN = "τₓᵧ vs εₓᵧ"
 TITLE_VERTICAL_STRAIN_VS_TIME = "εᵧᵧ vs time"
@@ -35,3 +36,5 @@ TITLE_VERTICAL_STRESS_VS_HORIZONTAL_STRESS = "σ'ᵧᵧ vs σ'ₓₓ"
 # Legends
 LEGEND_MC = "Mohr's circle"
 LEGEND_MC_FAILURE = "Failure Criterion: τ = σ' tan(φ°) + c'"
+LEGEND_FITTED_FAILURE = "Fitted: c' = {cohesion:.3g} kN/m², φ' = {friction_angle:.3g}°"
+LEGEND_CELL_PRESSURE = "σ'₃ = {cell_pressure:.3g} kN/m²"
@@ -0,0 +1,291 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from kratos_element_test.plotters.matplotlib_plotter import MatplotlibPlotter
+
+# The result channels that are passed to the plot method of each test type
+PLOT_CHANNELS = {
+    "triaxial": (
+        "yy_strain",
+        "vol_strain",
+        "sigma1",
+        "sigma3",
+        "mean_stress",
+        "von_mises",
+        "cohesion",
+        "phi",
+    ),
+    "direct_shear": (
+        "shear_strain_xy",
+        "shear_xy",
+        "sigma1",
+        "sigma3",
+        "mean_stress",
+        "von_mises",
+        "cohesion",
+        "phi",
+    ),
+    "crs": (
+        "yy_strain",
+        "time_steps",
+        "sigma_yy",
+        "sigma_xx",
+        "mean_stress",
+        "von_mises",
+        "sigma1",
+        "sigma3",
+        "cohesion",
+        "phi",
+    ),
+}
+
+# While results stream in, axis limits grow with this fraction of the data
+# range at once, so that most updates leave the limits as they are
+STREAMING_HEADROOM = 0.25
+
+
+def _ignore(*args, **kwargs):
+    return None
+
+
+class _RecordingAxes:
+    """
+    Stands in for an axes while a plot method of the MatplotlibPlotter runs.
+    It records the lines that the method would plot and the calls that set
+    the limits, and ignores the styling (titles, labels, grid, ticks and
+    legend).
+    """
+
+    def __init__(self, ax):
+        self._ax = ax
+        self.lines: List[Tuple[np.ndarray, np.ndarray, Optional[str]]] = []
+        self.limit_calls: List[Tuple[str, tuple, dict]] = []
+
+    def plot(self, x, y, *args, label=None, **kwargs):
+        self.lines.append(
+            (np.asarray(x, dtype=float), np.asarray(y, dtype=float), label)
+        )
+        return []
+
+    def set_xlim(self, *args, **kwargs):
+        self.limit_calls.append(("set_xlim", args, kwargs))
+
+    def set_ylim(self, *args, **kwargs):
+        self.limit_calls.append(("set_ylim", args, kwargs))
+
+    def invert_xaxis(self):
+        self.limit_calls.append(("invert_xaxis", (), {}))
+
+    def invert_yaxis(self):
+        self.limit_calls.append(("invert_yaxis", (), {}))
+
+    def replay_limits(self, ax) -> None:
+        """
+        Sets the limits of `ax` the way the plot method sets them on an axes
+        that was just cleared: autoscaled to the data and not inverted.
+        """
+        ax.set_autoscale_on(True)
+        ax.relim()
+        ax.autoscale_view()
+        if ax.xaxis_inverted():
+            ax.invert_xaxis()
+        if ax.yaxis_inverted():
+            ax.invert_yaxis()
+        for name, args, kwargs in self.limit_calls:
+            getattr(ax, name)(*args, **kwargs)
+
+    def get_legend_handles_labels(self):
+        return self._ax.get_legend_handles_labels()
+
+    def __getattr__(self, name):
+        return _ignore
+
+
+def _grown_limits(current, target, headroom):
+    """
+    Returns the current limits when the target limits fit inside them, and
+    otherwise the target limits, widened by the headroom on the sides where
+    they exceed the current limits. The orientation of the axis is kept.
+    """
+    low, high = sorted(current)
+    target_low, target_high = sorted(target)
+    if target_low >= low and target_high <= high:
+        return current
+    width = target_high - target_low
+    if target_low < low:
+        low = target_low - headroom * width
+    if target_high > high:
+        high = target_high + headroom * width
+    return (high, low) if current[0] > current[1] else (low, high)
+
+
+class RetainedPlotter:
+    """
+    Plots the results of a test type once with the MatplotlibPlotter, and
+    afterwards updates the data of its lines in place, including the Mohr
+    circles, failure envelopes and lab result overlays. The same plot method
+    computes the new data and limits, so both paths show the same plots.
+
+    Streaming updates (e.g. the partial results of a running simulation) only
+    redraw the lines that changed, by blitting them onto the cached rest of
+    the figure. The whole figure is redrawn when an axis limit has to grow.
+    The final update draws all lines as normal artists again.
+    """
+
+    def __init__(self, axes, logger=None):
+        self.axes = list(axes or [])
+        self._plotter = MatplotlibPlotter(self.axes, logger=logger)
+        self._test_type: Optional[str] = None
+        self._animated: Set = set()
+        self._needs_full_draw = True
+        self._background = None
+        self._connected_canvas = None
+
+    @property
+    def _figure(self):
+        return self.axes[0].figure if self.axes else None
+
+    def clear(self) -> None:
+        self._plotter.clear()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._test_type = None
+        self._animated = set()
+        self._background = None
+        self._needs_full_draw = True
+
+    def plot_experimental_only(
+        self, test_type: str, experimental_results: Dict[str, List[float]]
+    ) -> None:
+        self._reset()
+        self._plotter.plot_experimental_only(test_type, experimental_results)
+
+    def plot(
+        self,
+        test_type: str,
+        results,
+        experimental_results: Optional[Dict[str, List[float]]] = None,
+        streaming: bool = False,
+    ) -> None:
+        """
+        Plots the results of the test type. Lines that exist already are
+        updated in place; the plots are only rebuilt when the test type or
+        the set of lines changes (e.g. when lab results are imported).
+        """
+        arguments = [results[channel] for channel in PLOT_CHANNELS[test_type]]
+        plot_method = getattr(self._plotter, test_type)
+
+        recorded = None
+        if test_type == self._test_type:
+            recorded = self._record(plot_method, arguments, experimental_results)
+        if recorded is None or not self._matches(recorded):
+            self._reset()
+            plot_method(*arguments, experimental_results=experimental_results)
+            self._test_type = test_type
+            return
+
+        changed = self._update_lines(recorded)
+        limits_changed = self._update_limits(recorded, streaming)
+        if not streaming:
+            for line in self._animated:
+                line.set_animated(False)
+            self._animated = set()
+            self._needs_full_draw = True
+            return
+
+        newly_animated = changed - self._animated
+        for line in newly_animated:
+            line.set_animated(True)
+        self._animated |= newly_animated
+        self._needs_full_draw = (
+            self._needs_full_draw or limits_changed or bool(newly_animated)
+        )
+
+    def render(self) -> None:
+        """
+        Shows the plotted results on the canvas of the figure.
+        """
+        figure = self._figure
+        if figure is None:
+            return
+        canvas = figure.canvas
+        if canvas is not self._connected_canvas:
+            canvas.mpl_connect("draw_event", self._on_draw)
+            self._connected_canvas = canvas
+            self._needs_full_draw = True
+
+        if self._needs_full_draw or self._background is None:
+            canvas.draw()
+            self._needs_full_draw = False
+            return
+
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(figure.bbox)
+
+    def _on_draw(self, event) -> None:
+        # Every full draw (also by the toolbar) leaves out the animated lines.
+        # The figure without them is kept to blit the lines onto.
+        if not self._animated:
+            self._background = None
+            return
+        self._background = event.canvas.copy_from_bbox(self._figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self) -> None:
+        for line in self._animated:
+            line.axes.draw_artist(line)
+
+    def _record(self, plot_method, arguments, experimental_results):
+        recording_axes = [_RecordingAxes(ax) for ax in self.axes]
+        self._plotter.axes = recording_axes
+        try:
+            plot_method(*arguments, experimental_results=experimental_results)
+        finally:
+            self._plotter.axes = self.axes
+        return recording_axes
+
+    def _matches(self, recorded) -> bool:
+        for ax, recording in zip(self.axes, recorded):
+            if len(ax.lines) != len(recording.lines):
+                return False
+            for line, (_, _, label) in zip(ax.lines, recording.lines):
+                if label is not None and line.get_label() != label:
+                    return False
+        return True
+
+    def _update_lines(self, recorded) -> Set:
+        changed = set()
+        for ax, recording in zip(self.axes, recorded):
+            for line, (x, y, _) in zip(ax.lines, recording.lines):
+                old_x, old_y = line.get_data()
+                if np.array_equal(old_x, x) and np.array_equal(old_y, y):
+                    continue
+                line.set_data(x, y)
+                changed.add(line)
+        return changed
+
+    def _update_limits(self, recorded, streaming: bool) -> bool:
+        limits_changed = False
+        for ax, recording in zip(self.axes, recorded):
+            old_limits = (ax.get_xlim(), ax.get_ylim())
+
+            recording.replay_limits(ax)
+
+            if streaming:
+                ax.set_xlim(
+                    _grown_limits(old_limits[0], ax.get_xlim(), STREAMING_HEADROOM),
+                    auto=None,
+                )
+                ax.set_ylim(
+                    _grown_limits(old_limits[1], ax.get_ylim(), STREAMING_HEADROOM),
+                    auto=None,
+                )
+            limits_changed |= (ax.get_xlim(), ax.get_ylim()) != old_limits
+        return limits_changed
@@ -0,0 +1,324 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from kratos_element_test.model.design_of_experiments import load_sweep_spec
+from kratos_element_test.model.job_spec import MATERIAL_TYPES, load_job_spec
+from kratos_element_test.model.models import (
+    EXECUTION_MODES,
+    FINITE_ELEMENT,
+    VALID_TEST_TYPES,
+)
+from kratos_element_test.model.pipeline.batch_runner import (
+    RESULT_FORMATS,
+    BatchRunner,
+)
+from kratos_element_test.model.pipeline.sweep_runner import SweepRunner
+from kratos_element_test.model.pipeline.triaxial_series_runner import (
+    TriaxialSeriesRunner,
+)
+from kratos_element_test.model.run_archive import RunArchive
+from kratos_element_test.model.triaxial_series import load_triaxial_series_spec
+
+# Runs between two progress messages of an export
+EXPORT_PROGRESS_INTERVAL = 50
+
+
+def _run_batch(args) -> int:
+    job_spec = load_job_spec(args.job_spec)
+    output_directory = args.output or job_spec.output_directory
+    if output_directory is None:
+        output_directory = Path(args.job_spec).with_suffix("")
+
+    manifest = BatchRunner(
+        job_spec,
+        Path(output_directory),
+        workers=args.workers,
+        execution_mode=args.mode,
+        force_finite_element=args.force_finite_element,
+        result_format=args.format,
+    ).run()
+    print(
+        f"Finished {manifest['number_of_runs']} run(s) with "
+        f"{manifest['number_of_failures']} failure(s). Results in: {output_directory}"
+    )
+    return 1 if manifest["number_of_failures"] else 0
+
+
+def _run_sweep(args) -> int:
+    spec = load_sweep_spec(args.sweep_spec)
+    output_directory = args.output or spec.output_directory
+    if output_directory is None:
+        output_directory = Path(args.sweep_spec).with_suffix("")
+
+    sweep = SweepRunner(
+        spec,
+        Path(output_directory),
+        workers=args.workers,
+        execution_mode=args.mode,
+        force_finite_element=args.force_finite_element,
+    ).run()
+    print(
+        f"Finished {sweep['number_of_runs']} design point(s) with "
+        f"{sweep['number_of_failures']} failure(s). Results in: {output_directory}"
+    )
+    return 1 if sweep["number_of_failures"] else 0
+
+
+def _run_series(args) -> int:
+    spec = load_triaxial_series_spec(args.series_spec)
+    output_directory = args.output or spec.output_directory
+    if output_directory is None:
+        output_directory = Path(args.series_spec).with_suffix("")
+
+    series = TriaxialSeriesRunner(
+        spec.test_inputs,
+        spec.material_inputs,
+        args.cell_pressures or spec.cell_pressures,
+        workers=args.workers,
+        execution_mode=args.mode,
+        force_finite_element=args.force_finite_element,
+    ).run()
+    series.write(Path(output_directory))
+    if args.plot is not None:
+        _plot_series(series, args.plot)
+
+    if series.envelope is None:
+        print(f"No failure envelope fitted: {series.envelope_error}")
+        return 1
+    print(
+        f"Fitted c' = {series.envelope.cohesion:.4g} kN/m² and "
+        f"phi' = {series.envelope.friction_angle:.4g} deg to "
+        f"{series.envelope.number_of_circles} Mohr circles. "
+        f"Results in: {output_directory}"
+    )
+    return 1 if any(error is not None for error in series.errors) else 0
+
+
+def _plot_series(series, plot_file: Path) -> None:
+    # Imported here, so the other commands do not need matplotlib
+    from matplotlib.figure import Figure
+
+    from kratos_element_test.plotters.matplotlib_plotter import MatplotlibPlotter
+
+    sigma_1, sigma_3 = series.failure_stresses()
+    if len(sigma_1) == 0:
+        return
+    first_results = next(r for r in series.results if r is not None)
+    figure = Figure(figsize=(8, 6), dpi=100)
+    envelope = series.envelope
+    MatplotlibPlotter([figure.add_subplot()]).triaxial_series(
+        sigma_1,
+        sigma_3,
+        envelope.cohesion if envelope else None,
+        envelope.friction_angle if envelope else None,
+        first_results["cohesion"],
+        first_results["phi"],
+    )
+    figure.savefig(plot_file)
+
+
+def _export(args) -> int:
+    # Imported here, so the other commands do not need openpyxl
+    from kratos_element_test.api import export_excel
+
+    sources = list(args.sources)
+    if args.archive is not None:
+        archive = RunArchive(Path(args.archive) if args.archive else None)
+        sources.extend(
+            archive.find(
+                test_type=args.test_type,
+                material_type=args.material_type,
+                limit=args.limit,
+            )
+        )
+    if not sources:
+        print("Nothing to export: give result files, output directories or --archive.")
+        return 1
+
+    exported = export_excel(
+        sources,
+        args.output,
+        one_workbook_per_run=args.one_workbook_per_run,
+        workers=args.workers,
+        progress_callback=_print_export_progress,
+    )
+    print(f"Exported {len(exported)} workbook(s) to: {args.output}")
+    return 0
+
+
+def _print_export_progress(done: int, total: Optional[int]) -> None:
+    if done == total or done % EXPORT_PROGRESS_INTERVAL == 0:
+        print(f"Exported {done}/{total or '?'} run(s)...")
+
+
+def _add_run_arguments(
+    parser: argparse.ArgumentParser, default_workers: Optional[int] = 1
+) -> None:
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Directory for the results "
+        "(default: 'output_directory' from the spec, or a folder named after the spec).",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=default_workers,
+        help="Number of simulations to run concurrently, each in its own process "
+        f"(default: {default_workers or 'one per run'}).",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=EXECUTION_MODES,
+        default=FINITE_ELEMENT,
+        help="Run the finite element model of the test, or drive the constitutive "
+        "law of a single material point directly, which is much faster "
+        f"(default: {FINITE_ELEMENT}).",
+    )
+    parser.add_argument(
+        "--force-finite-element",
+        action="store_true",
+        help="Run the finite element model for linear elastic material as well, "
+        "instead of its analytical solution (e.g. to verify it).",
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kratos-element-test",
+        description="Run Kratos element tests without the graphical user interface.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run all element tests listed in a JSON or TOML job spec."
+    )
+    batch_parser.add_argument("job_spec", type=Path, help="Path to the job spec file.")
+    batch_parser.add_argument(
+        "--format",
+        choices=RESULT_FORMATS,
+        default="json",
+        help="File format of the results of each run; NPZ and Parquet files hold "
+        "the result arrays and can be read back memory-mapped (default: json).",
+    )
+    _add_run_arguments(batch_parser)
+    batch_parser.set_defaults(handler=_run_batch)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep",
+        help="Run all points of a full factorial, Latin hypercube or Sobol design "
+        "described in a JSON or TOML sweep spec.",
+    )
+    sweep_parser.add_argument(
+        "sweep_spec", type=Path, help="Path to the sweep spec file."
+    )
+    _add_run_arguments(sweep_parser)
+    sweep_parser.set_defaults(handler=_run_sweep)
+
+    series_parser = subparsers.add_parser(
+        "series",
+        help="Run a triaxial test at several cell pressures concurrently and fit "
+        "c' and phi' to the Mohr circles at failure.",
+    )
+    series_parser.add_argument(
+        "series_spec", type=Path, help="Path to the triaxial series spec file."
+    )
+    series_parser.add_argument(
+        "-p",
+        "--cell-pressures",
+        type=float,
+        nargs="+",
+        default=None,
+        help="Initial effective cell pressures in kN/m² "
+        "(default: 'cell_pressures' from the spec).",
+    )
+    series_parser.add_argument(
+        "--plot",
+        type=Path,
+        default=None,
+        help="Save the Mohr circles with the fitted failure envelope to this image.",
+    )
+    _add_run_arguments(series_parser, default_workers=None)
+    series_parser.set_defaults(handler=_run_series)
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Export the results of many runs to Excel: result files, batch or "
+        "sweep output directories and runs of the run archive.",
+    )
+    export_parser.add_argument(
+        "sources",
+        type=Path,
+        nargs="*",
+        help="Result files of batch runs, and batch or sweep output directories.",
+    )
+    export_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        required=True,
+        help="Excel workbook for all runs, or the directory for the workbooks "
+        "with --one-workbook-per-run.",
+    )
+    export_parser.add_argument(
+        "--one-workbook-per-run",
+        action="store_true",
+        help="Write every run to its own workbook, laid out like the export of "
+        "the user interface.",
+    )
+    export_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of workbooks to write concurrently, each in its own process, "
+        "with --one-workbook-per-run (default: 1).",
+    )
+    export_parser.add_argument(
+        "--archive",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DATABASE",
+        help="Export the runs of the run archive as well "
+        "(default database: the archive of the user interface).",
+    )
+    export_parser.add_argument(
+        "--test-type",
+        choices=VALID_TEST_TYPES,
+        default=None,
+        help="Only export archived runs of this test type.",
+    )
+    export_parser.add_argument(
+        "--material-type",
+        choices=MATERIAL_TYPES,
+        default=None,
+        help="Only export archived runs of this material type.",
+    )
+    export_parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Only export this many of the newest archived runs.",
+    )
+    export_parser.set_defaults(handler=_export)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,23 @@
 
 import os
 import sys
-from kratos_element_test.view.ui_menu import MainUI
+from kratos_element_test.view.splash_screen import SplashScreen
+from kratos_element_test.view.ui_utils import set_app_user_model_id
 
 
 def main():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(current_dir)
+    set_app_user_model_id()
     try:
-        ui = MainUI()
+        splash = SplashScreen()
+        try:
+            # Imported after the splash screen is shown, since loading takes a while
+            from kratos_element_test.view.ui_menu import MainUI
+
+            ui = MainUI()
+        finally:
+            splash.close()
         ui.create_menu()
     except ImportError as e:
         print(
@@ -5,7 +5,8 @@ from matplotlib import pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.gridspec import GridSpec
 
-from kratos_element_test.plotters.matplotlib_plotter import MatplotlibPlotter
+from kratos_element_test.model.phase_timer import PhaseTimer
+from kratos_element_test.plotters.retained_plotter import RetainedPlotter
 from kratos_element_test.view.ui_constants import TEST_NAME_TO_TYPE
 
 
@@ -18,6 +19,7 @@ class PlotViewer(ttk.Frame):
         self._canvas = None
         self._grid_spec = None
         self._figure = None
+        self.last_draw_timings = None
 
     def initialize(self, num_plots):
         self.clear()
@@ -32,7 +34,7 @@ class PlotViewer(ttk.Frame):
         self._axes = [
             self._figure.add_subplot(self._grid_spec[i]) for i in range(num_plots)
         ]
-        self._plotter = MatplotlibPlotter(self._axes, logger=None)
+        self._plotter = RetainedPlotter(self._axes, logger=None)
         self._canvas = FigureCanvasTkAgg(self._figure, master=self)
         self._canvas.draw()
         toolbar = NavigationToolbar2Tk(self._canvas, self)
@@ -54,7 +56,7 @@ class PlotViewer(ttk.Frame):
             return
 
         if self._plotter is not None:
-            self._plotter._clear()
+            self._plotter.clear()
         self._canvas.draw()
 
     def clear(self):
@@ -65,55 +67,34 @@ class PlotViewer(ttk.Frame):
         self._figure = None
         self._canvas = None
 
-    def draw(self):
+    def draw(self, results=None, streaming=False):
+        """
+        Plots the latest results, or the given results. With `streaming`,
+        the results are partial results of a running simulation, and only
+        the lines that changed are redrawn where possible.
+        """
+        timer = PhaseTimer()
+        with timer.phase("draw"):
+            self._draw(timer, results, streaming)
+        self.last_draw_timings = timer
+
+    def _draw(self, timer, results=None, streaming=False):
         test_type = TEST_NAME_TO_TYPE.get(self._result_controller.get_current_test())
         experimental = self._result_controller.get_experimental_results() or None
-        results = self._result_controller.get_latest_results() or None
+        if results is None:
+            results = self._result_controller.get_latest_results() or None
 
         if results is None and experimental is None:
             return
 
         if results is None and experimental is not None:
-            self._plotter.plot_experimental_only(test_type, experimental)
-            self._canvas.draw()
+            with timer.phase("plot"):
+                self._plotter.plot_experimental_only(test_type, experimental)
+            with timer.phase("render_canvas"):
+                self._canvas.draw()
             return
 
-        if test_type == "triaxial":
-            self._plotter.triaxial(
-                results["yy_strain"],
-                results["vol_strain"],
-                results["sigma1"],
-                results["sigma3"],
-                results["mean_stress"],
-                results["von_mises"],
-                results["cohesion"],
-                results["phi"],
-                experimental_results=experimental,
-            )
-        elif test_type == "direct_shear":
-            self._plotter.direct_shear(
-                results["shear_strain_xy"],
-                results["shear_xy"],
-                results["sigma1"],
-                results["sigma3"],
-                results["mean_stress"],
-                results["von_mises"],
-                results["cohesion"],
-                results["phi"],
-                experimental_results=experimental,
-            )
-        elif test_type == "crs":
-            self._plotter.crs(
-                results["yy_strain"],
-                results["time_steps"],
-                results["sigma_yy"],
-                results["sigma_xx"],
-                results["mean_stress"],
-                results["von_mises"],
-                results["sigma1"],
-                results["sigma3"],
-                results["cohesion"],
-                results["phi"],
-                experimental_results=experimental,
-            )
-        self._canvas.draw()
+        with timer.phase("plot"):
+            self._plotter.plot(test_type, results, experimental, streaming=streaming)
+        with timer.phase("render_canvas"):
+            self._plotter.render()
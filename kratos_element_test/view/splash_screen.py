@@ -0,0 +1,53 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import tkinter as tk
+
+from kratos_element_test.view.ui_constants import (
+    APP_TITLE,
+    APP_VERSION,
+    HELP_MENU_FONT,
+)
+from kratos_element_test.view.ui_utils import asset_path
+
+
+class SplashScreen:
+    """
+    Borderless window that is shown while the application starts. It only
+    uses tkinter, so it appears before the rest of the application is loaded.
+    """
+
+    def __init__(self):
+        self._root = tk.Tk()
+        self._root.overrideredirect(True)
+
+        frame = tk.Frame(self._root, bg="white", bd=1, relief="solid")
+        frame.pack(fill="both", expand=True)
+
+        try:
+            photo = tk.PhotoImage(master=self._root, file=asset_path("deltares.png"))
+            label = tk.Label(frame, image=photo, bg="white")
+            label.image = photo
+            label.pack(padx=40, pady=(30, 10))
+        except Exception:
+            pass
+
+        tk.Label(
+            frame, text=APP_TITLE, font=(HELP_MENU_FONT, 14, "bold"), bg="white"
+        ).pack(padx=40, pady=(10, 5))
+        tk.Label(frame, text=APP_VERSION, font=(HELP_MENU_FONT, 10), bg="white").pack()
+        tk.Label(frame, text="Loading...", font=(HELP_MENU_FONT, 10), bg="white").pack(
+            pady=(15, 30)
+        )
+
+        self._root.update_idletasks()
+        width = self._root.winfo_reqwidth()
+        height = self._root.winfo_reqheight()
+        x = (self._root.winfo_screenwidth() - width) // 2
+        y = (self._root.winfo_screenheight() - height) // 2
+        self._root.geometry(f"{width}x{height}+{x}+{y}")
+        self._root.update()
+
+    def close(self) -> None:
+        self._root.destroy()
@@ -0,0 +1,44 @@
+# ©Deltares 2026
+# This is a prototype version
+# Contact kratos@deltares.nl
+
+import tkinter as tk
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+
+from kratos_element_test.plotters.matplotlib_plotter import MatplotlibPlotter
+from kratos_element_test.view.ui_logger import log_message
+
+
+class TriaxialSeriesViewer(tk.Toplevel):
+    """
+    Shows the Mohr circles at failure of a triaxial series with the fitted
+    and the material failure envelopes.
+    """
+
+    def __init__(self, root, series):
+        super().__init__(root)
+        self.title("Triaxial Series")
+        self.geometry("800x600")
+
+        figure = Figure(figsize=(8, 6), dpi=100)
+        axes = figure.add_subplot()
+        sigma_1, sigma_3 = series.failure_stresses()
+        first_results = next(r for r in series.results if r is not None)
+        envelope = series.envelope
+        MatplotlibPlotter([axes], logger=log_message).triaxial_series(
+            sigma_1,
+            sigma_3,
+            envelope.cohesion if envelope else None,
+            envelope.friction_angle if envelope else None,
+            first_results["cohesion"],
+            first_results["phi"],
+        )
+
+        canvas = FigureCanvasTkAgg(figure, master=self)
+        canvas.draw()
+        toolbar = NavigationToolbar2Tk(canvas, self)
+        toolbar.update()
+        toolbar.pack(side="bottom", fill="x")
+        canvas.get_tk_widget().pack(fill="both", expand=True)
@@ -5,12 +5,15 @@
 import threading
 import tkinter as tk
 import traceback
-from tkinter import ttk, scrolledtext
+from tkinter import ttk, scrolledtext, simpledialog
 
+from kratos_element_test.model.models import CANCELLED, COMPLETED, TIMED_OUT
 from kratos_element_test.view.log_viewer import LogViewer
 from kratos_element_test.view.material_input_view import MaterialInputView
 from kratos_element_test.view.plot_viewer import PlotViewer
 from kratos_element_test.view.soil_test_input_view import SoilTestInputView
+from kratos_element_test.view.triaxial_series_viewer import TriaxialSeriesViewer
+from kratos_element_test.view.ui_constants import DEFAULT_SERIES_CELL_PRESSURES
 from kratos_element_test.view.ui_logger import log_message, clear_log
 
 
@@ -35,9 +38,47 @@ class GeotechTestUI(ttk.Frame):
     def _start_simulation_thread(self):
         if self.is_running:
             return
+        try:
+            self.material_input_view.validate()
+            self.soil_test_input_view.validate(self.controller.get_current_test_type())
+        except Exception:
+            log_message("An error occurred during simulation:", "error")
+            log_message(traceback.format_exc(), "error")
+            return
+
+        self.is_running = True
+        self._disable_gui()
+        self.cancel_button.config(state="normal")
+        log_message("Starting calculation... Please wait...", "info")
+        self.controller.start(self._report_progress, self._on_run_finished)
+
+    def _cancel_simulation(self):
+        log_message("Cancelling the calculation...", "warn")
+        self.cancel_button.config(state="disabled")
+        self.controller.cancel()
+
+    def _start_triaxial_series_thread(self):
+        if self.is_running:
+            return
+        answer = simpledialog.askstring(
+            "Triaxial Series",
+            "Initial effective cell pressures [kN/m²], separated by commas:",
+            initialvalue=DEFAULT_SERIES_CELL_PRESSURES,
+            parent=self.root,
+        )
+        if not answer:
+            return
+        try:
+            cell_pressures = [float(p) for p in answer.replace(";", ",").split(",")]
+        except ValueError:
+            log_message(f"Invalid cell pressures: {answer}", "error")
+            return
+
         self.is_running = True
         self._disable_gui()
-        threading.Thread(target=self._run_simulation, daemon=True).start()
+        threading.Thread(
+            target=self._run_triaxial_series, args=(cell_pressures,), daemon=True
+        ).start()
 
     def _init_frames(self):
         self.left_panel = ttk.Frame(self, width=555)
@@ -114,24 +155,69 @@ class GeotechTestUI(ttk.Frame):
         )
         self.run_button.pack(pady=5)
 
-    def _run_simulation(self):
-        try:
-            log_message("Starting calculation... Please wait...", "info")
-            self.root.update_idletasks()
+        self.series_button = ttk.Button(
+            self.button_frame,
+            text="Run Triaxial Series...",
+            command=self._start_triaxial_series_thread,
+        )
+        self.series_button.pack(pady=5)
 
-            self.material_input_view.validate()
-            self.soil_test_input_view.validate(self.controller.get_current_test_type())
+        self.cancel_button = ttk.Button(
+            self.button_frame,
+            text="Cancel",
+            command=self._cancel_simulation,
+            state="disabled",
+        )
+        self.cancel_button.pack(pady=5)
+
+        self.progress_label = ttk.Label(self.button_frame, text="")
+        self.progress_label.pack(pady=(0, 5))
 
-            success = self.controller.run()
+    def _report_progress(self, progress, partial_results):
+        # Called on the simulation thread, the widgets are updated on the main loop
+        self.root.after(0, lambda: self._show_progress(progress, partial_results))
 
-            if success:
+    def _show_progress(self, progress, partial_results):
+        self.progress_label.config(text=progress.describe())
+        try:
+            self.plot_frame.draw(partial_results, streaming=True)
+        except Exception:
+            log_message("Failed to plot the partial results:", "error")
+            log_message(traceback.format_exc(), "error")
+
+    def _on_run_finished(self, run):
+        # Called on the simulation thread, the widgets are updated on the main loop
+        self.root.after(0, lambda: self._finish_run(run))
+
+    def _finish_run(self, run):
+        try:
+            test_type = self.controller.get_current_test_type()
+            if run.state == COMPLETED:
                 self.plot_frame.draw()
-                test_type = self.controller.get_current_test_type()
                 log_message(f"{test_type} test completed successfully.", "info")
-
+            elif run.state in (CANCELLED, TIMED_OUT):
+                log_message(f"{test_type} test was stopped: {run.error}", "warn")
+            else:
+                log_message(f"Simulation failed: {run.error}", "error")
         except Exception:
             log_message("An error occurred during simulation:", "error")
             log_message(traceback.format_exc(), "error")
+        finally:
+            self._enable_gui()
+            self.is_running = False
+
+    def _run_triaxial_series(self, cell_pressures):
+        try:
+            log_message("Starting triaxial series... Please wait...", "info")
+            self.material_input_view.validate()
+
+            series = self.controller.run_triaxial_series(cell_pressures)
+            if series is not None:
+                self.root.after(0, lambda: TriaxialSeriesViewer(self.root, series))
+
+        except Exception:
+            log_message("An error occurred during the triaxial series:", "error")
+            log_message(traceback.format_exc(), "error")
         finally:
             self.root.after(0, self._enable_gui)
             self.is_running = False
@@ -183,6 +269,12 @@ class GeotechTestUI(ttk.Frame):
             self.soil_test_input_view.prevent_removal_last_crs_row()
 
         self.run_button.config(state="normal")
+        if hasattr(self, "series_button"):
+            self.series_button.config(state="normal")
+        if hasattr(self, "cancel_button"):
+            self.cancel_button.config(state="disabled")
+        if hasattr(self, "progress_label"):
+            self.progress_label.config(text="")
 
         if hasattr(self, "scrollbar") and hasattr(self, "_original_scroll_cmd"):
             self.scrollbar.config(command=self._original_scroll_cmd)
@@ -2,6 +2,15 @@
 # This is a prototype version
 # Contact kratos@deltares.nl
 
+from kratos_element_test.model.models import (  # noqa: F401
+    CRS,
+    DIRECT_SHEAR,
+    TEST_NAME_TO_TYPE,
+    TRIAXIAL,
+    TYPE_TO_TEST_NAME,
+    VALID_DRAINAGE_TYPES,
+    VALID_TEST_TYPES,
+)
 
 # -----------------------UI labels---------------------------
 
@@ -10,23 +19,7 @@ APP_TITLE = "Deltares Soil Element Test Suite"
 APP_VERSION = "Version 0.6.0 ~ Alpha Release"
 APP_NAME = "SoilElementSuite"
 APP_AUTHOR = "Deltares"
-
-# General test types
-TRIAXIAL = "Triaxial"
-DIRECT_SHEAR = "Direct Simple Shear"
-CRS = "CRS"
-
-TEST_NAME_TO_TYPE = {
-    TRIAXIAL: "triaxial",
-    DIRECT_SHEAR: "direct_shear",
-    CRS: "crs",
-}
-
-# Valid test types
-VALID_TEST_TYPES: tuple[str, ...] = tuple(TEST_NAME_TO_TYPE.values())
-
-# Valid drainage types
-VALID_DRAINAGE_TYPES: tuple[str, ...] = ("drained", "undrained")
+APP_USER_MODEL_ID = "deltares.ElementTestSuite.ui"
 
 # Test image files
 TEST_IMAGE_FILES = {
@@ -44,6 +37,9 @@ DURATION_LABEL = "Duration"
 STRAIN_INCREMENT_LABEL = "Strain inc."
 STEPS_LABEL = "steps"
 
+# Cell pressures proposed for a triaxial series
+DEFAULT_SERIES_CELL_PRESSURES = "50, 100, 200"
+
 # Units
 FL2_UNIT_LABEL = "kN/m²"
 SECONDS_UNIT_LABEL = "s"
@@ -62,8 +58,6 @@ KRATOS_NAME_TO_UI_NAME = {
 
 UI_NAME_TO_KRATOS_NAME = {v: k for k, v in KRATOS_NAME_TO_UI_NAME.items()}
 
-TYPE_TO_TEST_NAME = {v: k for k, v in TEST_NAME_TO_TYPE.items()}
-
 # Menu labels
 SELECT_UDSM = "Select UDSM File"
 LINEAR_ELASTIC = "Linear Elastic Model"
@@ -2,27 +2,100 @@
 # This is a prototype version
 # Contact kratos@deltares.nl
 
+import threading
+from collections import deque
+
+# Messages below the log level are not shown
+LOG_LEVELS = {"debug": 10, "info": 20, "warn": 30, "error": 40}
+LOG_PREFIXES = {
+    "debug": "[DEBUG]",
+    "info": "[INFO]",
+    "warn": "[WARN]",
+    "error": "[ERROR]",
+}
+LOG_COLORS = {"debug": "gray", "warn": "dark orange", "error": "red"}
+
+# The widget keeps the last lines only, and messages that arrive faster than
+# they are shown are dropped, oldest first
+MAX_LOG_LINES = 2000
+MAX_PENDING_MESSAGES = 5000
+DRAIN_INTERVAL_IN_MS = 100
+
 _log_widget = None
+_log_level = LOG_LEVELS["info"]
+_pending = deque(maxlen=MAX_PENDING_MESSAGES)
+_pending_lock = threading.Lock()
+_number_of_dropped_messages = 0
 
 
 def init_log_widget(widget):
+    """
+    Shows the log messages in `widget` from now on. The messages of all
+    threads are queued and the Tk main loop adds them to the widget in
+    batches.
+    """
     global _log_widget
     _log_widget = widget
+    for level, color in LOG_COLORS.items():
+        widget.tag_configure(level, foreground=color)
+    widget.after(DRAIN_INTERVAL_IN_MS, _drain, widget)
+
+
+def set_log_level(level):
+    global _log_level
+    _log_level = LOG_LEVELS[level]
 
 
 def log_message(msg, level="info"):
+    """
+    Logs a message. Can be called from any thread.
+    """
+    global _number_of_dropped_messages
+    if LOG_LEVELS.get(level, LOG_LEVELS["info"]) < _log_level:
+        return
     if _log_widget is None:
         print(f"{level.upper()}: {msg}")
         return
 
-    _log_widget.config(state="normal")
-    prefix = {"info": "[INFO]", "error": "[ERROR]", "warn": "[WARN]"}
-    _log_widget.insert("end", f"{prefix.get(level, '[INFO]')} {msg}\n")
-    _log_widget.see("end")
-    _log_widget.config(state="normal")
+    with _pending_lock:
+        if len(_pending) == _pending.maxlen:
+            _number_of_dropped_messages += 1
+        _pending.append((level, msg))
+
+
+def _take_pending():
+    global _number_of_dropped_messages
+    with _pending_lock:
+        messages = list(_pending)
+        _pending.clear()
+        dropped, _number_of_dropped_messages = _number_of_dropped_messages, 0
+    if dropped:
+        messages.insert(0, ("warn", f"{dropped} log message(s) were dropped."))
+    return messages
+
+
+def _drain(widget):
+    # A widget that was replaced or destroyed stops draining
+    if widget is not _log_widget or not widget.winfo_exists():
+        return
+
+    messages = _take_pending()
+    if messages:
+        widget.config(state="normal")
+        for level, msg in messages:
+            prefix = LOG_PREFIXES.get(level, LOG_PREFIXES["info"])
+            widget.insert("end", f"{prefix} {msg}\n", level)
+
+        number_of_lines = int(widget.index("end-1c").split(".")[0]) - 1
+        if number_of_lines > MAX_LOG_LINES:
+            widget.delete("1.0", f"{number_of_lines - MAX_LOG_LINES + 1}.0")
+        widget.see("end")
+
+    widget.after(DRAIN_INTERVAL_IN_MS, _drain, widget)
 
 
 def clear_log():
+    _take_pending()
     if _log_widget is not None:
         _log_widget.config(state="normal")
         _log_widget.delete("1.0", "end")
@@ -2,16 +2,14 @@
 # This is a prototype version
 # Contact kratos@deltares.nl
 
-import ctypes
 import os
 import tkinter as tk
 from pathlib import Path
-from tkinter import filedialog, messagebox, ttk, scrolledtext, Menu
+from tkinter import filedialog, messagebox, simpledialog, ttk, scrolledtext, Menu
 
 from platformdirs import user_data_dir
 
 from kratos_element_test.controller.element_test_controller import ElementTestController
-from kratos_element_test.view.ui_builder import GeotechTestUI
 from kratos_element_test.view.ui_constants import (
     APP_TITLE,
     APP_VERSION,
@@ -26,10 +24,6 @@ from kratos_element_test.view.ui_constants import (
 from kratos_element_test.view.ui_logger import log_message
 from kratos_element_test.view.ui_utils import asset_path, soil_models_dir
 
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
-    "deltares.ElementTestSuite.ui"
-)
-
 data_dir = Path(user_data_dir(APP_NAME, APP_AUTHOR))
 data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -178,6 +172,8 @@ class MainUI:
         root.config(menu=menubar)
 
         file_menu = Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Run Timeout...", command=self._set_run_timeout)
+        file_menu.add_separator()
         file_menu.add_command(label="Exit", command=lambda: root.quit())
         menubar.add_cascade(label="File", menu=file_menu)
 
@@ -185,6 +181,9 @@ class MainUI:
         export_menu.add_command(
             label="Export Results (Excel)", command=self._export_latest_results
         )
+        export_menu.add_command(
+            label="Export Results (NPZ/Parquet)", command=self._save_latest_results
+        )
         menubar.add_cascade(label="Export", menu=export_menu)
 
         import_menu = Menu(menubar, tearoff=0)
@@ -248,48 +247,19 @@ class MainUI:
                 model_source_var.set(last_model_source)
                 return
             last_model_source = SELECT_UDSM
-
-            if self.main_frame:
-                for widget in self.main_frame.winfo_children():
-                    widget.destroy()
-                self.main_frame.destroy()
-            self.main_frame = GeotechTestUI(
-                root,
-                controller=self._controller,
-                external_widgets=[model_source_menu],
-            )
+            self._show_test_ui(root, external_widgets=[model_source_menu])
 
         def load_linear_elastic():
             self._controller.set_material_type("linear_elastic")
             nonlocal last_model_source
             last_model_source = LINEAR_ELASTIC
-
-            if self.main_frame:
-                for widget in self.main_frame.winfo_children():
-                    widget.destroy()
-                self.main_frame.destroy()
-
-            self.main_frame = GeotechTestUI(
-                root,
-                controller=self._controller,
-                external_widgets=[model_source_menu],
-            )
+            self._show_test_ui(root, external_widgets=[model_source_menu])
 
         def load_mohr_coulomb():
             self._controller.set_material_type("mohr_coulomb")
             nonlocal last_model_source
             last_model_source = MOHR_COULOMB
-
-            if self.main_frame:
-                for widget in self.main_frame.winfo_children():
-                    widget.destroy()
-                self.main_frame.destroy()
-
-            self.main_frame = GeotechTestUI(
-                root,
-                controller=self._controller,
-                external_widgets=[model_source_menu],
-            )
+            self._show_test_ui(root, external_widgets=[model_source_menu])
 
         def handle_model_source_selection(event):
             choice = model_source_var.get()
@@ -311,6 +281,7 @@ class MainUI:
         model_source_menu.pack(side="left", padx=5)
 
         def on_close():
+            self._controller.shutdown()
             root.quit()
             root.destroy()
             os._exit(0)
@@ -318,12 +289,59 @@ class MainUI:
         root.protocol("WM_DELETE_WINDOW", on_close)
         root.mainloop()
 
+    def _show_test_ui(self, root, external_widgets):
+        # Imported here, so matplotlib is only loaded when the first test is shown
+        from kratos_element_test.view.ui_builder import GeotechTestUI
+
+        if self.main_frame:
+            for widget in self.main_frame.winfo_children():
+                widget.destroy()
+            self.main_frame.destroy()
+
+        self.main_frame = GeotechTestUI(
+            root,
+            controller=self._controller,
+            external_widgets=external_widgets,
+        )
+
+    def _set_run_timeout(self):
+        timeout = simpledialog.askfloat(
+            "Run Timeout",
+            "Stop calculations after [s] (0 for no timeout):",
+            initialvalue=self._controller.get_timeout_in_seconds() or 0.0,
+            minvalue=0.0,
+        )
+        if timeout is None:
+            return
+        self._controller.set_timeout_in_seconds(timeout or None)
+        log_message(
+            (
+                f"Calculations are stopped after {timeout:g} s."
+                if timeout
+                else "Calculations run until they finish."
+            ),
+            "info",
+        )
+
     def _export_latest_results(self):
         try:
             self._controller.export_latest_results()
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export Excel file.\n\n{e}")
 
+    def _save_latest_results(self):
+        path = filedialog.asksaveasfilename(
+            title="Save Results",
+            defaultextension=".npz",
+            filetypes=[("NumPy Archive", "*.npz"), ("Parquet", "*.parquet")],
+        )
+        if not path:
+            return
+        try:
+            self._controller.save_latest_results(Path(path))
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to save results.\n\n{e}")
+
     def _import_lab_results(self):
         try:
             py_path = filedialog.askopenfilename(
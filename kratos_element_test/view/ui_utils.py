@@ -2,8 +2,20 @@
 # This is a prototype version
 # Contact kratos@deltares.nl
 
+import ctypes
 from pathlib import Path
 
+from kratos_element_test.view.ui_constants import APP_USER_MODEL_ID
+
+
+def set_app_user_model_id() -> None:
+    """
+    Sets the AppUserModelID of the process, so Windows groups its windows
+    under the icon of the application instead of that of Python. It needs to
+    be set before the first window is created.
+    """
+    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(APP_USER_MODEL_ID)
+
 
 def asset_path(name: str) -> str:
     """